@@ -6,6 +6,7 @@ Yazar: Hand Mouse Projesi
 Tarih: 2025
 """
 
+import argparse
 import cv2
 import time
 import sys
@@ -13,6 +14,11 @@ import threading
 from pathlib import Path
 from typing import List, Tuple
 
+# Görüntüsüz modda stdout sadece telemetri JSON satırları içindir: tüm loglar
+# (modüllerin import sırasındaki uyarıları dahil) stderr'e yönlendirilir
+if __name__ == "__main__" and '--headless' in sys.argv[1:]:
+    sys.stdout = sys.stderr
+
 # Proje modüllerini import et
 sys.path.append(str(Path(__file__).parent / 'src'))
 
@@ -23,6 +29,13 @@ from src.volume_controller import VolumeController
 from src.overlay_display import OverlayDisplay
 from src.speech_to_text import SpeechToText
 from src.config import Config
+from src.frame_source import open_source
+from src.frame_clock import FrameClock
+from src.input_backend import BACKENDS, create_input_backend
+from src.telemetry import TelemetryWriter
+from src.annotations import CachedLayer, DisplayList
+from src.live_settings import LiveSettings
+from src.settings_service import get_settings_service
 
 
 class HandMouseApp:
@@ -31,25 +44,49 @@ class HandMouseApp:
     Tüm modülleri koordine eder ve ana döngüyü yönetir.
     """
     
-    def __init__(self):
-        """Uygulamayı başlatır ve modülleri yapılandırır."""
+    def __init__(self,
+                 source: str = None,
+                 realtime: bool = True,
+                 loop: bool = False,
+                 headless: bool = False,
+                 telemetry: str = None,
+                 input_backend: str = None):
+        """
+        Uygulamayı başlatır ve modülleri yapılandırır.
+        
+        Args:
+            source: Görüntü kaynağı (None = Config kamerası; bkz. frame_source.open_source)
+            realtime: Dosya / sentetik kaynakları gerçek zamanlı oynat
+            loop: Dosya / klasör kaynağı bitince başa dön
+            headless: True ise pencere, overlay ve çizim yok (ekransız makineler için)
+            telemetry: Telemetri çıktısı ('-' = stdout, dosya yolu; headless'ta varsayılan stdout)
+            input_backend: Mouse arka ucu (None = Config.INPUT_BACKEND, CI için 'recording')
+        """
+        self.headless = headless
         print("=" * 60)
         print("🖐️  HAND MOUSE CONTROLLER")
         print("=" * 60)
         
-        # Kamerayı başlat
-        self.camera = cv2.VideoCapture(Config.CAMERA_INDEX)
-        self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, Config.CAMERA_WIDTH)
-        self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, Config.CAMERA_HEIGHT)
-        self.camera.set(cv2.CAP_PROP_FPS, Config.CAMERA_FPS)  # FPS ayarla
-        self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Buffer küçült (gecikme azalır)
+        # Görüntü kaynağını başlat (kamera: kayıtlı / ölçülen en hızlı backend + piksel formatı ile)
+        try:
+            self.camera = open_source(source, Config.CAMERA_INDEX, Config.CAMERA_WIDTH,
+                                      Config.CAMERA_HEIGHT, Config.CAMERA_FPS,
+                                      realtime=realtime, loop=loop,
+                                      negotiate=Config.CAMERA_NEGOTIATE)
+        except ValueError as e:
+            print(f"❌ HATA: {e}")
+            sys.exit(1)
         
         if not self.camera.isOpened():
-            print("❌ HATA: Kamera açılamadı!")
+            print("❌ HATA: Görüntü kaynağı açılamadı!")
             sys.exit(1)
         
-        print(f"📷 Kamera başlatıldı (ID: {Config.CAMERA_INDEX})")
-        print(f"   Hedef FPS: {Config.CAMERA_FPS}")
+        print(f"📷 Görüntü kaynağı başlatıldı ({source or f'Kamera {Config.CAMERA_INDEX}'})")
+        print(f"   FPS: {self.camera.fps}")
+        
+        # Frame yakalama zamanı + bayat frame atma (kameranın ölçülen hızı ve kuyruk derinliği ile)
+        self.frame_clock = FrameClock(fps=self.camera.fps, max_age_ms=Config.FRAME_MAX_AGE_MS,
+                                      queue_frames=getattr(self.camera, 'queue_frames', 1))
         
         # Modülleri başlat
         self.hand_detector = HandDetector(
@@ -62,7 +99,8 @@ class HandMouseApp:
             camera_width=Config.CAMERA_WIDTH,
             camera_height=Config.CAMERA_HEIGHT,
             smoothing_factor=Config.MOUSE_SMOOTHING,
-            speed_multiplier=Config.MOUSE_SPEED
+            speed_multiplier=Config.MOUSE_SPEED,
+            backend=create_input_backend(input_backend) if input_backend else None
         )
         
         self.gesture_recognizer = GestureRecognizer(
@@ -85,12 +123,39 @@ class HandMouseApp:
                 print("⚠️  Sesli yazma kullanılamıyor - devam ediliyor...")
                 self.speech_to_text = None
         
-        # Overlay Display (monitör üzerinde durum gösterimi)
-        self.overlay = OverlayDisplay(position='topright')
+        # settings.json izleme: değişen canlı ayarlar bir sonraki frame'de uygulanır
+        self.settings_service = get_settings_service()
+        self.live_settings = LiveSettings(self.settings_service.values)
+        self.live_settings.attach([
+            (MouseController.SETTINGS_KEYS, self.mouse_controller.apply_settings),
+            (HandDetector.SETTINGS_KEYS, self.hand_detector.apply_settings),
+            (GestureRecognizer.SETTINGS_KEYS, self.gesture_recognizer.apply_settings),
+            (VolumeController.SETTINGS_KEYS, self.volume_controller.apply_settings),
+            (FrameClock.SETTINGS_KEYS, self.frame_clock.apply_settings),
+        ])
+        self.settings_service.add_listener(self._on_settings_changed)
+        self.settings_service.start_watching()
+        
+        # Overlay Display (monitör üzerinde durum gösterimi, görüntüsüz modda yok)
+        self.overlay = None
+        if not headless:
+            self.overlay = OverlayDisplay(position='topright', max_rate=Config.OVERLAY_MAX_FPS,
+                                          renderer=Config.OVERLAY_RENDERER)
+        
+        # Telemetri (görüntüsüz modda varsayılan olarak stdout'a JSON satırları, loglar stderr'de)
+        if telemetry is None and headless:
+            telemetry = '-'
+        self.telemetry = TelemetryWriter(telemetry) if telemetry else None
+        
+        # Önizleme çizim katmanları (frame'e sadece gösterilirken işlenir)
+        # (dead zone katmanı kırpma / çözünürlük değişince maskeye bir kez çizilir)
+        self.static_layer = CachedLayer(lambda w, h, crop: self._build_static_layer(w, h, crop).to_mask(w, h))
+        self.status_layer = DisplayList()
         
         # FPS hesaplama değişkenleri
         self.prev_time = 0
         self.fps = 0
+        self.frame_latency = 0.0
         
         # Uygulama durumu
         self.running = True
@@ -196,8 +261,9 @@ class HandMouseApp:
         print()
         
         # Overlay'i başlat (monitör üzerinde durum gösterimi)
-        self.overlay.start()
-        time.sleep(0.5)  # Overlay penceresinin açılması için kısa bekleme
+        if self.overlay:
+            self.overlay.start()
+            time.sleep(0.5)  # Overlay penceresinin açılması için kısa bekleme
     
     def calculate_fps(self) -> int:
         """
@@ -211,42 +277,66 @@ class HandMouseApp:
         self.prev_time = current_time
         return int(fps)
     
-    def draw_ui_elements(self, frame: cv2.Mat):
+    def draw_ui_elements(self, frame: cv2.Mat) -> cv2.Mat:
         """
-        Görüntü üzerine UI elementleri çizer.
+        Önizleme gösterilmeden hemen önce tüm çizimleri frame'e işler:
+        el çizimleri (HandDetector), sabit katman (aktif alan) ve durum metinleri.
         
         Args:
-            frame: Çizim yapılacak görüntü
+            frame: Gösterilecek görüntü (yerinde değişir)
+            
+        Returns:
+            Çizilmiş görüntü
         """
-        h, w, _ = frame.shape
+        h, w = frame.shape[:2]
+        self.hand_detector.annotations.render(frame)
+        self.static_layer.get(w, h, self.mouse_controller.frame_config.crop).render(frame)
+        self._annotate_status(w, h).render(frame)
+        return frame
+    
+    def _build_static_layer(self, w: int, h: int, crop) -> DisplayList:
+        """
+        Sadece boyut / kırpma değişince değişen çizimler (bir kez kurulur).
         
-        # Aktif alanı çiz (yeşil dikdörtgen)
-        active_left = int(w * Config.CAMERA_CROP_LEFT)
-        active_right = int(w * (1 - Config.CAMERA_CROP_RIGHT))
-        active_top = int(h * Config.CAMERA_CROP_TOP)
-        active_bottom = int(h * (1 - Config.CAMERA_CROP_BOTTOM))
+        Args:
+            w, h: Görüntü boyutu
+            crop: (sol, sağ, üst, alt) kırpma oranları
+            
+        Returns:
+            Aktif alan çerçevesi ve etiketi
+        """
+        layer = DisplayList()
+        active_left, active_top, active_right, active_bottom = \
+            self.mouse_controller.frame_config.crop_rect(w, h)
         
-        # Aktif alan çerçevesi (yarı saydam yeşil)
-        cv2.rectangle(frame, (active_left, active_top), (active_right, active_bottom), 
-                     (0, 255, 0), 2)
+        # Aktif alan çerçevesi (yeşil)
+        layer.rect((active_left, active_top), (active_right, active_bottom), (0, 255, 0), 2)
         
         # Köşelerde "Aktif Alan" yazısı
-        cv2.putText(frame, "Aktif Alan", (active_left + 5, active_top + 20), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+        layer.text("Aktif Alan", (active_left + 5, active_top + 20), 0.5, (0, 255, 0), 1)
+        return layer
+    
+    def _annotate_status(self, w: int, h: int) -> DisplayList:
+        """
+        Her frame değişebilen durum çizimlerini kaydeder (FPS, el durumu, jest, pause).
+        
+        Args:
+            w, h: Görüntü boyutu
+            
+        Returns:
+            Bu frame'in durum katmanı (yeniden kullanılan liste)
+        """
+        layer = self.status_layer
+        layer.clear()
         
         # FPS göster
         if Config.SHOW_FPS:
-            fps_text = f"FPS: {self.fps}"
-            cv2.putText(frame, fps_text, (10, 30), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, 
-                       Config.COLOR_FPS_TEXT, 2)
+            layer.text(f"FPS: {self.fps}", (10, 30), 0.7, Config.COLOR_FPS_TEXT, 2)
         
         # GLOBAL PAUSE DURUMU (Ekranın ortasında büyük uyarı)
         if self.global_paused:
-            # Yarı saydam kırmızı arka plan
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 100), -1)
-            frame = cv2.addWeighted(overlay, 0.3, frame, 0.7, 0)
+            # Yarı saydam kırmızı örtü
+            layer.tint((0, 0, 100), 0.3)
             
             # Büyük uyarı metni
             pause_text = "GLOBAL PAUSE"
@@ -255,22 +345,19 @@ class HandMouseApp:
             text_y = h // 2
             
             # Beyaz arka plan
-            cv2.rectangle(frame, 
-                         (text_x - 20, text_y - text_size[1] - 20),
-                         (text_x + text_size[0] + 20, text_y + 20),
-                         (255, 255, 255), -1)
+            layer.rect((text_x - 20, text_y - text_size[1] - 20),
+                       (text_x + text_size[0] + 20, text_y + 20),
+                       (255, 255, 255), -1)
             
             # Kırmızı metin (kalın yapmak için thickness=4)
-            cv2.putText(frame, pause_text, (text_x, text_y), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 255), 4)
+            layer.text(pause_text, (text_x, text_y), 2, (0, 0, 255), 4)
             
             # Alt mesaj
             resume_text = "Tekrar isaret parmaklarini birlestir"
             text_size2 = cv2.getTextSize(resume_text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
             text_x2 = (w - text_size2[0]) // 2
             text_y2 = text_y + 50
-            cv2.putText(frame, resume_text, (text_x2, text_y2), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+            layer.text(resume_text, (text_x2, text_y2), 0.7, (255, 255, 255), 2)
         
         # SAĞ EL DURUMU (Üst - Sağda)
         right_hand_idx = self.hand_detector.get_hand_by_label("Right")
@@ -290,8 +377,7 @@ class HandMouseApp:
             right_color = (0, 0, 255)  # Kırmızı
         
         # Sağ el durumunu sağ üstte göster
-        cv2.putText(frame, right_status, (w - 280, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, right_color, 2)
+        layer.text(right_status, (w - 280, 30), 0.6, right_color, 2)
         
         # SOL EL DURUMU (Üst - Sağda, ikinci satır)
         left_hand_idx = self.hand_detector.get_hand_by_label("Left")
@@ -311,8 +397,7 @@ class HandMouseApp:
             left_color = (0, 0, 255)  # Kırmızı
         
         # Sol el durumunu sağ üstte göster (ikinci satır)
-        cv2.putText(frame, left_status, (w - 280, 60), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, left_color, 2)
+        layer.text(left_status, (w - 280, 60), 0.6, left_color, 2)
         
         # Genel durum (Alt - Solda)
         if self.hand_detector.is_hand_present():
@@ -323,21 +408,16 @@ class HandMouseApp:
             status_text = "El Bekleniyor..."
             color = Config.COLOR_STATUS_TEXT
         
-        cv2.putText(frame, status_text, (10, h - 20), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, 
-                   color, 2)
+        layer.text(status_text, (10, h - 20), 0.6, color, 2)
         
         # Jest göster
         if Config.SHOW_GESTURE_TEXT and self.hand_detector.is_hand_present():
             gesture_name = self.gesture_recognizer.get_current_gesture_name()
-            cv2.putText(frame, f"Jest: {gesture_name}", (10, 60), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, 
-                       Config.COLOR_GESTURE_TEXT, 2)
+            layer.text(f"Jest: {gesture_name}", (10, 60), 0.6, Config.COLOR_GESTURE_TEXT, 2)
         
         # Çıkış talimatı
-        cv2.putText(frame, "'q' - Cikis", (w - 120, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, 
-                   (255, 255, 255), 1)
+        layer.text("'q' - Cikis", (w - 120, 30), 0.5, (255, 255, 255), 1)
+        return layer
     
     def process_frame(self, frame: cv2.Mat) -> cv2.Mat:
         """
@@ -349,15 +429,24 @@ class HandMouseApp:
         Returns:
             İşlenmiş görüntü (çizimlerle birlikte)
         """
+        frame_start = time.perf_counter()
+        
+        # settings.json'da yeni ayar yayınlandıysa farkları bu frame'den önce uygula
+        self.live_settings.apply_pending()
+        
         # Görüntüyü çevir (ayna etkisi için)
         if Config.FLIP_CAMERA:
             frame = cv2.flip(frame, 1)
         
         # Görüntü boyutunu güncelle
         self.hand_detector.update_image_shape(frame)
+        self.mouse_controller.set_camera_size(frame.shape[1], frame.shape[0])
         
         # El algıla ve çiz
-        frame = self.hand_detector.find_hands(frame, draw=Config.SHOW_LANDMARKS)
+        frame = self.hand_detector.find_hands(frame, draw=Config.SHOW_LANDMARKS and not self.headless)
+        
+        # Bu frame'in mouse olaylarını topla (sonda tek seferde gönderilir)
+        self.mouse_controller.begin_frame()
         
         # El var mı kontrol et
         if self.hand_detector.is_hand_present():
@@ -424,8 +513,26 @@ class HandMouseApp:
             if self.hand_was_present:
                 self.hand_was_present = False
         
+        # Biriken mouse olaylarını gönder
+        self.mouse_controller.end_frame()
+        
+        # Frame işleme gecikmesi (ms)
+        self.frame_latency = (time.perf_counter() - frame_start) * 1000
+        
         # OVERLAY'İ GÜNCELLE
-        self._update_overlay()
+        if self.overlay:
+            self._update_overlay()
+        
+        # Telemetri kaydı
+        if self.telemetry:
+            self.telemetry.record(
+                self.frame_latency,
+                self.frame_clock.last_age_ms,
+                dropped=self.frame_clock.dropped,
+                hands=self.hand_detector.get_hand_count(),
+                gesture=self.gesture_recognizer.get_current_gesture_name(),
+                paused=self.global_paused
+            )
         
         return frame
     
@@ -676,8 +783,64 @@ class HandMouseApp:
     
     def run(self):
         """Ana uygulama döngüsü."""
-        # Kamera penceresini ayarla
         window_name = 'Hand Mouse Controller'
+        if not self.headless:
+            self._setup_preview_window(window_name)
+        
+        try:
+            while self.running:
+                # Frame oku (yakalama zamanıyla)
+                success, frame = self.frame_clock.read(self.camera)
+                
+                if not success:
+                    print("⚠️  Görüntü kaynağından frame alınamadı (kaynak bitti veya kamera koptu)")
+                    break
+                
+                # Bayat frame: el algılamaya sokmadan sıradakini oku
+                if self.frame_clock.should_drop():
+                    continue
+                
+                # FPS hesapla
+                self.fps = self.calculate_fps()
+                
+                # Frame'i işle
+                frame = self.process_frame(frame)
+                
+                # Görüntüsüz mod: çizim / pencere yok (çıkış Ctrl+C veya kaynak sonu)
+                if self.headless:
+                    continue
+                
+                # Kayıtlı çizimleri sadece gösterilecek frame'e işle
+                frame = self.draw_ui_elements(frame)
+                
+                # Görüntüyü göster
+                cv2.imshow(window_name, frame)
+                
+                # Klavye kontrolü
+                key = cv2.waitKey(1) & 0xFF
+                if key == ord('q'):
+                    print("\n👋 Çıkış yapılıyor...")
+                    self.running = False
+                elif key == ord(' '):
+                    # Space tuşu ile duraklatma/devam (gelecek özellik)
+                    pass
+        
+        except KeyboardInterrupt:
+            print("\n⚠️  Program kullanıcı tarafından durduruldu")
+        
+        except Exception as e:
+            print(f"\n❌ HATA: {str(e)}")
+        
+        finally:
+            self.cleanup()
+    
+    def _setup_preview_window(self, window_name: str):
+        """
+        Kamera önizleme penceresini oluşturur ve konumlandırır.
+        
+        Args:
+            window_name: OpenCV pencere adı
+        """
         cv2.namedWindow(window_name, cv2.WINDOW_NORMAL)
         
         # Kamera pencere boyutunu küçült (640x480 -> 320x240)
@@ -724,45 +887,6 @@ class HandMouseApp:
                     print(f"📺 Kamera penceresi ayarlandı: {camera_display_width}x{camera_display_height}, Alt-Orta, Şeffaf")
             except Exception as e:
                 print(f"⚠️  Pencere ayarları uygulanamadı: {e}")
-        
-        try:
-            while self.running:
-                # Frame oku
-                success, frame = self.camera.read()
-                
-                if not success:
-                    print("⚠️  Kameradan görüntü alınamadı!")
-                    break
-                
-                # FPS hesapla
-                self.fps = self.calculate_fps()
-                
-                # Frame'i işle
-                frame = self.process_frame(frame)
-                
-                # UI elementlerini çiz
-                self.draw_ui_elements(frame)
-                
-                # Görüntüyü göster
-                cv2.imshow(window_name, frame)
-                
-                # Klavye kontrolü
-                key = cv2.waitKey(1) & 0xFF
-                if key == ord('q'):
-                    print("\n👋 Çıkış yapılıyor...")
-                    self.running = False
-                elif key == ord(' '):
-                    # Space tuşu ile duraklatma/devam (gelecek özellik)
-                    pass
-        
-        except KeyboardInterrupt:
-            print("\n⚠️  Program kullanıcı tarafından durduruldu")
-        
-        except Exception as e:
-            print(f"\n❌ HATA: {str(e)}")
-        
-        finally:
-            self.cleanup()
     
     def _update_overlay(self):
         """Overlay display'i günceller."""
@@ -804,6 +928,9 @@ class HandMouseApp:
         # Overlay'i güncelle
         self.overlay.update(
             fps=self.fps,
+            latency=round(self.frame_latency, 1),
+            frame_age=round(self.frame_clock.last_age_ms),
+            dropped=self.frame_clock.dropped,
             right_hand=right_status,
             right_hand_color=right_color,
             left_hand=left_status,
@@ -813,9 +940,25 @@ class HandMouseApp:
             speech_active=self.speech_to_text.is_continuous_active() if self.speech_to_text else False
         )
     
+    def _on_settings_changed(self, report):
+        """
+        settings.json değişti (izleme thread'i).
+        Görsel ayarlar Config'e yazılır, bileşen ayarları sürüm olarak yayınlanır.
+        
+        Args:
+            report: Doğrulanmış fark raporu (SettingsReport)
+        """
+        hot = report.hot
+        for key, value in hot.items():
+            setattr(Config, key, value)
+        self.live_settings.publish(hot)
+        if report.cold:
+            print(f"⚠️ Yeniden başlatınca uygulanacak: {', '.join(report.cold)}")
+    
     def cleanup(self):
         """Kaynakları temizle ve kapat."""
         print("\n🧹 Kaynaklar temizleniyor...")
+        self.settings_service.stop_watching()
         
         # Sesli yazmayı kapat
         if hasattr(self, 'speech_to_text') and self.speech_to_text:
@@ -824,8 +967,15 @@ class HandMouseApp:
             except Exception as e:
                 print(f"⚠️  Sesli yazma kapatma hatası: {e}")
         
+        # Telemetrinin son aralığını yaz
+        if getattr(self, 'telemetry', None):
+            try:
+                self.telemetry.close()
+            except Exception as e:
+                print(f"⚠️  Telemetri kapatma hatası: {e}")
+        
         # Overlay'i kapat ve thread'in bitmesini bekle
-        if hasattr(self, 'overlay'):
+        if getattr(self, 'overlay', None):
             try:
                 self.overlay.stop()
                 # Overlay thread'inin kapanması için kısa bekleme
@@ -833,6 +983,13 @@ class HandMouseApp:
             except Exception as e:
                 print(f"⚠️  Overlay kapatma hatası: {e}")
         
+        # Input arka ucunu kapat (Linux'ta sanal uinput cihazı)
+        if hasattr(self, 'mouse_controller'):
+            try:
+                self.mouse_controller.close()
+            except Exception as e:
+                print(f"⚠️  Input backend kapatma hatası: {e}")
+        
         # Kamerayı kapat
         if hasattr(self, 'camera'):
             try:
@@ -841,6 +998,9 @@ class HandMouseApp:
                 print(f"⚠️  Kamera kapatma hatası: {e}")
         
         # OpenCV pencerelerini kapat
+        if self.headless:
+            print("✅ Program sonlandırıldı")
+            return
         try:
             cv2.destroyAllWindows()
             # Pencerelerin kapanması için kısa bekleme
@@ -851,10 +1011,38 @@ class HandMouseApp:
         print("✅ Program sonlandırıldı")
 
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """Komut satırı argümanları."""
+    parser = argparse.ArgumentParser(description="Hand Mouse - konsol sürümü")
+    parser.add_argument(
+        '--source', default=None,
+        help="Görüntü kaynağı: kamera index'i, video dosyası, resim klasörü "
+             "veya 'synthetic[:frame_sayısı]' (varsayılan: Config.CAMERA_INDEX)")
+    parser.add_argument(
+        '--fast', action='store_true',
+        help="Dosya / sentetik kaynağı beklemeden, olabildiğince hızlı oynat (profilleme)")
+    parser.add_argument(
+        '--loop', action='store_true',
+        help="Video dosyası / resim klasörü bitince başa dön")
+    parser.add_argument(
+        '--headless', action='store_true',
+        help="Pencere / overlay / çizim olmadan çalış (telemetri varsayılan olarak stdout'a, loglar stderr'e)")
+    parser.add_argument(
+        '--telemetry', default=None, metavar='DOSYA',
+        help="Telemetri JSON satırlarını dosyaya yaz ('-' = stdout)")
+    parser.add_argument(
+        '--backend', default=None, choices=['auto'] + sorted(BACKENDS),
+        help="Mouse arka ucu (varsayılan: Config.INPUT_BACKEND; CI için 'recording')")
+    return parser.parse_args(argv)
+
+
 def main():
     """Ana giriş noktası."""
+    args = parse_args()
     try:
-        app = HandMouseApp()
+        app = HandMouseApp(source=args.source, realtime=not args.fast, loop=args.loop,
+                           headless=args.headless, telemetry=args.telemetry,
+                           input_backend=args.backend)
         app.run()
     except Exception as e:
         print(f"❌ Başlatma hatası: {str(e)}")
@@ -0,0 +1,236 @@
+"""
+Annotations Modülü
+Önizleme çizimleri için hafif görüntü listesi (display list).
+
+İşleme hattı frame'e doğrudan çizmez; parmak uçları, dikdörtgenler ve metinler
+komut olarak kaydedilir ve sadece önizleme gerçekten gösterileceği zaman tek
+geçişte çizilir. Önizleme kısılmışsa (hız sınırı) veya gizliyse hiç çizim
+yapılmaz. Sadece ayar / çözünürlük değişince değişen öğeler (dead zone
+dikdörtgeni, "EKRAN ALANI" etiketi) bir kez maskeye (OverlayMask) çizilir;
+her frame'de tek bir maskeli kopya ile görüntüye uygulanır ve
+kırpma oranı veya çözünürlük değişince CachedLayer ile yeniden oluşturulur.
+"""
+
+from typing import Callable, Hashable, List, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+
+Point = Tuple[int, int]
+Color = Tuple[int, int, int]
+
+
+class DisplayList:
+    """Sıralı çizim komutları (kaydedilir, render() ile çizilir)."""
+
+    def __init__(self):
+        """DisplayList sınıfını başlatır (boş liste)."""
+        self.ops: List[tuple] = []
+
+    def __len__(self) -> int:
+        """Kayıtlı komut sayısı."""
+        return len(self.ops)
+
+    def clear(self):
+        """Tüm komutları siler (frame başında)."""
+        self.ops.clear()
+
+    def circle(self, center: Point, radius: int, color: Color, thickness: int = -1):
+        """Daire (thickness=-1 dolu)."""
+        self.ops.append(('circle', center, radius, color, thickness))
+
+    def marker(self, center: Point, color: Color, marker_type: int = cv2.MARKER_CROSS,
+               size: int = 20, thickness: int = 1):
+        """OpenCV işaretçisi (haç vb.)."""
+        self.ops.append(('marker', center, color, marker_type, size, thickness))
+
+    def rect(self, top_left: Point, bottom_right: Point, color: Color, thickness: int = 1):
+        """Dikdörtgen (thickness=-1 dolu)."""
+        self.ops.append(('rect', top_left, bottom_right, color, thickness))
+
+    def text(self, text: str, origin: Point, scale: float, color: Color, thickness: int = 1,
+             font: int = cv2.FONT_HERSHEY_SIMPLEX):
+        """Metin (origin = sol alt köşe)."""
+        self.ops.append(('text', text, origin, font, scale, color, thickness))
+
+    def tint(self, color: Color, alpha: float):
+        """Tüm görüntüyü yarı saydam renkle örter."""
+        self.ops.append(('tint', color, alpha))
+
+    def extend(self, other: 'DisplayList'):
+        """Başka bir listenin komutlarını sona ekler."""
+        self.ops.extend(other.ops)
+
+    def render(self, image: np.ndarray) -> np.ndarray:
+        """
+        Komutları görüntüye sırayla çizer (görüntü yerinde değişir).
+
+        Args:
+            image: BGR görüntü
+
+        Returns:
+            Aynı görüntü
+        """
+        for op in self.ops:
+            kind = op[0]
+            if kind == 'circle':
+                cv2.circle(image, op[1], op[2], op[3], op[4])
+            elif kind == 'marker':
+                cv2.drawMarker(image, op[1], op[2], op[3], op[4], op[5])
+            elif kind == 'rect':
+                cv2.rectangle(image, op[1], op[2], op[3], op[4])
+            elif kind == 'text':
+                cv2.putText(image, op[1], op[2], op[3], op[4], op[5], op[6])
+            elif kind == 'tint':
+                layer = np.empty_like(image)
+                layer[:] = op[1]
+                cv2.addWeighted(layer, op[2], image, 1.0 - op[2], 0, dst=image)
+        return image
+
+    def to_mask(self, width: int, height: int) -> 'OverlayMask':
+        """
+        Komutları bir kez siyah ve beyaz tuvale çizip OverlayMask oluşturur.
+        İki sonuç arasındaki fark her pikselin kapsamasını (alfa) verir; böylece
+        kenar yumuşatmalı metin de doğrudan çizimle aynı sonucu üretir.
+
+        Args:
+            width, height: Hedef görüntü boyutu
+
+        Returns:
+            Her frame'de render() ile uygulanan OverlayMask
+        """
+        black = self.render(np.zeros((height, width, 3), dtype=np.uint8))
+        white = self.render(np.full((height, width, 3), 255, dtype=np.uint8))
+        return OverlayMask(black, white)
+
+
+class OverlayMask:
+    """
+    Önceden birleştirilmiş katman (renk + kapsama).
+    Sadece boyanmış alanı çevreleyen dikdörtgen (ROI) işlenir: tam opak pikseller
+    tek bir maskeli kopya (cv2.copyTo) ile yazılır, kenar yumuşatmalı yarı saydam
+    pikseller önceden hesaplanmış katsayılarla harmanlanır.
+    """
+
+    def __init__(self, black: np.ndarray, white: np.ndarray):
+        """
+        OverlayMask sınıfını başlatır.
+
+        Args:
+            black: Siyah tuvale çizilmiş katman (renk × alfa)
+            white: Aynı katmanın beyaz tuvale çizilmiş hali
+        """
+        self.shape = black.shape[:2]
+        # Piksel başına görüntüden kalan pay: 0 = opak, 255 = boş
+        keep = white.astype(np.int16) - black.astype(np.int16)
+        painted = np.nonzero((keep < 255).any(axis=2))
+        if len(painted[0]) == 0:
+            self.roi = None
+            return
+
+        # Boyanmış alanın sınırları: harmanlama sadece bu dikdörtgende yapılır
+        top, bottom = painted[0].min(), painted[0].max() + 1
+        left, right = painted[1].min(), painted[1].max() + 1
+        self.roi = (slice(top, bottom), slice(left, right))
+        keep = keep[self.roi]
+        color = black[self.roi]
+
+        # Opak pikseller: renk + 0/1 maske (cv2.copyTo için bitişik bellek)
+        self._color = np.ascontiguousarray(color)
+        self._opaque = np.ascontiguousarray((keep <= 0).all(axis=2).astype(np.uint8))
+
+        # Yarı saydam pikseller: çıktı = görüntü × kalan pay + önceden çarpılmış renk
+        # Tam görüntüdeki (satır, sütun) ve bitişik BGR bellekteki düz indisler
+        rows, cols = np.nonzero((keep < 255).any(axis=2) & (self._opaque == 0))
+        self._blend = (rows + top, cols + left)
+        self._blend_flat = ((self._blend[0] * black.shape[1] + self._blend[1])[:, None] * 3
+                            + np.arange(3)).ravel()
+        self._blend_keep = keep[rows, cols].clip(0, 255).astype(np.float32) / 255.0
+        self._blend_add = color[rows, cols].astype(np.float32) + 0.5  # +0.5: yuvarlama
+
+    def __len__(self) -> int:
+        """Boyanmış piksel sayısı."""
+        if self.roi is None:
+            return 0
+        return int(self._opaque.sum()) + len(self._blend[0])
+
+    def render(self, image: np.ndarray) -> np.ndarray:
+        """
+        Katmanı görüntüye uygular (görüntü yerinde değişir).
+
+        Args:
+            image: Maskeyle aynı boyutta BGR görüntü
+
+        Returns:
+            Aynı görüntü
+
+        Raises:
+            ValueError: Görüntü boyutu maskeyle uyuşmuyorsa
+        """
+        if image.shape[:2] != self.shape:
+            raise ValueError(f"Maske boyutu {self.shape}, görüntü {image.shape[:2]}")
+        if self.roi is None:
+            return image
+
+        if image.flags.c_contiguous:
+            cv2.copyTo(self._color, self._opaque, image[self.roi])
+            if len(self._blend_flat):
+                flat = image.reshape(-1)
+                mixed = flat.take(self._blend_flat) * self._blend_keep.ravel() + self._blend_add.ravel()
+                flat[self._blend_flat] = mixed.astype(np.uint8)
+        else:
+            # cv2'nin yazamadığı bellek düzeni (örn: atlamalı görünüm)
+            np.copyto(image[self.roi], self._color, where=self._opaque[..., None].astype(bool))
+            if len(self._blend[0]):
+                mixed = image[self._blend] * self._blend_keep + self._blend_add
+                image[self._blend] = mixed.astype(np.uint8)
+        return image
+
+
+class CachedLayer:
+    """
+    Nadiren değişen çizimler için önbellek.
+    Anahtar (örn: boyut + kırpma oranları) değişmedikçe katman yeniden kurulmaz.
+    """
+
+    def __init__(self, build: Callable[..., Union[DisplayList, OverlayMask]]):
+        """
+        CachedLayer sınıfını başlatır.
+
+        Args:
+            build: build(*key) → DisplayList veya OverlayMask (anahtar değişince çağrılır)
+        """
+        self.build = build
+        self._key: Optional[Hashable] = None
+        self._layer: Optional[Union[DisplayList, OverlayMask]] = None
+
+    def get(self, *key) -> Union[DisplayList, OverlayMask]:
+        """Anahtarın katmanı (değişmediyse önbellekten)."""
+        if self._layer is None or key != self._key:
+            self._layer = self.build(*key)
+            self._key = key
+        return self._layer
+
+    def invalidate(self):
+        """Bir sonraki get() listeyi yeniden kurar."""
+        self._layer = None
+
+
+def text_box(layer: DisplayList, text: str, origin: Point, scale: float, color: Color,
+             thickness: int = 1, background: Color = (0, 0, 0), padding: int = 5):
+    """
+    Dolu arka plan kutusu üzerine metin kaydeder (metin boyutu bir kez ölçülür).
+
+    Args:
+        layer: Hedef liste
+        text: Metin
+        origin: Metnin sol alt köşesi
+        scale, color, thickness: Metin stili
+        background: Kutu rengi
+        padding: Kutu kenar boşluğu
+    """
+    (width, height), _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+    x, y = origin
+    layer.rect((x - padding, y - height - padding), (x + width + padding, y + padding), background, -1)
+    layer.text(text, origin, scale, color, thickness)
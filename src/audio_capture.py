@@ -0,0 +1,277 @@
+"""
+Audio Capture Modülü
+Mikrofon başına tek bir kayıt akışı ve paylaşımlı int16 halka tamponu.
+
+Kayıt PyAudio callback'inde yapılır: gelen örnekler halka tampona kopyalanır
+ve bekleyen okuyucular uyandırılır. Callback hiçbir tüketiciyi beklemez;
+yavaş kalan tüketici en eski verinin üzerine yazıldığında ileri atlatılır.
+
+Tüketiciler (VAD, tanıma, seviye göstergesi, mikrofon testi) birer abonelik
+açar ve tampondan kopyasız numpy görünümleri (view) okur. Aynı mikrofonu
+kullanan tüm tüketiciler tek açık akışı paylaşır.
+"""
+
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    import speech_recognition as sr
+    HAS_SPEECH = True
+except ImportError:
+    HAS_SPEECH = False
+
+
+# Halka tampon süresi (saniye) - okunan görünümler bu süre boyunca geçerlidir
+RING_SECONDS = 10.0
+
+# PyAudio okuma parçası (örnek sayısı)
+CHUNK = 1024
+
+
+class AudioRingBuffer:
+    """
+    Sabit kapasiteli int16 halka tampon.
+    Konumlar mutlak örnek sayacıdır (total), tampon içi index = konum % kapasite.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        AudioRingBuffer sınıfını başlatır.
+
+        Args:
+            capacity: Örnek kapasitesi
+        """
+        self.capacity = int(capacity)
+        self.data = np.zeros(self.capacity, dtype=np.int16)
+        self.total = 0
+        self.cond = threading.Condition()
+
+    def write(self, samples: np.ndarray):
+        """
+        Örnekleri yazar (en eski veri ezilir) ve okuyucuları uyandırır.
+
+        Args:
+            samples: int16 örnekler
+        """
+        count = len(samples)
+        if count > self.capacity:
+            samples = samples[-self.capacity:]
+            skipped = count - self.capacity
+            count = self.capacity
+        else:
+            skipped = 0
+
+        start = (self.total + skipped) % self.capacity
+        first = min(count, self.capacity - start)
+        self.data[start:start + first] = samples[:first]
+        if first < count:
+            self.data[:count - first] = samples[first:]
+
+        with self.cond:
+            self.total += skipped + count
+            self.cond.notify_all()
+
+    def view(self, position: int, count: int) -> np.ndarray:
+        """
+        Mutlak konumdan başlayan kopyasız görünüm (tampon sonunda kesilir).
+
+        Args:
+            position: Mutlak başlangıç konumu
+            count: İstenen örnek sayısı
+
+        Returns:
+            int16 görünüm (en fazla tampon sonuna kadar)
+        """
+        start = position % self.capacity
+        end = min(start + count, self.capacity)
+        return self.data[start:end]
+
+
+class AudioSubscription:
+    """Halka tampondan kendi konumuyla okuyan tüketici."""
+
+    def __init__(self, service: 'AudioCaptureService', position: int):
+        self.service = service
+        self.position = position
+        self.overruns = 0
+
+    def read(self, max_samples: int = CHUNK, timeout: Optional[float] = 0.5) -> Optional[np.ndarray]:
+        """
+        Yeni örnekleri okur (yoksa timeout kadar bekler).
+
+        Args:
+            max_samples: En fazla okunacak örnek sayısı
+            timeout: Bekleme süresi (saniye, None = süresiz)
+
+        Returns:
+            int16 görünüm (kopyasız) veya None (timeout / akış kapalı)
+        """
+        ring = self.service.ring
+        with ring.cond:
+            if ring.total == self.position and self.service.running:
+                ring.cond.wait(timeout)
+            total = ring.total
+
+        if total == self.position:
+            return None
+
+        # Tüketici geride kaldı: ezilmiş veriyi atla
+        if total - self.position > ring.capacity - CHUNK:
+            self.position = total - ring.capacity + CHUNK
+            self.overruns += 1
+
+        samples = ring.view(self.position, min(total - self.position, max_samples))
+        self.position += len(samples)
+        return samples
+
+    def skip_to_latest(self):
+        """Birikmiş veriyi atlar (sadece bundan sonrası okunur)."""
+        self.position = self.service.ring.total
+
+    def close(self):
+        """Aboneliği kapatır (son abone çıkınca akış kapanır)."""
+        self.service.unsubscribe(self)
+
+
+class AudioCaptureService:
+    """
+    Tek mikrofon akışı + halka tampon.
+    İlk abonelikte açılır, son abonelik kapanınca kapanır.
+    """
+
+    def __init__(self, device_index: Optional[int] = None):
+        """
+        AudioCaptureService sınıfını başlatır (akış henüz açılmaz).
+
+        Args:
+            device_index: PyAudio cihaz index'i (None = varsayılan)
+        """
+        self.device_index = device_index
+        self.sample_rate = 16000
+        self.sample_width = 2
+        self.ring: Optional[AudioRingBuffer] = None
+        self.running = False
+
+        self._audio = None
+        self._stream = None
+        self._subscribers = []
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> AudioSubscription:
+        """
+        Yeni tüketici aboneliği açar (gerekirse mikrofonu açar).
+
+        Returns:
+            AudioSubscription nesnesi (şu andan sonraki sesi okur)
+        """
+        with self._lock:
+            if not self.running:
+                self._open()
+            subscription = AudioSubscription(self, self.ring.total)
+            self._subscribers.append(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription: AudioSubscription):
+        """Aboneliği kaldırır; abone kalmadıysa mikrofonu kapatır."""
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+            if not self._subscribers and self.running:
+                self._close()
+
+    def level(self, window: int = CHUNK) -> float:
+        """
+        Son window örneğin RMS seviyesi (seviye göstergesi için).
+
+        Returns:
+            RMS değeri (0 - 32768)
+        """
+        ring = self.ring
+        if ring is None or ring.total == 0:
+            return 0.0
+        count = min(window, ring.total)
+        start = ring.total - count
+        samples = ring.view(start, count).astype(np.float32)
+        return float(np.sqrt(np.mean(samples * samples))) if len(samples) else 0.0
+
+    def _open(self):
+        """PyAudio akışını callback modunda açar."""
+        if not HAS_SPEECH:
+            raise RuntimeError("speech_recognition / pyaudio yüklü değil")
+
+        pyaudio = sr.Microphone.get_pyaudio()
+        self._audio = pyaudio.PyAudio()
+        try:
+            if self.device_index is None:
+                info = self._audio.get_default_input_device_info()
+            else:
+                info = self._audio.get_device_info_by_index(self.device_index)
+            self.sample_rate = int(info.get('defaultSampleRate', 16000))
+
+            self.ring = AudioRingBuffer(int(self.sample_rate * RING_SECONDS))
+            self.running = True
+
+            def callback(in_data, frame_count, time_info, status):
+                # Sadece kopyala ve uyandır - tüketiciyi asla bekleme
+                self.ring.write(np.frombuffer(in_data, dtype=np.int16))
+                return (None, pyaudio.paContinue)
+
+            self._stream = self._audio.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=self.sample_rate,
+                input=True,
+                input_device_index=self.device_index,
+                frames_per_buffer=CHUNK,
+                stream_callback=callback
+            )
+            self._stream.start_stream()
+        except Exception:
+            self.running = False
+            self._audio.terminate()
+            self._audio = None
+            raise
+
+    def _close(self):
+        """Akışı kapatır ve bekleyen okuyucuları uyandırır."""
+        self.running = False
+        try:
+            if self._stream is not None:
+                self._stream.stop_stream()
+                self._stream.close()
+        except Exception:
+            pass
+        finally:
+            self._stream = None
+            if self._audio is not None:
+                self._audio.terminate()
+                self._audio = None
+
+        if self.ring is not None:
+            with self.ring.cond:
+                self.ring.cond.notify_all()
+
+
+# Mikrofon index'i → paylaşılan servis
+_SERVICES: Dict[Optional[int], AudioCaptureService] = {}
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_capture_service(device_index: Optional[int] = None) -> AudioCaptureService:
+    """
+    Mikrofonun paylaşılan kayıt servisini döndürür.
+
+    Args:
+        device_index: PyAudio cihaz index'i (None = varsayılan)
+
+    Returns:
+        AudioCaptureService nesnesi
+    """
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(device_index)
+        if service is None:
+            service = AudioCaptureService(device_index)
+            _SERVICES[device_index] = service
+        return service
@@ -0,0 +1,312 @@
+"""
+Camera Discovery Modülü
+Kamera listesini arka planda, paralel olarak tarar ve sonucu diske önbellekler.
+
+Her kamera index'i kendi thread'inde açılır; bazı backend'lerde olmayan bir
+index'i açmak saniyeler sürdüğü için her deneme bir süre sınırıyla beklenir ve
+süresi dolan deneme sonucu beklenmeden bırakılır. Desteklenen çözünürlük / FPS
+modları ve piksel formatı (FOURCC) de aynı denemede sorgulanır.
+
+Önbellek anahtarı "index | cihaz adı" çiftidir (isim alınabiliyorsa); GUI
+açılırken liste önbellekten anında doldurulur, tarama arkadan gelir.
+"""
+
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import cv2
+
+sys.path.append(str(Path(__file__).parent))
+from config_manager import ConfigManager
+
+# Windows: DirectShow cihaz isimleri (CAP_DSHOW index sırasıyla aynı)
+try:
+    from pygrabber.dshow_graph import FilterGraph
+    HAS_PYGRABBER = True
+except ImportError:
+    HAS_PYGRABBER = False
+
+
+# Sorgulanan modlar (genişlik, yükseklik, FPS)
+CANDIDATE_MODES = (
+    (640, 480, 30),
+    (640, 480, 60),
+    (1280, 720, 30),
+    (1280, 720, 60),
+    (1920, 1080, 30),
+)
+
+
+class CameraInfo(NamedTuple):
+    """Taranan tek bir kameranın bilgisi."""
+    index: int
+    name: str
+    key: str
+    backend: str = ''
+    width: int = 0
+    height: int = 0
+    fps: int = 0
+    fourcc: str = ''
+    modes: Tuple[Tuple[int, int, int], ...] = ()
+    checked: float = 0.0
+
+    @property
+    def label(self) -> str:
+        """Dropdown metni ("index: isim (genişlikxyükseklik@fps)")."""
+        return f"{self.index}: {self.name} ({self.width}x{self.height}@{self.fps}fps)"
+
+    def to_dict(self) -> dict:
+        """JSON'a yazılabilir kayıt."""
+        record = self._asdict()
+        record['modes'] = [list(mode) for mode in self.modes]
+        return record
+
+    @classmethod
+    def from_dict(cls, record: dict) -> 'CameraInfo':
+        """Önbellek kaydından CameraInfo."""
+        record = dict(record)
+        record['modes'] = tuple(tuple(mode) for mode in record.get('modes', ()))
+        return cls(**{key: record[key] for key in cls._fields if key in record})
+
+
+def decode_fourcc(value: float) -> str:
+    """CAP_PROP_FOURCC değerini 4 harfli koda çevirir (örn: 'MJPG')."""
+    code = int(value)
+    if code <= 0:
+        return ''
+    return ''.join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip('\x00 ')
+
+
+def device_names() -> Dict[int, str]:
+    """
+    İşletim sisteminden kamera isimleri (alınamazsa boş).
+
+    Returns:
+        {index: isim}
+    """
+    names = {}
+    try:
+        if platform.system() == 'Windows' and HAS_PYGRABBER:
+            names = dict(enumerate(FilterGraph().get_input_devices()))
+        elif platform.system() == 'Linux':
+            for entry in Path('/sys/class/video4linux').glob('video*'):
+                index = int(entry.name[len('video'):])
+                names[index] = (entry / 'name').read_text(encoding='utf-8').strip()
+    except Exception as e:
+        print(f"⚠️ Kamera isimleri alınamadı: {e}")
+    return names
+
+
+def probe_camera(index: int, name: str = '', query_modes: bool = True) -> Optional[CameraInfo]:
+    """
+    Tek bir kamerayı açar, özelliklerini ve desteklenen modları okur.
+
+    Args:
+        index: OpenCV kamera index'i
+        name: İşletim sisteminden alınan isim (boşsa "Kamera N")
+        query_modes: True ise CANDIDATE_MODES tek tek denenir
+
+    Returns:
+        CameraInfo veya None (kamera açılamadı)
+    """
+    cap = cv2.VideoCapture(index)
+    try:
+        if not cap.isOpened():
+            return None
+
+        backend = cap.getBackendName()
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        fps = int(cap.get(cv2.CAP_PROP_FPS))
+        fourcc = decode_fourcc(cap.get(cv2.CAP_PROP_FOURCC))
+
+        # Kamera isteği kabul etmezse en yakın değeri bildirir: geri okunan mod kaydedilir
+        modes = set()
+        if query_modes:
+            for mode_width, mode_height, mode_fps in CANDIDATE_MODES:
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode_width)
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode_height)
+                cap.set(cv2.CAP_PROP_FPS, mode_fps)
+                modes.add((int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                           int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                           int(cap.get(cv2.CAP_PROP_FPS))))
+
+        name = name or f"Kamera {index}"
+        return CameraInfo(index=index, name=name, key=f"{index}|{name}",
+                          backend=backend, width=width, height=height, fps=fps,
+                          fourcc=fourcc, modes=tuple(sorted(modes)), checked=time.time())
+    finally:
+        cap.release()
+
+
+class CameraDiscovery:
+    """
+    Kalıcı kamera listesi önbelleği + arka plan taraması.
+    cameras() hiç beklemez; refresh_async() tamamlanınca dinleyiciler çağrılır.
+    """
+
+    def __init__(self,
+                 cache_file: str = 'camera_cache.json',
+                 max_index: int = 10,
+                 probe_timeout: float = 4.0):
+        """
+        CameraDiscovery sınıfını başlatır (dosyadan yükler, taramaz).
+
+        Args:
+            cache_file: Önbellek dosyasının adı (ayar dosyasıyla aynı klasörde)
+            max_index: Taranacak index sayısı (0 .. max_index-1)
+            probe_timeout: Tek bir kamera denemesinin en fazla bekleneceği süre (saniye)
+        """
+        self.store = ConfigManager(cache_file)
+        self.max_index = max_index
+        self.probe_timeout = probe_timeout
+
+        data = self.store.load_settings()
+        self.entries: Dict[str, CameraInfo] = {}
+        for key, record in data.get('cameras', {}).items():
+            try:
+                self.entries[key] = CameraInfo.from_dict(record)
+            except TypeError:
+                continue  # Eski / bozuk kayıt
+        self.updated: float = data.get('updated', 0.0)
+
+        self._listeners: List[Callable[[List[CameraInfo]], None]] = []
+        self._lock = threading.Lock()
+        self._refreshing = False
+        # Index başına son deneme thread'i (askıda kalan deneme sürerken aynı cihaz tekrar açılmaz)
+        self._probes: Dict[int, threading.Thread] = {}
+
+    # ==================== LİSTE ====================
+
+    def cameras(self) -> List[CameraInfo]:
+        """Önbellekteki kameralar (index sırasıyla, bekleme yok)."""
+        with self._lock:
+            return sorted(self.entries.values(), key=lambda info: info.index)
+
+    def get(self, index: int) -> Optional[CameraInfo]:
+        """Index'in önbellek kaydı (yoksa None)."""
+        return next((info for info in self.cameras() if info.index == index), None)
+
+    def refresh(self, busy: Iterable[int] = ()) -> List[CameraInfo]:
+        """
+        Tüm index'leri paralel tarar (her deneme başladığı andan itibaren en fazla
+        probe_timeout beklenir; önceki denemesi hâlâ süren index tekrar açılmaz).
+
+        Args:
+            busy: Kullanımda olan index'ler (açılmaz, önbellek kaydı korunur)
+
+        Returns:
+            Güncel kamera listesi
+        """
+        busy = set(busy)
+        names = device_names()
+        results: Dict[int, Optional[CameraInfo]] = {}
+
+        def probe(index: int):
+            try:
+                results[index] = probe_camera(index, names.get(index, ''))
+            except Exception as e:
+                print(f"⚠️ Kamera {index} denenemedi: {e}")
+                results[index] = None
+
+        # Askıda kalan bir deneme programın kapanmasını engellemesin diye daemon thread
+        threads = []
+        stalled = set()
+        for index in range(self.max_index):
+            if index in busy:
+                continue
+            with self._lock:
+                previous = self._probes.get(index)
+            if previous is not None and previous.is_alive():
+                print(f"⏱️ Kamera {index} önceki denemesi hâlâ sürüyor (atlandı)")
+                stalled.add(index)
+                continue
+            thread = threading.Thread(target=probe, args=(index,),
+                                      name=f"camera-probe-{index}", daemon=True)
+            thread.start()
+            with self._lock:
+                self._probes[index] = thread
+            threads.append((index, thread, time.monotonic() + self.probe_timeout))
+
+        for index, thread, deadline in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                print(f"⏱️ Kamera {index} zaman aşımı (atlandı)")
+                stalled.add(index)
+
+        with self._lock:
+            # Kullanımdaki ve süresi dolan / hâlâ süren denemeler: son bilinen kayıt
+            # korunur (cihaz yavaş olabilir)
+            kept = {key: info for key, info in self.entries.items()
+                    if info.index in busy or info.index in stalled}
+            for info in results.values():
+                if info is not None:
+                    kept[info.key] = info
+            self.entries = kept
+            self.updated = time.time()
+        self.save()
+        return self.cameras()
+
+    def refresh_async(self, busy: Iterable[int] = ()) -> bool:
+        """
+        Taramayı arka planda başlatır (zaten sürüyorsa bir şey yapmaz).
+
+        Args:
+            busy: Kullanımda olan index'ler
+
+        Returns:
+            True: Yeni tarama başlatıldı, False: önceki tarama sürüyor
+        """
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+
+        def run():
+            try:
+                cameras = self.refresh(busy)
+            finally:
+                with self._lock:
+                    self._refreshing = False
+            for callback in list(self._listeners):
+                try:
+                    callback(cameras)
+                except Exception as e:
+                    print(f"❌ Kamera listesi dinleyici hatası: {e}")
+
+        threading.Thread(target=run, name="camera-discovery", daemon=True).start()
+        return True
+
+    def add_listener(self, callback: Callable[[List[CameraInfo]], None]):
+        """Tarama bitince çağrılacak fonksiyon ekler (tarama thread'inden çağrılır)."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[List[CameraInfo]], None]):
+        """Dinleyiciyi kaldırır."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def save(self) -> bool:
+        """Önbelleği diske yazar."""
+        with self._lock:
+            data = {
+                'updated': self.updated,
+                'cameras': {key: info.to_dict() for key, info in self.entries.items()},
+            }
+        return self.store.save_settings(data)
+
+
+# Süreç başına tek tarayıcı
+_DISCOVERY: Optional[CameraDiscovery] = None
+
+
+def get_camera_discovery() -> CameraDiscovery:
+    """Paylaşılan CameraDiscovery nesnesini döndürür (ilk çağrıda dosyadan yüklenir)."""
+    global _DISCOVERY
+    if _DISCOVERY is None:
+        _DISCOVERY = CameraDiscovery()
+    return _DISCOVERY
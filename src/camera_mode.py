@@ -0,0 +1,320 @@
+"""
+Camera Mode Modülü
+Kamera açılış modu (backend, piksel formatı, çözünürlük, FPS) seçimi.
+
+Birçok web kamerası 60 FPS'e sadece MJPG formatında çıkar; varsayılan
+backend'ler ise kendi kuyruklarında birkaç frame biriktirip gecikme ekler.
+Bu modül aday kombinasyonları tek tek açar, gerçekten teslim edilen FPS'i ve
+frame yaşını ölçer ve en hızlı çalışan modu kamera başına diske kaydeder.
+Sonraki açılışlarda kayıtlı mod doğrudan kullanılır (ölçüm tekrarlanmaz).
+"""
+
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import cv2
+
+sys.path.append(str(Path(__file__).parent))
+from config_manager import ConfigManager
+from camera_discovery import decode_fourcc, device_names
+
+
+# Platforma göre denenecek backend'ler (ilk sıradaki tercih edilir)
+if platform.system() == 'Windows':
+    BACKENDS = ('DSHOW', 'MSMF', 'ANY')
+elif platform.system() == 'Darwin':
+    BACKENDS = ('AVFOUNDATION', 'ANY')
+else:
+    BACKENDS = ('V4L2', 'ANY')
+
+# Piksel formatları: '' = sürücünün varsayılanı
+FOURCCS = ('MJPG', 'YUYV', '')
+
+# Ölçüm: ısınma (atılan) ve ölçülen frame sayısı
+WARMUP_FRAMES = 5
+MEASURE_FRAMES = 30
+
+# Tüm ölçümün üst sınırı (saniye): dolunca o ana kadarki en iyi mod seçilir
+NEGOTIATE_TIMEOUT = 12.0
+
+
+class CameraMode(NamedTuple):
+    """Denenen / kaydedilen kamera modu ve ölçüm sonucu."""
+    backend: str
+    fourcc: str
+    width: int
+    height: int
+    fps: int
+    measured_fps: float = 0.0
+    frame_age_ms: float = 0.0
+
+    @property
+    def queue_frames(self) -> int:
+        """Ölçülen backend kuyruk derinliği (frame, en az 1)."""
+        if self.measured_fps <= 0:
+            return 1
+        return max(1, round(self.frame_age_ms * self.measured_fps / 1000.0))
+
+    @property
+    def label(self) -> str:
+        """Kısa açıklama (örn: 'DSHOW MJPG 640x480@60')."""
+        return f"{self.backend} {self.fourcc or 'varsayılan'} {self.width}x{self.height}@{self.fps}"
+
+
+def open_capture(index: int, mode: CameraMode) -> cv2.VideoCapture:
+    """
+    Kamerayı verilen modla açar.
+    FOURCC boyuttan önce ayarlanır (bazı sürücüler formatı boyut değişiminde sıfırlar).
+
+    Args:
+        index: OpenCV kamera index'i
+        mode: Açılış modu
+
+    Returns:
+        VideoCapture (açılamadıysa isOpened() False)
+    """
+    api = getattr(cv2, f"CAP_{mode.backend}", cv2.CAP_ANY)
+    cap = cv2.VideoCapture(index, api)
+    if not cap.isOpened():
+        return cap
+    if mode.fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*mode.fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, mode.width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, mode.height)
+    cap.set(cv2.CAP_PROP_FPS, mode.fps)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Buffer küçült (gecikme azalır)
+    return cap
+
+
+def measure_capture(cap: cv2.VideoCapture, frames: int = MEASURE_FRAMES) -> Tuple[float, float]:
+    """
+    Kameranın gerçekte teslim ettiği FPS'i ve frame yaşını ölçer.
+
+    Frame yaşı tahmini: okuma bir süre bekletildikten sonra art arda gelen
+    read() çağrılarından anında dönenler backend kuyruğunda bekleyen eski
+    frame'lerdir; sayıları × frame aralığı, kuyruğun eklediği gecikmedir.
+
+    Args:
+        cap: Açık VideoCapture
+        frames: Ölçülecek frame sayısı
+
+    Returns:
+        (ölçülen FPS, tahmini frame yaşı ms) - okuma başarısızsa (0.0, 0.0)
+    """
+    for _ in range(WARMUP_FRAMES):
+        if not cap.read()[0]:
+            return 0.0, 0.0
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        if not cap.read()[0]:
+            return 0.0, 0.0
+    elapsed = time.perf_counter() - start
+    measured_fps = frames / elapsed if elapsed > 0 else 0.0
+    if measured_fps <= 0:
+        return 0.0, 0.0
+
+    # Kuyruğun dolması için birkaç frame süresi bekle, sonra anında dönenleri say
+    interval = 1.0 / measured_fps
+    time.sleep(interval * 4)
+    queued = 0
+    for _ in range(6):
+        t0 = time.perf_counter()
+        if not cap.read()[0]:
+            break
+        if time.perf_counter() - t0 > interval * 0.25:
+            break
+        queued += 1
+    return measured_fps, queued * interval * 1000.0
+
+
+def candidate_modes(width: int, height: int, fps: int) -> List[CameraMode]:
+    """
+    Denenecek modlar (tercih sırasıyla).
+    İstenen çözünürlük önce, 640x480 yedek olarak; istenen FPS önce, 30 yedek olarak.
+
+    Args:
+        width: Hedef genişlik (Config.CAMERA_WIDTH)
+        height: Hedef yükseklik (Config.CAMERA_HEIGHT)
+        fps: Hedef FPS (Config.CAMERA_FPS)
+
+    Returns:
+        CameraMode listesi (ölçüm alanları boş)
+    """
+    sizes = [(width, height)] + ([(640, 480)] if (width, height) != (640, 480) else [])
+    rates = [fps] + ([30] if fps != 30 else [])
+    return [CameraMode(backend, fourcc, w, h, rate)
+            for (w, h) in sizes
+            for rate in rates
+            for backend in BACKENDS
+            for fourcc in FOURCCS]
+
+
+class CameraModeNegotiator:
+    """
+    Kamera başına en hızlı modu bulur ve kaydeder.
+    Kayıt anahtarı "index | cihaz adı | hedef mod" (hedef değişince tekrar ölçülür).
+    """
+
+    def __init__(self, cache_file: str = 'camera_modes.json'):
+        """
+        CameraModeNegotiator sınıfını başlatır (dosyadan yükler).
+
+        Args:
+            cache_file: Kayıt dosyasının adı (ayar dosyasıyla aynı klasörde)
+        """
+        self.store = ConfigManager(cache_file)
+        self.modes: Dict[str, CameraMode] = {}
+        for key, record in self.store.load_settings().items():
+            try:
+                self.modes[key] = CameraMode(**record)
+            except TypeError:
+                continue  # Eski / bozuk kayıt
+
+    @staticmethod
+    def key(index: int, width: int, height: int, fps: int) -> str:
+        """Kayıt anahtarı."""
+        name = device_names().get(index, f"Kamera {index}")
+        return f"{index}|{name}|{width}x{height}@{fps}"
+
+    def negotiate(self, index: int, width: int, height: int, fps: int) -> Optional[CameraMode]:
+        """
+        Aday modları açıp ölçer; en yüksek FPS'i (eşitse en genç frame'i) veren mod seçilir.
+        Gereksiz ölçüm yapılmaz:
+            - Hedef FPS'e ulaşan ilk istenen-çözünürlük modunda durulur
+            - Bir backend (boyut + FPS için) hedefe ulaştıysa kalan FOURCC'leri denenmez
+            - Açılamayan backend'in kalan adayları atlanır
+            - Ölçülmüş en iyi FPS'ten yüksek olmayan yedek FPS hedefi denenmez
+            - Toplam süre NEGOTIATE_TIMEOUT ile sınırlıdır
+
+        Args:
+            index: OpenCV kamera index'i
+            width, height, fps: Hedef mod
+
+        Returns:
+            En iyi CameraMode (hiçbiri açılamadıysa None)
+        """
+        print(f"🔬 Kamera {index} modları ölçülüyor ({width}x{height}@{fps})...")
+        best: Optional[CameraMode] = None
+        tried = set()
+        satisfied = set()      # Hedef FPS'e ulaşmış (boyut, FPS, backend)
+        failed_backends = set()
+        deadline = time.monotonic() + NEGOTIATE_TIMEOUT
+        for mode in candidate_modes(width, height, fps):
+            if time.monotonic() > deadline:
+                print(f"   ⏱️ Ölçüm süresi doldu ({NEGOTIATE_TIMEOUT:.0f} sn)")
+                break
+            group = (mode.width, mode.height, mode.fps, mode.backend)
+            if group in satisfied or mode.backend in failed_backends:
+                continue
+            if best is not None and (mode.width, mode.height) == (best.width, best.height) \
+                    and mode.fps <= best.measured_fps:
+                continue
+
+            cap = open_capture(index, mode)
+            try:
+                if not cap.isOpened():
+                    failed_backends.add(mode.backend)
+                    continue
+                # Sürücü isteği farklı bir moda çevirebilir (örn: MJPG'yi yok sayar):
+                # gerçekte açılan mod geri okunur ve kaydedilir (bkz. probe_camera)
+                actual = mode._replace(
+                    fourcc=decode_fourcc(cap.get(cv2.CAP_PROP_FOURCC)),
+                    width=int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or mode.width,
+                    height=int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or mode.height,
+                    fps=int(round(cap.get(cv2.CAP_PROP_FPS))) or mode.fps)
+                signature = (actual.backend, actual.fourcc, actual.width, actual.height, actual.fps)
+                if signature in tried:
+                    continue
+                tried.add(signature)
+
+                measured_fps, age_ms = measure_capture(cap)
+            except Exception as e:
+                print(f"   ⚠️ {mode.label}: {e}")
+                continue
+            finally:
+                cap.release()
+
+            if measured_fps <= 0:
+                continue
+            result = actual._replace(measured_fps=round(measured_fps, 1),
+                                     frame_age_ms=round(age_ms, 1))
+            print(f"   {result.label}: {result.measured_fps} FPS, {result.frame_age_ms} ms kuyruk")
+
+            if best is None or (round(result.measured_fps), -result.frame_age_ms) > \
+                    (round(best.measured_fps), -best.frame_age_ms):
+                best = result
+            if result.measured_fps >= mode.fps * 0.9:
+                satisfied.add(group)
+            # Yeterince iyi: istenen boyut, hedef FPS ve en fazla bir frame kuyruk gecikmesi
+            if (result.width, result.height) == (width, height) and \
+                    result.measured_fps >= fps * 0.9 and result.frame_age_ms <= 1000.0 / result.measured_fps:
+                break
+
+        if best is not None:
+            print(f"✅ Seçilen mod: {best.label} ({best.measured_fps} FPS)")
+        return best
+
+    def open(self, index: int, width: int, height: int, fps: int,
+             renegotiate: bool = False) -> Tuple[cv2.VideoCapture, Optional[CameraMode]]:
+        """
+        Kamerayı kayıtlı (yoksa ölçülen) en hızlı modla açar.
+
+        Args:
+            index: OpenCV kamera index'i
+            width, height, fps: Hedef mod (Config.CAMERA_WIDTH / HEIGHT / FPS)
+            renegotiate: True ise kayıt yok sayılır ve tekrar ölçülür
+
+        Returns:
+            (VideoCapture, kullanılan mod) - mod bulunamazsa eski yöntemle açılır ve mod None
+        """
+        key = self.key(index, width, height, fps)
+        mode = None if renegotiate else self.modes.get(key)
+
+        if mode is not None:
+            cap = open_capture(index, mode)
+            if cap.isOpened() and cap.read()[0]:
+                print(f"📷 Kayıtlı mod: {mode.label} ({mode.measured_fps} FPS)")
+                return cap, mode
+            cap.release()
+            print("⚠️ Kayıtlı kamera modu açılamadı, tekrar ölçülüyor")
+
+        mode = self.negotiate(index, width, height, fps)
+        if mode is not None:
+            self.modes[key] = mode
+            self.save()
+            cap = open_capture(index, mode)
+            if cap.isOpened():
+                return cap, mode
+            cap.release()
+
+        # Yedek: backend / format seçmeden açılış
+        return open_capture(index, CameraMode('ANY', '', width, height, fps)), None
+
+    def save(self) -> bool:
+        """Kayıtları diske yazar."""
+        return self.store.save_settings({key: mode._asdict() for key, mode in self.modes.items()})
+
+
+def open_camera(index: int, width: int, height: int, fps: int,
+                negotiate: bool = True) -> Tuple[cv2.VideoCapture, CameraMode]:
+    """
+    Kamerayı açar (negotiate=True ise kayıtlı / ölçülen en hızlı modla).
+
+    Args:
+        index: OpenCV kamera index'i
+        width, height, fps: Hedef mod
+        negotiate: False ise sadece boyut / FPS / buffer ayarlanır (eski davranış)
+
+    Returns:
+        (VideoCapture, kullanılan mod) - VideoCapture açılamadıysa isOpened() False;
+        mod ölçülmediyse measured_fps 0.0 (hedef FPS kullanılmalı)
+    """
+    requested = CameraMode('ANY', '', width, height, fps)
+    if not negotiate:
+        return open_capture(index, requested), requested
+    cap, mode = CameraModeNegotiator().open(index, width, height, fps)
+    return cap, mode or requested
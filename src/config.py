@@ -3,11 +3,12 @@ Konfigürasyon Ayarları
 Bu modül, Hand Mouse projesindeki tüm ayarlanabilir parametreleri içerir.
 """
 
-import json
 import sys
-import os
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent))
+from settings_service import get_settings_service
+
 
 class Config:
     """Uygulama konfigürasyon sınıfı"""
@@ -20,6 +21,8 @@ class Config:
     CAMERA_WIDTH = 640                  # Kamera görüntü genişliği (piksel)
     CAMERA_HEIGHT = 480                 # Kamera görüntü yüksekliği (piksel)
     CAMERA_FPS = 60                     # Hedef FPS (kameranın desteklemesi gerekir)
+    CAMERA_NEGOTIATE = True             # Backend / MJPG-YUYV modlarını ölç, en hızlısını kaydet (camera_modes.json)
+    FRAME_MAX_AGE_MS = 100              # Bu yaştan eski frame işlenmeden atılır (ms, 0 = kapalı)
     
     # ==================== MEDIAPIPE AYARLARI ====================
     DETECTION_CONFIDENCE = 0.5          # El algılama güven eşiği (düşürüldü = daha hızlı)
@@ -29,7 +32,10 @@ class Config:
     # ==================== MOUSE KONTROL AYARLARI ====================
     MOUSE_SMOOTHING = 2                 # EMA smoothing için buffer (artık kullanılmıyor ama uyumluluk için)
     MOUSE_SPEED = 3.0                   # Mouse hassasiyeti çarpanı (optimize edildi)
-    SCREEN_MARGIN = 100                 # Ekran kenarlarından güvenli mesafe (piksel)
+    SCREEN_MARGIN = 0                   # Ekran kenarlarından güvenli mesafe (piksel, imleç bu sınırda tutulur)
+    MAPPING_GAMMA = 1.0                 # Konum eğrisi (1.0 = doğrusal, <1 merkezde hızlı, >1 merkezde hassas)
+    INPUT_BACKEND = 'auto'              # Mouse arka ucu: 'auto', 'win32', 'linux', 'pyautogui', 'recording'
+    TARGET_MONITOR = 'primary'          # Hedef ekran: 'primary', 'virtual' (tüm monitörler) veya monitör index'i (0, 1, ...)
     
     # ==================== DİNAMİK EMA AYARLARI (Sürekli Fonksiyon) ====================
     # EMA değeri hıza göre sürekli hesaplanır (interpolasyon yerine matematiksel fonksiyon)
@@ -64,6 +70,7 @@ class Config:
     SCROLL_SENSITIVITY = 20             # Scroll hassasiyeti (piksel hareket başına scroll miktarı)
     SCROLL_THRESHOLD = 15               # Minimum hareket eşiği scroll başlamadan önce (piksel)
     SCROLL_COOLDOWN = 0.05              # Scroll işlemleri arası minimum süre (saniye)
+    SCROLL_HIGH_RESOLUTION = True       # Kesirli çark adımı gönder (destekleyen arka uçlarda daha akıcı)
     
     # ==================== SES KONTROL AYARLARI ====================
     VOLUME_STEP = 4                     # Ses değişim adımı (1-10 arası birim, 5 = her seferinde 5 birim)
@@ -72,17 +79,30 @@ class Config:
     # ==================== SESLİ YAZMA AYARLARI ====================
     SPEECH_ENABLED = True               # Sesli yazma sistemini aç/kapa
     SPEECH_LANGUAGE = 'tr-TR'           # Tanıma dili (tr-TR: Türkçe, en-US: İngilizce)
+    SPEECH_ENGINE = 'google'            # Tanıma motoru: 'google' (internet), 'vosk' / 'whisper' (çevrimdışı), 'auto'
+    SPEECH_MODEL_PATH = ''              # Yerel model klasörü / whisper boyutu ('' = models/vosk-<dil> veya 'base')
+    SPEECH_STREAMING = False            # Akış modu: kelimeler konuşulurken yazılır (akış destekli motor gerekir, örn. vosk)
     SPEECH_MICROPHONE_INDEX = 3         # Mikrofon index (None = varsayılan, 0,1,2... = belirli mikrofon)
     SPEECH_AUTO_START = True            # Uygulama başlarken otomatik mikrofon başlatsın mı?
     SPEECH_AUTO_WRITE = True            # Sürekli yazma modu (konuşulanları hemen yaz)
     SPEECH_TIMEOUT = 5                  # Maksimum dinleme süresi (saniye)
     SPEECH_AUTO_ENTER = False           # Her cümleden sonra otomatik Enter basılsın mı?
+    SPEECH_WORKERS = 2                  # Paralel tanıma thread sayısı (sabit havuz)
+    SPEECH_QUEUE_SIZE = 4               # Tanıma kuyruğu sınırı (dolunca en eski ses atılır)
+    SPEECH_MAX_AUDIO_AGE = 5.0          # Bu süreden (saniye) uzun bekleyen ses tanınmadan atılır
+    SPEECH_MAX_PHRASE = 6.0             # Bir cümlenin maksimum uzunluğu (saniye, aşılırsa bölünür)
+    SPEECH_VAD_AGGRESSIVENESS = 2       # Konuşma algılama sertliği (0-3, yüksek = gürültüyü daha çok reddeder)
+    SPEECH_VAD_PRE_ROLL = 0.3           # Konuşma başından önce eklenecek ses (saniye, ilk hece kesilmesin)
+    SPEECH_VAD_HANGOVER = 0.5           # Cümle bitti sayılması için gereken sessizlik (saniye)
     
     # ==================== GÖRSEL AYARLAR ====================
     SHOW_FPS = True                     # FPS gösterimini aç/kapa
     SHOW_LANDMARKS = True               # El noktalarını göster
     SHOW_GESTURE_TEXT = True            # Jest ismini ekranda göster
     FLIP_CAMERA = True                  # Kamerayı ayna gibi çevir (daha doğal)
+    OVERLAY_MAX_FPS = 12                # Overlay panelinin saniyedeki maksimum yenilenme sayısı
+    OVERLAY_RENDERER = 'widgets'        # 'widgets' (label ağacı) veya 'canvas' (tek canvas + FPS/gecikme grafikleri)
+    PREVIEW_MAX_FPS = 30                # GUI kamera önizlemesinin saniyedeki maksimum kare sayısı (çizim de bu hızda)
     
     # ==================== RENKLER (BGR formatında) ====================
     COLOR_HAND_LANDMARKS = (0, 255, 0)  # El noktaları rengi (Yeşil)
@@ -104,28 +124,11 @@ class Config:
 
 # ==================== AYARLARI YÜKLE (settings.json varsa) ====================
 def _load_settings_on_startup():
-    """Uygulama başlarken settings.json'dan ayarları yükle"""
-    try:
-        # settings.json path'ini belirle (EXE/normal mod)
-        if getattr(sys, 'frozen', False):
-            # EXE modunda - AppData kullan
-            app_data = os.getenv('APPDATA')
-            settings_path = Path(app_data) / 'HandMouse' / 'settings.json'
-        else:
-            # Normal modda - proje dizini
-            settings_path = Path(__file__).parent.parent / 'settings.json'
-        
-        # Dosya varsa yükle
-        if settings_path.exists():
-            with open(settings_path, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-            
-            # Her ayarı Config sınıfına uygula
-            for key, value in settings.items():
-                if hasattr(Config, key):
-                    setattr(Config, key, value)
-    except Exception as e:
-        pass  # Hata olsa bile varsayılan ayarlarla devam et
+    """Uygulama başlarken settings.json'dan ayarları yükle (şemaya göre doğrulanır)"""
+    # Geçersiz / bilinmeyen anahtarlar uyarıyla atlanır, varsayılan değer kalır
+    for key, value in get_settings_service().load().items():
+        if hasattr(Config, key):
+            setattr(Config, key, value)
 
 
 # Modül yüklendiğinde ayarları otomatik yükle
@@ -5,6 +5,8 @@ Config Manager - Ayarları Dosyaya Kaydetme/Yükleme
 import json
 import sys
 import os
+import tempfile
+import time
 from pathlib import Path
 from typing import Dict, Any
 
@@ -32,7 +34,8 @@ class ConfigManager:
     
     def save_settings(self, settings: Dict[str, Any]) -> bool:
         """
-        Ayarları JSON dosyasına kaydet
+        Ayarları JSON dosyasına kaydet (önce geçici dosyaya yazılır, sonra
+        yeniden adlandırılır - okuyan taraf hiçbir zaman yarım dosya görmez)
         
         Args:
             settings: Kaydedilecek ayarlar dictionary
@@ -40,12 +43,28 @@ class ConfigManager:
         Returns:
             Başarılı ise True
         """
+        tmp_path = None
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
+            fd, tmp_path = tempfile.mkstemp(dir=self.config_path.parent,
+                                            prefix=self.config_path.name, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, indent=4, ensure_ascii=False)
-            return True
+                f.flush()
+                os.fsync(f.fileno())
+            
+            # Windows'ta hedef dosya o an başka süreçte açıksa kısa süre sonra tekrar dene
+            for attempt in range(3):
+                try:
+                    os.replace(tmp_path, self.config_path)
+                    return True
+                except PermissionError:
+                    if attempt == 2:
+                        raise
+                    time.sleep(0.05)
         except Exception as e:
             print(f"❌ Ayar kaydetme hatası: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             return False
     
     def load_settings(self) -> Dict[str, Any]:
@@ -63,61 +82,3 @@ class ConfigManager:
         except Exception as e:
             print(f"❌ Ayar yükleme hatası: {e}")
             return {}
-    
-    def update_config_file(self, settings: Dict[str, Any]) -> bool:
-        """
-        Config.py dosyasını güncelle
-        
-        Args:
-            settings: Güncellenecek ayarlar
-            
-        Returns:
-            Başarılı ise True
-        """
-        try:
-            config_py_path = Path(__file__).parent / 'config.py'
-            
-            with open(config_py_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            new_lines = []
-            for line in lines:
-                original_line = line
-                updated = False
-                
-                # Her ayar için kontrol et
-                for key, value in settings.items():
-                    if line.strip().startswith(key + ' =') or line.strip().startswith(key + '='):
-                        # Değeri güncelle
-                        indent = len(line) - len(line.lstrip())
-                        
-                        if isinstance(value, str):
-                            new_line = f"{' ' * indent}{key} = '{value}'"
-                        elif isinstance(value, bool):
-                            new_line = f"{' ' * indent}{key} = {value}"
-                        else:
-                            new_line = f"{' ' * indent}{key} = {value}"
-                        
-                        # Yorum varsa koru
-                        if '#' in original_line:
-                            comment = original_line[original_line.index('#'):]
-                            new_line += ' ' * (len(original_line.split('#')[0]) - len(new_line)) + comment
-                        else:
-                            new_line += '\n'
-                        
-                        new_lines.append(new_line)
-                        updated = True
-                        break
-                
-                if not updated:
-                    new_lines.append(original_line)
-            
-            # Dosyayı yaz
-            with open(config_py_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
-            
-            return True
-            
-        except Exception as e:
-            print(f"❌ Config dosyası güncelleme hatası: {e}")
-            return False
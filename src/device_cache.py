@@ -0,0 +1,262 @@
+"""
+Device Cache Modülü
+Mikrofon yetenek önbelleği: cihaz listesi, kalibre edilmiş gürültü tabanı ve
+son bilinen çalışma durumu diske kaydedilir.
+
+Anahtar "host API | cihaz adı" çiftidir (PyAudio index'i cihaz takılıp
+çıkarıldıkça kayar, isim kaymaz). Cihaz listesinin parmak izi değişirse
+listede olmayan cihazların kayıtları silinir.
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.append(str(Path(__file__).parent))
+from config_manager import ConfigManager
+
+try:
+    import speech_recognition as sr
+    HAS_SPEECH = True
+except ImportError:
+    HAS_SPEECH = False
+
+
+# Kalibrasyon bu süreden (saniye) eskiyse tekrar ölçülür (ortam değişmiş olabilir)
+CALIBRATION_MAX_AGE = 7 * 24 * 3600
+
+
+class DeviceCache:
+    """
+    Kalıcı mikrofon önbelleği.
+    Kayıt: {'noise_floor', 'calibrated', 'working', 'checked', 'sample_rate', 'channels'}
+    """
+
+    def __init__(self, cache_file: str = 'device_cache.json'):
+        """
+        DeviceCache sınıfını başlatır (dosyadan yükler, cihazları henüz listelemez).
+
+        Args:
+            cache_file: Önbellek dosyasının adı (ayar dosyasıyla aynı klasörde)
+        """
+        self.store = ConfigManager(cache_file)
+        data = self.store.load_settings()
+
+        self.entries: Dict[str, dict] = data.get('devices', {})
+        self.fingerprint: str = data.get('fingerprint', '')
+        self.last_good: Optional[str] = data.get('last_good')
+
+        # Bellekteki cihaz listesi: [{'index', 'name', 'host_api', 'key', ...}]
+        self._devices: Optional[List[dict]] = None
+        self._lock = threading.Lock()
+        self._dirty = False   # Kaydedilmemiş kalibrasyon var mı (bkz. flush)
+
+    # ==================== CİHAZ LİSTESİ ====================
+
+    def devices(self, refresh: bool = False) -> List[dict]:
+        """
+        Giriş cihazlarını döndürür (ilk çağrıda veya refresh=True ise listelenir).
+
+        Args:
+            refresh: True ise PyAudio ile yeniden listele
+
+        Returns:
+            [{'index', 'name', 'host_api', 'key', 'channels', 'sample_rate'}, ...]
+        """
+        with self._lock:
+            if self._devices is None or refresh:
+                self._devices = self._enumerate()
+                self._check_fingerprint()
+            return self._devices
+
+    def key_for_index(self, index: Optional[int]) -> Optional[str]:
+        """
+        PyAudio index'inin önbellek anahtarı (None = varsayılan cihaz).
+
+        Args:
+            index: Cihaz index'i
+
+        Returns:
+            Anahtar veya None (cihaz yoksa)
+        """
+        devices = self.devices()
+        if index is None:
+            default = next((d for d in devices if d.get('default')), None)
+            return default['key'] if default else None
+        for device in devices:
+            if device['index'] == index:
+                return device['key']
+        return None
+
+    def index_for_key(self, key: Optional[str]) -> Optional[int]:
+        """Anahtarın şu anki PyAudio index'i (cihaz takılı değilse None)."""
+        for device in self.devices():
+            if device['key'] == key:
+                return device['index']
+        return None
+
+    @staticmethod
+    def _enumerate() -> List[dict]:
+        """PyAudio ile giriş cihazlarını listeler (tek PyAudio örneği açılır)."""
+        if not HAS_SPEECH:
+            return []
+
+        devices = []
+        audio = None
+        try:
+            pyaudio = sr.Microphone.get_pyaudio()
+            audio = pyaudio.PyAudio()
+            try:
+                default_index = audio.get_default_input_device_info().get('index')
+            except Exception:
+                default_index = None
+
+            for i in range(audio.get_device_count()):
+                info = audio.get_device_info_by_index(i)
+                try:
+                    host_api = audio.get_host_api_info_by_index(info.get('hostApi', 0)).get('name', '')
+                except Exception:
+                    host_api = ''
+                name = info.get('name', f'Cihaz {i}')
+                devices.append({
+                    'index': i,
+                    'name': name,
+                    'host_api': host_api,
+                    'key': f"{host_api}|{name}",
+                    'channels': int(info.get('maxInputChannels', 0)),
+                    'sample_rate': int(info.get('defaultSampleRate', 0)),
+                    'default': i == default_index,
+                })
+        except Exception as e:
+            print(f"❌ Mikrofon listesi alınamadı: {e}")
+        finally:
+            if audio is not None:
+                audio.terminate()
+        return devices
+
+    def _check_fingerprint(self):
+        """Cihaz listesi değiştiyse takılı olmayan cihazların kayıtlarını geçersiz kılar."""
+        keys = sorted(d['key'] for d in self._devices)
+        fingerprint = '\n'.join(keys)
+        if fingerprint == self.fingerprint:
+            return
+
+        present = set(keys)
+        removed = [key for key in self.entries if key not in present]
+        for key in removed:
+            del self.entries[key]
+        if self.last_good not in present:
+            self.last_good = None
+
+        if self.fingerprint and removed:
+            print(f"🔄 Mikrofon değişikliği algılandı, {len(removed)} kayıt silindi")
+        self.fingerprint = fingerprint
+        self.save()
+
+    # ==================== KAYITLAR ====================
+
+    def get(self, index: Optional[int]) -> Optional[dict]:
+        """Cihazın önbellek kaydı (yoksa None)."""
+        key = self.key_for_index(index)
+        return self.entries.get(key) if key else None
+
+    def calibration(self, index: Optional[int]) -> Optional[dict]:
+        """
+        Geçerli (süresi dolmamış) kalibrasyon.
+
+        Args:
+            index: Cihaz index'i
+
+        Returns:
+            'noise_floor' içeren kayıt veya None (tekrar ölçülmeli)
+        """
+        entry = self.get(index)
+        if not entry or 'noise_floor' not in entry:
+            return None
+        if time.time() - entry.get('calibrated', 0) > CALIBRATION_MAX_AGE:
+            return None
+        return entry
+
+    def set_calibration(self, index: Optional[int], noise_floor: float):
+        """
+        Ölçülen gürültü tabanını bellekte günceller.
+        Her dinlemeden sonra çağrıldığı için diske yazmaz; bir sonraki save()
+        veya flush() (kapanışta) ile kaydedilir.
+
+        Args:
+            index: Cihaz index'i
+            noise_floor: VAD gürültü tabanı (RMS)
+        """
+        entry = self._entry(index)
+        if entry is None:
+            return
+        entry['noise_floor'] = float(noise_floor)
+        entry['calibrated'] = time.time()
+        self._dirty = True
+
+    def mark(self, index: Optional[int], working: bool):
+        """
+        Cihazın test / kullanım sonucunu kaydeder.
+
+        Args:
+            index: Cihaz index'i
+            working: True = ses alındı
+        """
+        entry = self._entry(index)
+        if entry is None:
+            return
+        entry['working'] = bool(working)
+        entry['checked'] = time.time()
+        key = self.key_for_index(index)
+        if working:
+            self.last_good = key
+        elif self.last_good == key:
+            self.last_good = None
+        self.save()
+
+    def last_working_index(self) -> Optional[int]:
+        """Son çalıştığı bilinen mikrofonun şu anki index'i (takılı değilse None)."""
+        if not self.last_good:
+            return None
+        return self.index_for_key(self.last_good)
+
+    def flush(self) -> bool:
+        """Kaydedilmemiş kalibrasyon varsa önbelleği diske yazar."""
+        if not self._dirty:
+            return True
+        return self.save()
+
+    def save(self) -> bool:
+        """Önbelleği diske yazar."""
+        self._dirty = False
+        return self.store.save_settings({
+            'fingerprint': self.fingerprint,
+            'last_good': self.last_good,
+            'devices': self.entries,
+        })
+
+    def _entry(self, index: Optional[int]) -> Optional[dict]:
+        """Kaydı döndürür, yoksa cihaz bilgisiyle oluşturur."""
+        key = self.key_for_index(index)
+        if key is None:
+            return None
+        entry = self.entries.get(key)
+        if entry is None:
+            device = next(d for d in self.devices() if d['key'] == key)
+            entry = {'sample_rate': device['sample_rate'], 'channels': device['channels']}
+            self.entries[key] = entry
+        return entry
+
+
+# Süreç başına tek önbellek
+_CACHE: Optional[DeviceCache] = None
+
+
+def get_device_cache() -> DeviceCache:
+    """Paylaşılan DeviceCache nesnesini döndürür (ilk çağrıda dosyadan yüklenir)."""
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = DeviceCache()
+    return _CACHE
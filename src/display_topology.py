@@ -0,0 +1,383 @@
+"""
+Display Topology Modülü
+Bağlı monitörleri (konum, çözünürlük, DPI ölçeği) bir kere listeler ve önbellekte tutar.
+
+Monitör listesi her frame'de sorgulanmaz: sadece işletim sistemi ekran değişikliği
+bildirdiğinde (Windows: WM_DISPLAYCHANGE / WM_DPICHANGED / WM_SETTINGCHANGE,
+X11: RandR ScreenChangeNotify) yenilenir. Bekleme olay tabanlıdır, polling yoktur.
+"""
+
+import os
+import platform
+import threading
+from typing import Callable, List, NamedTuple, Optional, Tuple, Union
+
+# Windows API
+if platform.system() == 'Windows':
+    try:
+        import ctypes
+        import win32api
+        import win32con
+        import win32gui
+        HAS_WIN32 = True
+    except ImportError:
+        HAS_WIN32 = False
+else:
+    HAS_WIN32 = False
+
+# X11 RandR
+try:
+    from Xlib import X
+    from Xlib import display as xdisplay
+    from Xlib.ext import randr
+    HAS_XLIB = True
+except ImportError:
+    HAS_XLIB = False
+
+# Windows mesajları (win32con'da olmayabilir)
+WM_DPICHANGED = 0x02E0
+
+# Windows'ta %100 ölçeğin DPI değeri
+BASE_DPI = 96
+
+
+class Monitor(NamedTuple):
+    """Tek bir monitörün sanal masaüstündeki yeri ve ölçeği."""
+    index: int
+    x: int
+    y: int
+    width: int
+    height: int
+    scale: float = 1.0
+    is_primary: bool = False
+    name: str = ''
+
+
+def enable_dpi_awareness():
+    """
+    Windows'ta süreci monitör başına DPI-duyarlı yapar.
+    Böylece koordinatlar fiziksel piksel olur ve %125/%150 ölçekli ekranlarda
+    imleç sıçramaz. Zaten ayarlanmışsa sessizce geçer.
+    """
+    if not HAS_WIN32:
+        return
+    try:
+        # 2 = PROCESS_PER_MONITOR_DPI_AWARE (Windows 8.1+)
+        ctypes.windll.shcore.SetProcessDpiAwareness(2)
+    except Exception:
+        try:
+            ctypes.windll.user32.SetProcessDPIAware()
+        except Exception:
+            pass
+
+
+class DisplayTopology:
+    """
+    Monitör topolojisi önbelleği.
+    Hedef alan seçimi: 'virtual' (tüm masaüstü), 'primary' veya monitör index'i.
+    """
+
+    def __init__(self,
+                 fallback_size: Tuple[int, int] = (1920, 1080),
+                 monitors: Optional[List[Monitor]] = None):
+        """
+        DisplayTopology sınıfını başlatır.
+
+        Args:
+            fallback_size: Monitör listelenemezse kullanılacak ekran boyutu
+            monitors: Sabit monitör listesi (verilirse işletim sistemi sorgulanmaz)
+        """
+        self.fallback_size = tuple(fallback_size)
+        self.static = monitors is not None
+        self.monitors: List[Monitor] = list(monitors) if monitors else []
+
+        # Değişiklik sayacı ve dinleyiciler
+        self.version = 0
+        self._listeners: List[Callable[['DisplayTopology'], None]] = []
+        self._lock = threading.Lock()
+
+        # İzleme thread'i
+        self._watch_thread = None
+        self._watch_hwnd = None
+        self._watch_display = None
+        self._watching = False
+
+        if not self.static:
+            enable_dpi_awareness()
+            self.refresh()
+        else:
+            self.version = 1
+
+    # ==================== SORGULAR ====================
+
+    def virtual_rect(self) -> Tuple[int, int, int, int]:
+        """
+        Tüm monitörleri kapsayan sanal masaüstü dikdörtgeni.
+
+        Returns:
+            (x, y, genişlik, yükseklik)
+        """
+        left = min(m.x for m in self.monitors)
+        top = min(m.y for m in self.monitors)
+        right = max(m.x + m.width for m in self.monitors)
+        bottom = max(m.y + m.height for m in self.monitors)
+        return (left, top, right - left, bottom - top)
+
+    def primary(self) -> Monitor:
+        """Birincil monitörü döndürür (işaretli yoksa ilki)."""
+        for monitor in self.monitors:
+            if monitor.is_primary:
+                return monitor
+        return self.monitors[0]
+
+    def target_rect(self, selection: Union[str, int] = 'primary') -> Tuple[int, int, int, int]:
+        """
+        Kamera alanının eşleneceği ekran dikdörtgeni.
+
+        Args:
+            selection: 'virtual', 'primary' veya monitör index'i
+
+        Returns:
+            (x, y, genişlik, yükseklik) sanal masaüstü koordinatlarında
+        """
+        if selection == 'virtual':
+            return self.virtual_rect()
+
+        if isinstance(selection, int) and 0 <= selection < len(self.monitors):
+            monitor = self.monitors[selection]
+        else:
+            monitor = self.primary()
+        return (monitor.x, monitor.y, monitor.width, monitor.height)
+
+    # ==================== YENİLEME ====================
+
+    def refresh(self) -> bool:
+        """
+        Monitör listesini işletim sisteminden yeniden okur.
+
+        Returns:
+            True: Topoloji değişti
+        """
+        if self.static:
+            return False
+
+        monitors = []
+        try:
+            if HAS_WIN32:
+                monitors = self._enumerate_win32()
+            elif HAS_XLIB and os.environ.get('DISPLAY'):
+                monitors = self._enumerate_x11()
+        except Exception as e:
+            print(f"⚠️  Monitörler listelenemedi: {e}")
+            monitors = []
+
+        if not monitors:
+            width, height = self.fallback_size
+            monitors = [Monitor(0, 0, 0, width, height, 1.0, True, 'default')]
+
+        with self._lock:
+            changed = monitors != self.monitors
+            self.monitors = monitors
+            if changed:
+                self.version += 1
+            listeners = list(self._listeners)
+
+        if changed:
+            for callback in listeners:
+                try:
+                    callback(self)
+                except Exception as e:
+                    print(f"⚠️  Ekran değişikliği dinleyici hatası: {e}")
+        return changed
+
+    def add_listener(self, callback: Callable[['DisplayTopology'], None]):
+        """
+        Topoloji değiştiğinde çağrılacak fonksiyon ekler (izleme thread'inden çağrılır).
+
+        Args:
+            callback: callback(topology)
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[['DisplayTopology'], None]):
+        """Dinleyiciyi kaldırır."""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def _enumerate_win32(self) -> List[Monitor]:
+        """Windows: EnumDisplayMonitors + GetDpiForMonitor."""
+        monitors = []
+        for i, (hmonitor, _hdc, rect) in enumerate(win32api.EnumDisplayMonitors()):
+            info = win32api.GetMonitorInfo(hmonitor)
+            left, top, right, bottom = info['Monitor']
+            is_primary = bool(info['Flags'] & win32con.MONITORINFOF_PRIMARY)
+
+            scale = 1.0
+            try:
+                dpi_x = ctypes.c_uint()
+                dpi_y = ctypes.c_uint()
+                # 0 = MDT_EFFECTIVE_DPI
+                ctypes.windll.shcore.GetDpiForMonitor(
+                    ctypes.c_void_p(int(hmonitor)), 0, ctypes.byref(dpi_x), ctypes.byref(dpi_y))
+                scale = dpi_x.value / BASE_DPI
+            except Exception:
+                pass
+
+            monitors.append(Monitor(i, left, top, right - left, bottom - top,
+                                    scale, is_primary, info.get('Device', '')))
+        return monitors
+
+    def _enumerate_x11(self) -> List[Monitor]:
+        """X11: RandR 1.5 monitör listesi, DPI ölçeği Xft.dpi'dan."""
+        d = xdisplay.Display()
+        try:
+            root = d.screen().root
+            scale = self._x11_scale(d)
+
+            monitors = []
+            if d.has_extension('RANDR'):
+                reply = randr.get_monitors(root, is_active=True)
+                for i, m in enumerate(reply.monitors):
+                    try:
+                        name = d.get_atom_name(m.name)
+                    except Exception:
+                        name = ''
+                    monitors.append(Monitor(i, m.x, m.y, m.width_in_pixels, m.height_in_pixels,
+                                            scale, bool(m.primary), name))
+
+            if not monitors:
+                screen = d.screen()
+                monitors = [Monitor(0, 0, 0, screen.width_in_pixels, screen.height_in_pixels,
+                                    scale, True, 'screen')]
+            return monitors
+        finally:
+            d.close()
+
+    @staticmethod
+    def _x11_scale(d) -> float:
+        """Xft.dpi kaynağından ölçek (yoksa 1.0)."""
+        try:
+            prop = d.screen().root.get_full_property(
+                d.intern_atom('RESOURCE_MANAGER'), X.AnyPropertyType)
+            if prop is None:
+                return 1.0
+            data = prop.value.decode() if isinstance(prop.value, bytes) else str(prop.value)
+            for line in data.splitlines():
+                if line.startswith('Xft.dpi:'):
+                    return float(line.split(':', 1)[1]) / BASE_DPI
+        except Exception:
+            pass
+        return 1.0
+
+    # ==================== İZLEME (olay tabanlı) ====================
+
+    def start_watching(self):
+        """Ekran değişikliği olaylarını dinleyen arka plan thread'ini başlatır."""
+        if self.static or self._watching:
+            return
+
+        if HAS_WIN32:
+            target = self._watch_win32
+        elif HAS_XLIB and os.environ.get('DISPLAY'):
+            target = self._watch_x11
+        else:
+            return  # Olay kaynağı yok - topoloji sabit kabul edilir
+
+        self._watching = True
+        self._watch_thread = threading.Thread(target=target, daemon=True)
+        self._watch_thread.start()
+
+    def stop_watching(self):
+        """İzleme thread'ini durdurur."""
+        if not self._watching:
+            return
+        self._watching = False
+
+        try:
+            if self._watch_hwnd:
+                win32gui.PostMessage(self._watch_hwnd, win32con.WM_CLOSE, 0, 0)
+            if self._watch_display is not None:
+                # Bloklayan next_event() çağrısını sonlandırır
+                self._watch_display.close()
+        except Exception:
+            pass
+
+    def _on_win32_message(self, hwnd, msg, wparam, lparam):
+        """Gizli pencerenin ekran değişikliği mesajları."""
+        self.refresh()
+        return 0
+
+    def _watch_win32(self):
+        """Gizli üst seviye pencere ile yayın mesajlarını bekler (GetMessage bloklar)."""
+        # Sınıf adı nesneye özel: pencere prosedürü bu nesneye bağlıdır, durdur / başlat
+        # sonrası yeni topoloji eski (durmuş) nesnenin sınıfını kullanmamalı
+        class_name = f'HandMouseDisplayWatcher{id(self):x}'
+        hinstance = win32api.GetModuleHandle(None)
+        registered = False
+        try:
+            wc = win32gui.WNDCLASS()
+            wc.lpszClassName = class_name
+            wc.hInstance = hinstance
+            wc.lpfnWndProc = {
+                win32con.WM_DISPLAYCHANGE: self._on_win32_message,
+                win32con.WM_SETTINGCHANGE: self._on_win32_message,
+                WM_DPICHANGED: self._on_win32_message,
+                win32con.WM_DESTROY: lambda hwnd, msg, wparam, lparam: win32gui.PostQuitMessage(0),
+            }
+            win32gui.RegisterClass(wc)
+            registered = True
+
+            # Mesaj-only pencere yayın mesajlarını almaz; görünmez üst seviye pencere gerekir
+            self._watch_hwnd = win32gui.CreateWindow(
+                class_name, 'HandMouse Display Watcher', 0,
+                0, 0, 0, 0, 0, 0, hinstance, None)
+            win32gui.PumpMessages()
+        except Exception as e:
+            print(f"⚠️  Ekran izleme hatası: {e}")
+        finally:
+            self._watch_hwnd = None
+            self._watching = False
+            if registered:
+                try:
+                    win32gui.UnregisterClass(class_name, hinstance)
+                except Exception:
+                    pass
+
+    def _watch_x11(self):
+        """RandR ScreenChangeNotify olaylarını bekler (next_event bloklar)."""
+        try:
+            d = xdisplay.Display()
+            self._watch_display = d
+            if not d.has_extension('RANDR'):
+                return
+            d.screen().root.xrandr_select_input(
+                randr.RRScreenChangeNotifyMask | randr.RRCrtcChangeNotifyMask |
+                randr.RROutputChangeNotifyMask)
+            while self._watching:
+                d.next_event()
+                self.refresh()
+        except Exception as e:
+            if self._watching:
+                print(f"⚠️  Ekran izleme hatası: {e}")
+        finally:
+            self._watch_display = None
+            self._watching = False
+
+
+def create_display_topology(backend) -> DisplayTopology:
+    """
+    Input arka ucuna uygun topoloji oluşturur.
+    Kayıt (recording) arka ucunda işletim sistemi sorgulanmaz, sabit tek monitör kullanılır.
+
+    Args:
+        backend: InputBackend nesnesi
+
+    Returns:
+        DisplayTopology nesnesi
+    """
+    width, height = backend.screen_size()
+    if backend.name == 'recording':
+        return DisplayTopology(monitors=[Monitor(0, 0, 0, width, height, 1.0, True, 'recording')])
+    return DisplayTopology(fallback_size=(width, height))
@@ -0,0 +1,143 @@
+"""
+EMA Curve Modülü
+Hız → EMA alpha eğrisini önceden hesaplanmış tabloya (lookup table) dönüştürür.
+
+Her frame'de math.exp / üs hesaplamak yerine hız nicemlenip (quantize)
+tablodan okunur. Tablo sadece eğri parametreleri değişince yeniden kurulur.
+"""
+
+import numpy as np
+from typing import List, Tuple
+
+# Tablo boyutu (nicemleme adımı = tablo_aralığı / (TABLE_SIZE - 1))
+TABLE_SIZE = 1024
+
+
+class EmaCurve:
+    """
+    Hız (piksel/frame) → EMA alpha lookup tablosu.
+    Fonksiyon tipleri: 'linear', 'exponential', 'sigmoid'.
+    """
+
+    def __init__(self):
+        """EmaCurve sınıfını başlatır (ilk configure() çağrısında tablo kurulur)."""
+        self._key = None
+        self.table: List[float] = []
+        self.max_speed = 1.0
+        self._inv_step = 0.0
+        self._last_index = 0
+        self.rebuild_count = 0
+
+    def configure(self,
+                  ema_min: float,
+                  ema_max: float,
+                  function: str,
+                  speed_min: float,
+                  speed_max: float,
+                  sigmoid_steepness: float,
+                  sigmoid_midpoint: float) -> bool:
+        """
+        Parametreler değiştiyse tabloyu yeniden kurar.
+
+        Args:
+            ema_min: Minimum EMA alpha (çok yavaş hareket)
+            ema_max: Maksimum EMA alpha (çok hızlı hareket)
+            function: 'linear', 'exponential' veya 'sigmoid'
+            speed_min: Minimum hız eşiği (piksel/frame)
+            speed_max: Maksimum hız eşiği (piksel/frame)
+            sigmoid_steepness: Sigmoid dikliği
+            sigmoid_midpoint: Sigmoid orta nokta hızı
+
+        Returns:
+            True: Tablo yeniden kuruldu
+        """
+        key = (ema_min, ema_max, function, speed_min, speed_max,
+               sigmoid_steepness, sigmoid_midpoint)
+        if key == self._key:
+            return False
+
+        # Tablo aralığı: eğrinin doyuma ulaştığı hız (bunun üstü son değer)
+        max_speed = float(max(speed_max, 1.0))
+        if function == 'sigmoid' and sigmoid_steepness > 0:
+            # 1 / (1 + e^-12) ≈ 0.999994 → pratikte doymuş
+            max_speed = max(max_speed, sigmoid_midpoint + 12.0 / sigmoid_steepness)
+
+        speeds = np.linspace(0.0, max_speed, TABLE_SIZE)
+        alphas = self.evaluate(speeds, ema_min, ema_max, function, speed_min, speed_max,
+                               sigmoid_steepness, sigmoid_midpoint)
+
+        self.table = alphas.tolist()
+        self.max_speed = max_speed
+        self._inv_step = (TABLE_SIZE - 1) / max_speed
+        self._last_index = TABLE_SIZE - 1
+        self._key = key
+        self.rebuild_count += 1
+        return True
+
+    def lookup(self, speed: float) -> float:
+        """
+        Hıza karşılık gelen EMA alpha değerini tablodan okur.
+
+        Args:
+            speed: Hareket hızı (piksel/frame, >= 0)
+
+        Returns:
+            EMA alpha
+        """
+        return self.table[min(int(speed * self._inv_step + 0.5), self._last_index)]
+
+    def points(self) -> List[Tuple[float, float]]:
+        """
+        Eğriyi (hız, alpha) noktaları olarak döndürür (GUI grafiği için).
+
+        Returns:
+            [(hız, alpha), ...] listesi
+        """
+        step = self.max_speed / (TABLE_SIZE - 1)
+        return [(i * step, alpha) for i, alpha in enumerate(self.table)]
+
+    @staticmethod
+    def evaluate(speeds,
+                 ema_min: float,
+                 ema_max: float,
+                 function: str,
+                 speed_min: float,
+                 speed_max: float,
+                 sigmoid_steepness: float,
+                 sigmoid_midpoint: float) -> np.ndarray:
+        """
+        Eğriyi verilen hızlar için doğrudan hesaplar (tablo kurulumu için).
+
+        3 Fonksiyon Tipi:
+        - Linear: Doğrusal artış (basit, tahmin edilebilir)
+        - Exponential: Üstel artış (y = x^2, yumuşak başlangıç, hızlı bitiş)
+        - Sigmoid: S-eğrisi (en doğal, yumuşak geçişler) - ham hıza uygulanır
+
+        Args:
+            speeds: Hız değerleri dizisi
+            (diğerleri configure() ile aynı)
+
+        Returns:
+            EMA alpha dizisi
+        """
+        speeds = np.asarray(speeds, dtype=np.float64)
+
+        # Hızı normalize et (0.0 - 1.0 arası)
+        span = speed_max - speed_min
+        if span <= 0:
+            normalized = (speeds >= speed_max).astype(np.float64)
+        else:
+            normalized = np.clip((speeds - speed_min) / span, 0.0, 1.0)
+
+        if function == 'exponential':
+            curve = normalized ** 2
+        elif function == 'sigmoid':
+            # f(x) = 1 / (1 + e^(-k*(x - x0)))
+            curve = 1.0 / (1.0 + np.exp(-sigmoid_steepness * (speeds - sigmoid_midpoint)))
+        else:
+            # 'linear' ve bilinmeyen tipler
+            curve = normalized
+
+        alphas = ema_min + (ema_max - ema_min) * curve
+        low, high = min(ema_min, ema_max), max(ema_min, ema_max)
+        return np.clip(alphas, low, high)
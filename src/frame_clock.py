@@ -0,0 +1,157 @@
+"""
+Frame Clock Modülü
+Her frame'e yakalama zamanı iliştirir ve bayat frame'leri işlemeden önce atar.
+
+Kamera backend'i frame'leri kendi kuyruğunda tutar: döngü bir kere yavaşlarsa
+(önizleme, tıklama, ayar uygulama) sonraki read() çağrıları yüzlerce ms önce
+yakalanmış frame'leri anında döndürür. grab() yeni frame için beklediyse
+yakalama zamanı dönüş anıdır; beklemeden döndüyse frame kuyruktan gelmiştir ve
+kuyruktaki frame'in yakalama zamanı şunlardan yenisidir:
+    - okunmamış sıradaki frame (son okunan frame + bir aralık)
+    - şimdi - kuyruk derinliği × aralık (halka tampon bundan eski frame tutamaz)
+İkinci sınır tahmini her seferinde şimdiye bağlar: aralık yanlış olsa bile hata
+kuyruk derinliğini aşacak kadar birikmez. Kuyruk derinliği kamera modu
+ölçümünden gelir (CameraMode.queue_frames).
+
+Frame aralığı kameranın ölçülen hızından (CameraMode.measured_fps) başlar ve
+art arda beklenen grab'ler arasındaki sürelerden öğrenilir: istenen FPS'e
+(örn: 60) çıkamayan kamera (30) yeni frame'leri bayat saydırmaz.
+Yaşı sınırı aşan frame el algılamaya hiç girmez; böylece girişten imlece en
+kötü durum gecikmesi sınırlı kalır.
+
+Dosya / sentetik kaynaklar yakalama zamanını kendileri bildirir (`captured`);
+bu durumda tahmin yapılmaz.
+"""
+
+import time
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+class FrameClock:
+    """
+    Frame okuma + yaş ölçümü + bayat frame atma politikası.
+    Sadece işleme thread'inden kullanılır.
+    """
+
+    # Çalışırken uygulanabilen ayarlar (bkz. apply_settings)
+    SETTINGS_KEYS = ('FRAME_MAX_AGE_MS',)
+
+    # Aralık öğrenimi: son N ardışık yeni frame arası süre, alt yüzdelik (titreşime dayanıklı)
+    INTERVAL_SAMPLES = 30
+    INTERVAL_MIN_SAMPLES = 10
+
+    def __init__(self, fps: float = 30.0, max_age_ms: float = 100.0, max_consecutive_drops: int = 10,
+                 queue_frames: int = 1):
+        """
+        FrameClock sınıfını başlatır.
+
+        Args:
+            fps: Kameranın gerçek frame hızı (ölçüldüyse CameraMode.measured_fps, yoksa hedef FPS)
+            max_age_ms: Bu yaştan eski frame'ler atılır (0 = atma kapalı)
+            max_consecutive_drops: Art arda en fazla bu kadar frame atılır (açlığı önler)
+            queue_frames: Backend kuyruk derinliği (CameraMode.queue_frames)
+        """
+        self.interval = 1.0 / fps if fps > 0 else 1.0 / 30.0
+        self.max_age_ms = max_age_ms
+        self.max_consecutive_drops = max_consecutive_drops
+        self.queue_frames = max(1, queue_frames)
+
+        # Son beklenen (yeni) frame'in dönüş anı (önceki grab da beklediyse) ve aralık örnekleri
+        self._fresh_at: Optional[float] = None
+        self._intervals = deque(maxlen=self.INTERVAL_SAMPLES)
+
+        # Son okunan frame
+        self.captured: float = 0.0      # Tahmini yakalama zamanı (perf_counter saniye)
+        self.sequence: int = 0          # Okunan frame sayısı
+
+        # İstatistikler
+        self.dropped: int = 0           # Toplam atılan frame
+        self.last_age_ms: float = 0.0   # Son işlenen frame'in işlemeye giriş yaşı
+        self.max_seen_age_ms: float = 0.0
+        self._consecutive_drops = 0
+
+    def read(self, camera) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Kameradan frame okur ve yakalama zamanını kaydeder.
+
+        Args:
+            camera: cv2.VideoCapture benzeri (grab / retrieve)
+
+        Returns:
+            (başarılı mı, frame) - cv2.VideoCapture.read() ile aynı
+        """
+        start = time.perf_counter()
+        if not camera.grab():
+            return False, None
+        now = time.perf_counter()
+
+        # Kaynak zamanı biliyorsa (dosya / sentetik) onu kullan
+        known = getattr(camera, 'captured', None)
+        if known is not None:
+            self.captured = known
+        # Beklemeden dönen grab: frame kuyrukta bekliyordu (bkz. modül açıklaması)
+        elif self.sequence and now - start < self.interval * 0.25:
+            self.captured = min(now, max(self.captured + self.interval,
+                                         now - self.queue_frames * self.interval))
+            self._fresh_at = None
+        else:
+            # Aralık sadece art arda iki beklenen grab arasından öğrenilir
+            if self._fresh_at is not None:
+                self._learn_interval(now - self._fresh_at)
+            self._fresh_at = now
+            self.captured = now
+        self.sequence += 1
+
+        success, frame = camera.retrieve()
+        return success, frame
+
+    def _learn_interval(self, observed: float):
+        """
+        Ardışık iki yeni frame arası süreden kameranın gerçek aralığını öğrenir.
+        Döngü kameradan yavaşsa süre aralığın katı olur; bu yüzden alt yüzdelik kullanılır.
+
+        Args:
+            observed: İki beklenen grab dönüşü arası süre (saniye)
+        """
+        if observed <= 0:
+            return
+        self._intervals.append(observed)
+        if len(self._intervals) >= self.INTERVAL_MIN_SAMPLES:
+            self.interval = sorted(self._intervals)[len(self._intervals) // 5]
+
+    def age_ms(self) -> float:
+        """Son okunan frame'in şu anki yaşı (ms)."""
+        return (time.perf_counter() - self.captured) * 1000.0
+
+    def should_drop(self) -> bool:
+        """
+        Son okunan frame işlenmeden atılmalı mı? (istatistikleri günceller)
+
+        Returns:
+            True: Frame bayat, bir sonraki frame'i oku
+        """
+        age = self.age_ms()
+        self.max_seen_age_ms = max(self.max_seen_age_ms, age)
+
+        if (self.max_age_ms > 0 and age > self.max_age_ms
+                and self._consecutive_drops < self.max_consecutive_drops):
+            self._consecutive_drops += 1
+            self.dropped += 1
+            return True
+
+        self._consecutive_drops = 0
+        self.last_age_ms = age
+        return False
+
+    def apply_settings(self, changes: Dict[str, Any]):
+        """
+        Canlı ayar değişikliklerini uygular.
+
+        Args:
+            changes: {ayar anahtarı: yeni değer} (sadece SETTINGS_KEYS)
+        """
+        if 'FRAME_MAX_AGE_MS' in changes:
+            self.max_age_ms = max(0.0, float(changes['FRAME_MAX_AGE_MS']))
@@ -0,0 +1,322 @@
+"""
+Frame Source Modülü
+Görüntü kaynakları: canlı kamera, video dosyası, resim klasörü ve sentetik üretici.
+
+Hepsi cv2.VideoCapture'ın kullanılan alt kümesini (isOpened / grab / retrieve /
+read / release) sağlar; işleme döngüsü kaynağın türünü bilmez. Dosya ve
+sentetik kaynaklar gerçek zamanlı (kaydedilen FPS'te) veya olabildiğince hızlı
+oynatılabilir; böylece tüm algılama hattı web kamerası olmayan bir makinede
+(CI) tekrarlanabilir şekilde profillenebilir.
+
+Her kaynak son frame'in yakalama zamanını `captured` (perf_counter) olarak
+bildirir; FrameClock canlı kamera dışındaki kaynaklarda bunu kullanır.
+"""
+
+import math
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent))
+from camera_mode import open_camera
+
+
+# Resim klasöründe okunan uzantılar
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.webp')
+
+
+class FrameSource:
+    """
+    Kaynak arayüzü (cv2.VideoCapture uyumlu alt küme).
+    Alt sınıflar _next_frame() uygular; hız ayarı burada yapılır.
+    """
+
+    def __init__(self, fps: float = 30.0, realtime: bool = True, loop: bool = False):
+        """
+        FrameSource sınıfını başlatır.
+
+        Args:
+            fps: Kaynağın frame hızı
+            realtime: True ise frame'ler fps hızında verilir, False ise beklemeden
+            loop: Kaynak bitince başa dön
+        """
+        self.fps = fps if fps and fps > 0 else 30.0
+        self.realtime = realtime
+        self.loop = loop
+        self.captured: Optional[float] = None   # Son frame'in yakalama zamanı
+        self.frame_count = 0                    # Verilen frame sayısı
+        self._frame: Optional[np.ndarray] = None
+        self._start: Optional[float] = None
+
+    def isOpened(self) -> bool:
+        """Kaynak kullanılabilir mi?"""
+        return True
+
+    def grab(self) -> bool:
+        """Sıradaki frame'i hazırlar (gerçek zamanlı modda zamanı gelene kadar bekler)."""
+        frame = self._next_frame()
+        if frame is None and self.loop and self.frame_count:
+            self._rewind()
+            frame = self._next_frame()
+        if frame is None:
+            return False
+
+        if self._start is None:
+            self._start = time.perf_counter()
+        if self.realtime:
+            due = self._start + self.frame_count / self.fps
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.captured = due
+        else:
+            self.captured = time.perf_counter()
+
+        self.frame_count += 1
+        self._frame = frame
+        return True
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """grab() ile hazırlanan frame (kaynak kendi kopyasını tutmaz)."""
+        frame, self._frame = self._frame, None
+        return frame is not None, frame
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """grab() + retrieve()."""
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def release(self):
+        """Kaynağı kapatır."""
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        """Sıradaki frame (bittiyse None)."""
+        raise NotImplementedError
+
+    def _rewind(self):
+        """Başa döner (loop için)."""
+
+
+class CameraSource:
+    """
+    Canlı kamera (kayıtlı / ölçülen en hızlı modla açılır).
+    Kamera kendi hızında frame ürettiği için hız ayarı ve `captured` yoktur:
+    yakalama zamanını FrameClock grab() süresinden tahmin eder. `mode` açılış
+    modudur (ölçüldüyse measured_fps kameranın gerçek hızıdır).
+    """
+
+    def __init__(self, index: int, width: int, height: int, fps: int, negotiate: bool = True):
+        """
+        CameraSource sınıfını başlatır.
+
+        Args:
+            index: OpenCV kamera index'i
+            width, height, fps: Hedef mod
+            negotiate: Backend / FOURCC modu ölçülsün mü (bkz. camera_mode)
+        """
+        self.capture, self.mode = open_camera(index, width, height, fps, negotiate=negotiate)
+        # Kameranın gerçek hızı (ölçüldüyse) - FrameClock aralığı buna göre kurar
+        self.fps = self.mode.measured_fps or fps
+        self.queue_frames = self.mode.queue_frames
+
+    def isOpened(self) -> bool:
+        """Kamera açık mı?"""
+        return self.capture.isOpened()
+
+    def grab(self) -> bool:
+        """Sıradaki frame'i kameradan alır."""
+        return self.capture.grab()
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """grab() ile alınan frame'i çözer."""
+        return self.capture.retrieve()
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """grab() + retrieve()."""
+        return self.capture.read()
+
+    def release(self):
+        """Kamerayı kapatır."""
+        self.capture.release()
+
+
+class VideoFileSource(FrameSource):
+    """Video dosyası (FPS dosyadan okunur)."""
+
+    def __init__(self, path: str, realtime: bool = True, loop: bool = False):
+        """
+        VideoFileSource sınıfını başlatır.
+
+        Args:
+            path: Video dosyası
+            realtime: Kaydedilen FPS'te oynat
+            loop: Bitince başa dön
+        """
+        self.path = path
+        self.capture = cv2.VideoCapture(path)
+        super().__init__(self.capture.get(cv2.CAP_PROP_FPS), realtime, loop)
+
+    def isOpened(self) -> bool:
+        """Dosya açılabildi mi?"""
+        return self.capture.isOpened()
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        """Dosyadaki sıradaki frame."""
+        success, frame = self.capture.read()
+        return frame if success else None
+
+    def _rewind(self):
+        """İlk frame'e sarar."""
+        self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self):
+        """Dosyayı kapatır."""
+        self.capture.release()
+
+
+class ImageDirectorySource(FrameSource):
+    """Klasördeki resimler (dosya adı sırasıyla)."""
+
+    def __init__(self, path: str, fps: float = 30.0, realtime: bool = True, loop: bool = False):
+        """
+        ImageDirectorySource sınıfını başlatır.
+
+        Args:
+            path: Resim klasörü
+            fps: Oynatma hızı
+            realtime: fps hızında oynat
+            loop: Bitince başa dön
+        """
+        super().__init__(fps, realtime, loop)
+        self.files: List[Path] = sorted(p for p in Path(path).iterdir()
+                                        if p.suffix.lower() in IMAGE_EXTENSIONS)
+        self._position = 0
+
+    def isOpened(self) -> bool:
+        """Klasörde resim var mı?"""
+        return bool(self.files)
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        """Sıradaki okunabilen resim (okunamayan dosyalar atlanır)."""
+        while self._position < len(self.files):
+            frame = cv2.imread(str(self.files[self._position]))
+            self._position += 1
+            if frame is not None:
+                return frame
+        return None
+
+    def _rewind(self):
+        """İlk resme döner."""
+        self._position = 0
+
+
+class SyntheticSource(FrameSource):
+    """
+    El şeklinde test deseni üretir: avuç + beş parmak ekranda Lissajous
+    eğrisiyle dolaşır, işaret parmağı periyodik olarak başparmağa yaklaşır (pinch).
+    """
+
+    # Deri tonu (BGR) ve arka plan
+    SKIN = (120, 160, 215)
+    BACKGROUND = (40, 40, 40)
+
+    def __init__(self, width: int = 640, height: int = 480, fps: float = 30.0,
+                 realtime: bool = True, frames: int = 0):
+        """
+        SyntheticSource sınıfını başlatır.
+
+        Args:
+            width, height: Frame boyutu
+            fps: Üretim hızı
+            realtime: fps hızında üret
+            frames: Üretilecek frame sayısı (0 = sınırsız)
+        """
+        super().__init__(fps, realtime, loop=False)
+        self.width = width
+        self.height = height
+        self.frames = frames
+
+        # Arka plan bir kez oluşturulur, her frame'de kopyalanır
+        self._background = np.full((height, width, 3), self.BACKGROUND, dtype=np.uint8)
+
+    def _next_frame(self) -> Optional[np.ndarray]:
+        """Zamana göre hareket eden el deseni (frames dolduysa None)."""
+        if self.frames and self.frame_count >= self.frames:
+            return None
+
+        t = self.frame_count / self.fps
+        frame = self._background.copy()
+        scale = self.height / 480.0
+
+        # Avuç merkezi: yavaş Lissajous hareketi
+        cx = int(self.width * (0.5 + 0.25 * math.sin(t * 0.9)))
+        cy = int(self.height * (0.6 + 0.15 * math.sin(t * 1.3)))
+        palm = (int(55 * scale), int(65 * scale))
+        cv2.ellipse(frame, (cx, cy), palm, 0, 0, 360, self.SKIN, -1, cv2.LINE_AA)
+
+        # Parmaklar: (açı derece, uzunluk) - başparmak yanda, diğerleri yukarı
+        pinch = max(0.0, math.sin(t * 2.0))  # 0 = açık, 1 = işaret başparmağa değiyor
+        fingers = [(-150 + 35 * pinch, 70), (-105 + 30 * pinch, 95), (-90, 105), (-75, 95), (-60, 75)]
+        thickness = max(2, int(22 * scale))
+        for angle, length in fingers:
+            rad = math.radians(angle)
+            base = (int(cx + palm[0] * 0.7 * math.cos(rad)), int(cy + palm[1] * 0.7 * math.sin(rad)))
+            tip = (int(base[0] + length * scale * math.cos(rad)),
+                   int(base[1] + length * scale * math.sin(rad)))
+            cv2.line(frame, base, tip, self.SKIN, thickness, cv2.LINE_AA)
+            cv2.circle(frame, tip, thickness // 2, self.SKIN, -1, cv2.LINE_AA)
+        return frame
+
+
+def open_source(spec: Optional[str],
+                camera_index: int = 0,
+                width: int = 640,
+                height: int = 480,
+                fps: int = 30,
+                realtime: bool = True,
+                loop: bool = False,
+                negotiate: bool = True):
+    """
+    Komut satırı tanımından kaynak oluşturur.
+
+    Tanımlar:
+        None / 'camera'      → Config kamerası (camera_index)
+        '2'                  → 2 numaralı kamera
+        'synthetic'          → sınırsız sentetik desen
+        'synthetic:300'      → 300 frame sentetik desen
+        klasör yolu          → resim dizisi
+        dosya yolu           → video dosyası
+
+    Args:
+        spec: Kaynak tanımı
+        camera_index: Varsayılan kamera
+        width, height, fps: Kamera / sentetik boyut ve hız
+        realtime: Dosya / sentetik kaynakları gerçek zamanlı oynat
+        loop: Dosya / klasör bitince başa dön
+        negotiate: Kamera modu ölçülsün mü
+
+    Returns:
+        Kaynak nesnesi (açılamadıysa isOpened() False)
+
+    Raises:
+        ValueError: Tanım anlaşılamadıysa
+    """
+    if spec is None or spec == 'camera':
+        return CameraSource(camera_index, width, height, fps, negotiate)
+    if spec.isdigit():
+        return CameraSource(int(spec), width, height, fps, negotiate)
+    if spec == 'synthetic' or spec.startswith('synthetic:'):
+        frames = int(spec.partition(':')[2] or 0)
+        return SyntheticSource(width, height, fps, realtime, frames)
+
+    path = Path(spec)
+    if path.is_dir():
+        return ImageDirectorySource(spec, fps, realtime, loop)
+    if path.is_file():
+        return VideoFileSource(spec, realtime, loop)
+    raise ValueError(f"Bilinmeyen görüntü kaynağı: {spec}")
@@ -5,7 +5,7 @@ El landmark'larından jest tanıma ve yorumlama işlemleri.
 
 import math
 import time
-from typing import Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
 from collections import deque
 
 
@@ -15,6 +15,9 @@ class GestureRecognizer:
     Parmak pozisyonlarından hareketle mouse komutlarını belirler.
     """
     
+    # Çalışırken uygulanabilen ayarlar (bkz. apply_settings)
+    SETTINGS_KEYS = ('PINCH_THRESHOLD', 'STABLE_FRAMES')
+    
     def __init__(self, 
                  pinch_threshold: int = 40,
                  stable_frames: int = 3):
@@ -442,6 +445,19 @@ class GestureRecognizer:
         """
         self.pinch_threshold = max(10, min(threshold, 100))
     
+    def apply_settings(self, changes: Dict[str, Any]):
+        """
+        Canlı ayar değişikliklerini uygular.
+        
+        Args:
+            changes: {ayar anahtarı: yeni değer} (sadece SETTINGS_KEYS)
+        """
+        if 'PINCH_THRESHOLD' in changes:
+            self.set_pinch_threshold(changes['PINCH_THRESHOLD'])
+        if 'STABLE_FRAMES' in changes:
+            self.stable_frames = max(1, int(changes['STABLE_FRAMES']))
+            self.gesture_history = deque(self.gesture_history, maxlen=self.stable_frames)
+    
     def is_finger_up(self, landmarks: List[Tuple[int, int]], finger_id: int) -> bool:
         """
         Belirli bir parmağın açık (yukarıda) olup olmadığını kontrol eder.
@@ -23,13 +23,22 @@ from src.gesture_recognizer import GestureRecognizer
 from src.volume_controller import VolumeController
 from src.speech_to_text import SpeechToText
 from src.overlay_display import OverlayDisplay
-from src.config_manager import ConfigManager
+from src.settings_service import get_settings_service
+from src.camera_discovery import get_camera_discovery
+from src.camera_mode import open_camera
+from src.frame_clock import FrameClock
+from src.annotations import CachedLayer, DisplayList, text_box
+from src.ema_curve import EmaCurve
+from src.live_settings import LiveSettings
 from src import config as config_module  # Reload için modül referansı
 
 
 class HandMouseGUI:
     """Ana GUI sınıfı"""
     
+    # Çalışırken değiştirilemeyen ayarlar (kamera / mikrofon yeniden açılmalı)
+    RESTART_KEYS = ('CAMERA_INDEX', 'CAMERA_FPS', 'SPEECH_LANGUAGE', 'SPEECH_MICROPHONE_INDEX')
+    
     def __init__(self):
         """GUI'yi başlat"""
         # Tema ayarla
@@ -48,6 +57,8 @@ class HandMouseGUI:
         
         # Hand Mouse bileşenleri
         self.camera = None
+        self.camera_mode = None  # Açılış modu (camera_mode.CameraMode)
+        self.frame_clock = None
         self.hand_detector = None
         self.mouse_controller = None
         self.gesture_recognizer = None
@@ -59,16 +70,40 @@ class HandMouseGUI:
         self.process_thread = None
         self.running_flag = False
         
-        # Config Manager
-        self.config_manager = ConfigManager()
+        # Ayar servisi (settings.json: şema doğrulama, atomik kayıt, değişiklik izleme)
+        self.settings_service = get_settings_service()
+        
+        # Çalışan sisteme canlı ayar yayını (sistem başlatılınca oluşturulur)
+        self.live_settings = None
+        
+        # Kamera listesi önbelleği (paralel tarama, disk önbelleği)
+        self.camera_discovery = get_camera_discovery()
+        self.camera_opening = False  # Başlat: kamera arka planda açılıyor / mod ölçülüyor
+        self.camera_scan_busy = {Config.CAMERA_INDEX}  # Son taramada açılmayan index'ler
         
         # Kamera görüntüsü
         self.camera_label = None
         self.current_frame = None
         
+        # Önizleme: çizim katmanları sadece gösterilecek frame'e işlenir
+        # (dead zone katmanı kırpma / çözünürlük değişince maskeye bir kez çizilir)
+        self.static_layer = CachedLayer(lambda w, h, crop: self._build_static_layer(w, h, crop).to_mask(w, h))
+        self.status_layer = DisplayList()
+        self.preview_visible = True
+        self._last_preview = 0.0
+        
         # UI oluştur
         self.create_widgets()
         
+        # settings.json dışarıdan düzenlenirse doğrulanmış farkları canlı uygula
+        self.settings_service.add_listener(self._on_settings_file_changed)
+        self.settings_service.start_watching()
+        
+        # Kamera listesini arka planda tazele (dropdown önbellekten doldu).
+        # Ayarlı kamera taranmaz: tarama sürerken BAŞLAT'a basılırsa cihaz için yarışılmasın
+        self.camera_discovery.add_listener(self._on_cameras_discovered)
+        self.camera_discovery.refresh_async(busy=self.camera_scan_busy)
+        
     def create_widgets(self):
         """UI bileşenlerini oluştur"""
         # Ana grid layout (2 sütun)
@@ -219,56 +254,35 @@ class HandMouseGUI:
         # Kamera Seçimi
         ctk.CTkLabel(tab, text="Kamera:", font=ctk.CTkFont(size=12, weight="bold")).pack(anchor="w", pady=(10,5), padx=10)
         
-        # Kamera listesini al
-        camera_list = self.get_available_cameras()
+        # Kamera listesi önbellekten anında doldurulur, tarama arka planda yapılır
+        camera_options = self._camera_options(self.camera_discovery.cameras())
+        self.camera_index_var = ctk.StringVar(value=self._current_camera_option(camera_options))
+        self.camera_dropdown = ctk.CTkOptionMenu(
+            tab,
+            variable=self.camera_index_var,
+            values=camera_options,
+            width=400
+        )
+        self.camera_dropdown.pack(fill="x", padx=10, pady=5)
         
-        if camera_list:
-            # Dropdown için değerler (index: name formatında)
-            camera_options = [f"{idx}: {name}" for idx, name in camera_list]
-            
-            # Mevcut seçili index'i bul
-            current_idx = Config.CAMERA_INDEX
-            # Mevcut index listede var mı kontrol et
-            current_value = None
-            for idx, name in camera_list:
-                if idx == current_idx:
-                    current_value = f"{idx}: {name}"
-                    break
-            
-            # Bulunamadıysa ilkini seç
-            if current_value is None:
-                current_value = camera_options[0]
-            
-            self.camera_index_var = ctk.StringVar(value=current_value)
-            camera_dropdown = ctk.CTkOptionMenu(
-                tab,
-                variable=self.camera_index_var,
-                values=camera_options,
-                width=400
-            )
-            camera_dropdown.pack(fill="x", padx=10, pady=5)
-            
-            # Yenile butonu
-            refresh_camera_btn = ctk.CTkButton(
-                tab,
-                text="🔄 Yenile",
-                command=self.refresh_cameras,
-                width=100,
-                height=25
-            )
-            refresh_camera_btn.pack(anchor="w", padx=10, pady=5)
-            
-            # Bilgi
-            info_label = ctk.CTkLabel(
-                tab,
-                text="💡 Sistemi DURDUR → BAŞLAT yaparak yeni kamerayı aktif edin",
-                font=ctk.CTkFont(size=10),
-                text_color="gray"
-            )
-            info_label.pack(anchor="w", padx=10, pady=5)
-        else:
-            ctk.CTkLabel(tab, text="❌ Kamera bulunamadı!", text_color="red").pack(anchor="w", padx=10)
-            self.camera_index_var = ctk.StringVar(value="0: Kamera bulunamadı")
+        # Yenile butonu
+        refresh_camera_btn = ctk.CTkButton(
+            tab,
+            text="🔄 Yenile",
+            command=self.refresh_cameras,
+            width=100,
+            height=25
+        )
+        refresh_camera_btn.pack(anchor="w", padx=10, pady=5)
+        
+        # Bilgi
+        info_label = ctk.CTkLabel(
+            tab,
+            text="💡 Sistemi DURDUR → BAŞLAT yaparak yeni kamerayı aktif edin",
+            font=ctk.CTkFont(size=10),
+            text_color="gray"
+        )
+        info_label.pack(anchor="w", padx=10, pady=5)
         
         # FPS
         ctk.CTkLabel(tab, text="Hedef FPS:", font=ctk.CTkFont(size=12, weight="bold")).pack(anchor="w", pady=(15,5))
@@ -323,6 +337,51 @@ class HandMouseGUI:
         self.ema_func_var = ctk.StringVar(value=Config.EMA_FUNCTION)
         ctk.CTkSegmentedButton(tab, values=["linear", "exponential", "sigmoid"], variable=self.ema_func_var).pack(fill="x", padx=10)
         
+        # EMA eğrisi grafiği (hız → alpha)
+        ctk.CTkLabel(tab, text="EMA Eğrisi (Hız → Alpha):", font=ctk.CTkFont(size=12, weight="bold")).pack(anchor="w", pady=(15,5))
+        self.ema_curve = EmaCurve()
+        self.ema_canvas = ctk.CTkCanvas(tab, height=140, bg="#1a1a1a", highlightthickness=0)
+        self.ema_canvas.pack(fill="x", padx=10, pady=(0, 10))
+        self.ema_canvas.bind("<Configure>", lambda event: self.draw_ema_curve())
+        for var in (self.ema_min_var, self.ema_max_var, self.ema_func_var):
+            var.trace_add("write", lambda *args: self.draw_ema_curve())
+        
+    def draw_ema_curve(self):
+        """Mouse sekmesindeki EMA eğrisini GUI değerleriyle yeniden çizer"""
+        canvas = self.ema_canvas
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if width < 20 or height < 20:
+            return  # Henüz yerleşmedi
+        
+        self.ema_curve.configure(
+            self.ema_min_var.get(), self.ema_max_var.get(), self.ema_func_var.get(),
+            Config.SPEED_MIN, Config.SPEED_MAX,
+            Config.SIGMOID_STEEPNESS, Config.SIGMOID_MIDPOINT
+        )
+        
+        canvas.delete("all")
+        pad = 20
+        plot_w = width - 2 * pad
+        plot_h = height - 2 * pad
+        
+        # Eksenler (alpha 0.0 - 1.0, hız 0 - tablo sonu)
+        canvas.create_line(pad, height - pad, width - pad, height - pad, fill="gray")
+        canvas.create_line(pad, pad, pad, height - pad, fill="gray")
+        canvas.create_text(pad + 2, pad - 10, text="alpha", fill="gray", anchor="w", font=("Consolas", 8))
+        canvas.create_text(width - pad, height - pad + 10, text=f"{self.ema_curve.max_speed:.0f} px/frame",
+                           fill="gray", anchor="e", font=("Consolas", 8))
+        
+        # Eğri (her piksel sütunu için bir nokta)
+        points = self.ema_curve.points()
+        step = max(1, len(points) // plot_w)
+        coords = []
+        for speed, alpha in points[::step]:
+            coords.append(pad + speed / self.ema_curve.max_speed * plot_w)
+            coords.append(height - pad - alpha * plot_h)
+        if len(coords) >= 4:
+            canvas.create_line(*coords, fill="#4CAF50", width=2)
+        
     def create_visual_tab(self):
         """Görsel ayarlar sekmesi"""
         tab = self.tabview.tab("🎨 Görsel")
@@ -444,63 +503,60 @@ class HandMouseGUI:
         # Timeout - KALDIRILDI (artık sürekli dinliyor, gerekli değil)
         # Auto Enter checkbox - KALDIRILDI (artık her cümleden sonra boşluk ekleniyor)
     
-    def get_available_cameras(self, max_test=10):
+    def _camera_options(self, cameras, missing="aranıyor..."):
         """
-        Mevcut kameraları tespit et ve isimlerini al.
-        pygrabber'ın isimleri OpenCV index'leriyle uyuşmadığı için
-        doğrudan test ederek eşleştirme yapıyoruz.
+        Dropdown değerleri ("index: isim" formatında).
+        Ayarlı kamera listede yoksa (taranmadı / kullanımda / bulunamadı) onun için
+        yer tutucu eklenir; böylece seçim başka kameraya kaymaz ve kaydedilen index değişmez.
         
         Args:
-            max_test: Test edilecek maksimum kamera sayısı
+            cameras: CameraInfo listesi
+            missing: Ayarlı kamera taranmış ama bulunamamışsa yer tutucu durumu
             
         Returns:
-            List[tuple]: [(index, name), ...] formatında kamera listesi
+            List[str]: Seçenekler (index sırasıyla)
         """
-        available_cameras = []
-        
-        # Doğrudan OpenCV index'lerini test et
-        print("� Kameralar test ediliyor...")
-        
-        for i in range(max_test):
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                # Kamera çalışıyor - backend'den isim almayı dene
-                backend_name = cap.getBackendName()
-                
-                # Kamera özelliklerini al
-                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                fps = int(cap.get(cv2.CAP_PROP_FPS))
-                
-                # Basit isim oluştur (index + özellikler)
-                camera_name = f"Kamera {i} ({width}x{height}@{fps}fps)"
-                
-                available_cameras.append((i, camera_name))
-                print(f"   ✅ [{i}] {camera_name}")
-                
-                cap.release()
-        
-        if not available_cameras:
-            print("   ❌ Hiç kamera bulunamadı!")
-        
-        return available_cameras
+        entries = [(camera.index, camera.label) for camera in cameras]
+        index = Config.CAMERA_INDEX
+        if not any(camera.index == index for camera in cameras):
+            status = "kullanımda" if index in self.camera_scan_busy else missing
+            entries.append((index, f"{index}: Kamera {index} ({status})"))
+        return [label for _, label in sorted(entries)]
+    
+    def _current_camera_option(self, options):
+        """Config.CAMERA_INDEX'e karşılık gelen seçenek (yoksa ilki)."""
+        prefix = f"{Config.CAMERA_INDEX}:"
+        return next((option for option in options if option.startswith(prefix)), options[0])
     
     def refresh_cameras(self):
-        """Kamera listesini yenile"""
-        camera_list = self.get_available_cameras()
-        
-        if camera_list:
-            print(f"🔄 Kamera listesi yenilendi:")
-            for idx, name in camera_list:
-                print(f"   [{idx}] {name}")
-            print("   Sistemi yeniden başlatın")
-        else:
+        """Kamera listesini arka planda yeniden tara (kullanımdaki kamera açılmaz)"""
+        print("🔍 Kameralar taranıyor...")
+        busy = {Config.CAMERA_INDEX} if self.is_running or self.camera_opening else set()
+        # Önceki tarama sürüyorsa onun sonucu gelir: yer tutucu durumu ona göre kalır
+        if self.camera_discovery.refresh_async(busy=busy):
+            self.camera_scan_busy = busy
+    
+    def _on_cameras_discovered(self, cameras):
+        """Tarama bitti (tarama thread'i) - dropdown GUI thread'inde güncellenir"""
+        self.root.after(0, self._update_camera_dropdown, cameras)
+    
+    def _update_camera_dropdown(self, cameras):
+        """Dropdown'u yeni listeyle günceller (kullanıcının seçimi korunur)"""
+        if not cameras:
             print("❌ Hiç kamera bulunamadı!")
+        for camera in cameras:
+            print(f"   ✅ {camera.label} [{camera.backend} {camera.fourcc}]")
+        options = self._camera_options(cameras, missing="bulunamadı")
+        
+        selected = self.camera_index_var.get().split(':')[0] + ':'
+        current = next((option for option in options if option.startswith(selected)), None)
+        self.camera_dropdown.configure(values=options)
+        self.camera_index_var.set(current or self._current_camera_option(options))
     
     def refresh_microphones(self):
         """Mikrofon listesini yenile"""
         from src.speech_to_text import SpeechToText
-        mic_list = SpeechToText.get_microphone_list()
+        mic_list = SpeechToText.get_microphone_list(refresh=True)
         
         if mic_list:
             mic_options = [f"{idx}: {name}" for idx, name in mic_list]
@@ -539,7 +595,8 @@ class HandMouseGUI:
             print("💬 ŞİMDİ MİKROFONA KONUŞUN!")
             print("="*60 + "\n")
             
-            working_mic_idx = SpeechToText.detect_working_microphone(test_duration=1.5)
+            # Kullanıcı açıkça test istedi: önbelleği atla (sonuçlar önbelleğe yazılır)
+            working_mic_idx = SpeechToText.detect_working_microphone(test_duration=1.5, use_cache=False)
             
             if working_mic_idx is not None:
                 # Çalışan mikrofon bulundu!
@@ -624,86 +681,129 @@ class HandMouseGUI:
                     self.camera = None
                     time.sleep(0.5)  # Kameranın kapanması için bekle
                 
-                # Kamerayı başlat
-                self.camera = cv2.VideoCapture(Config.CAMERA_INDEX)
-                self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, Config.CAMERA_WIDTH)
-                self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, Config.CAMERA_HEIGHT)
-                self.camera.set(cv2.CAP_PROP_FPS, Config.CAMERA_FPS)
-                self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                
-                if not self.camera.isOpened():
-                    messagebox.showerror("Hata", "Kamera açılamadı!")
-                    return
-                
-                # Modülleri başlat (yeni Config ile)
-                self.hand_detector = HandDetector(
-                    max_hands=Config.MAX_HANDS,
-                    detection_confidence=Config.DETECTION_CONFIDENCE,
-                    tracking_confidence=Config.TRACKING_CONFIDENCE
-                )
-                
-                self.mouse_controller = MouseController(
-                    camera_width=Config.CAMERA_WIDTH,
-                    camera_height=Config.CAMERA_HEIGHT,
-                    smoothing_factor=Config.MOUSE_SMOOTHING,
-                    speed_multiplier=Config.MOUSE_SPEED
-                )
-                
-                self.gesture_recognizer = GestureRecognizer(
-                    pinch_threshold=Config.PINCH_THRESHOLD,
-                    stable_frames=Config.STABLE_FRAMES
-                )
-                
-                self.volume_controller = VolumeController()
-                
-                # Sesli yazma sistemi (güvenli başlatma)
-                self.speech_to_text = None
-                if Config.SPEECH_ENABLED:
-                    try:
-                        print("\n🎤 Sesli yazma sistemi başlatılıyor...")
-                        self.speech_to_text = SpeechToText(
-                            language=Config.SPEECH_LANGUAGE,
-                            microphone_index=Config.SPEECH_MICROPHONE_INDEX
-                        )
-                        
-                        if self.speech_to_text.is_available():
-                            print("✅ Sesli yazma sistemi aktif!")
-                        else:
-                            print("⚠️ Sesli yazma sistemi kullanılamıyor (mikrofon/kütüphane eksik)")
-                            self.speech_to_text = None
-                    except Exception as e:
-                        print(f"❌ Sesli yazma başlatılamadı: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        self.speech_to_text = None
-                else:
-                    print("ℹ️ Sesli yazma devre dışı (Config.SPEECH_ENABLED=False)")
-                
-                # Overlay başlat (eğer aktifse)
-                if self.overlay_var.get():  # ✅ overlay_var kullan
-                    self.overlay = OverlayDisplay(position='topright')
-                    self.overlay.start()
-                    time.sleep(0.3)
-                
-                print("✨ Sistem sıfırdan başlatıldı - Yeni ayarlar uygulandı!")
-                
-                # Thread başlat
-                self.running_flag = True
-                self.is_running = True
-                self.is_paused = False
-                self.process_thread = threading.Thread(target=self.process_loop, daemon=True)
-                self.process_thread.start()
-                
-                # UI güncelle
-                self.start_button.configure(text="⏹️ DURDUR", fg_color="red", hover_color="darkred")
-                self.pause_button.configure(state="normal")
-                self.status_label.configure(text="✅ Sistem Çalışıyor")
+                # Kamerayı arka planda aç: kayıtlı mod yoksa backend / format ölçümü
+                # saniyeler sürer, pencere donmasın. Açılınca _finish_start devam eder.
+                self.camera_opening = True
+                self.start_button.configure(state="disabled")
+                self.status_label.configure(text="📷 Kamera açılıyor (ilk seferde mod ölçülür)...")
+                threading.Thread(target=self._open_camera_thread, daemon=True).start()
                 
             except Exception as e:
                 messagebox.showerror("Başlatma Hatası", str(e))
                 import traceback
                 traceback.print_exc()
     
+    def _open_camera_thread(self):
+        """Kamerayı açar (arka plan thread'i) - sonuç GUI thread'ine aktarılır"""
+        camera = mode = None
+        try:
+            # Kayıtlı / ölçülen en hızlı backend + piksel formatı ile
+            camera, mode = open_camera(Config.CAMERA_INDEX, Config.CAMERA_WIDTH, Config.CAMERA_HEIGHT,
+                                       Config.CAMERA_FPS, negotiate=Config.CAMERA_NEGOTIATE)
+        except Exception as e:
+            print(f"❌ Kamera açma hatası: {e}")
+        self.root.after(0, self._finish_start, camera, mode)
+    
+    def _finish_start(self, camera, mode):
+        """Kamera açıldıktan sonra modülleri başlatır (GUI thread'i)"""
+        self.camera_opening = False
+        self.start_button.configure(state="normal")
+        if camera is None or not camera.isOpened():
+            if camera is not None:
+                camera.release()
+            self.status_label.configure(text="⏹️ Sistem Durduruldu")
+            messagebox.showerror("Hata", "Kamera açılamadı!")
+            return
+        
+        try:
+            self.camera = camera
+            self.camera_mode = mode
+            
+            # Frame yakalama zamanı + bayat frame atma
+            # (kameranın ölçülen hızı ve kuyruk derinliği ile; ölçülmediyse hedef FPS)
+            self.frame_clock = FrameClock(fps=mode.measured_fps or Config.CAMERA_FPS,
+                                          max_age_ms=Config.FRAME_MAX_AGE_MS,
+                                          queue_frames=mode.queue_frames)
+            
+            # Modülleri başlat (yeni Config ile)
+            self.hand_detector = HandDetector(
+                max_hands=Config.MAX_HANDS,
+                detection_confidence=Config.DETECTION_CONFIDENCE,
+                tracking_confidence=Config.TRACKING_CONFIDENCE
+            )
+            
+            self.mouse_controller = MouseController(
+                camera_width=Config.CAMERA_WIDTH,
+                camera_height=Config.CAMERA_HEIGHT,
+                smoothing_factor=Config.MOUSE_SMOOTHING,
+                speed_multiplier=Config.MOUSE_SPEED
+            )
+            
+            self.gesture_recognizer = GestureRecognizer(
+                pinch_threshold=Config.PINCH_THRESHOLD,
+                stable_frames=Config.STABLE_FRAMES
+            )
+            
+            self.volume_controller = VolumeController()
+            
+            # Sesli yazma sistemi (güvenli başlatma)
+            self.speech_to_text = None
+            if Config.SPEECH_ENABLED:
+                try:
+                    print("\n🎤 Sesli yazma sistemi başlatılıyor...")
+                    self.speech_to_text = SpeechToText(
+                        language=Config.SPEECH_LANGUAGE,
+                        microphone_index=Config.SPEECH_MICROPHONE_INDEX
+                    )
+                    
+                    if self.speech_to_text.is_available():
+                        print("✅ Sesli yazma sistemi aktif!")
+                    else:
+                        print("⚠️ Sesli yazma sistemi kullanılamıyor (mikrofon/kütüphane eksik)")
+                        self.speech_to_text = None
+                except Exception as e:
+                    print(f"❌ Sesli yazma başlatılamadı: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    self.speech_to_text = None
+            else:
+                print("ℹ️ Sesli yazma devre dışı (Config.SPEECH_ENABLED=False)")
+            
+            # Overlay başlat (eğer aktifse)
+            if self.overlay_var.get():  # ✅ overlay_var kullan
+                self.overlay = OverlayDisplay(position='topright', max_rate=Config.OVERLAY_MAX_FPS,
+                                              renderer=Config.OVERLAY_RENDERER)
+                self.overlay.start(master=self.root)  # GUI'nin Tk kökünde (ikinci Tk yok)
+            
+            # Canlı ayar yayını: bileşenler sadece kendi ayar farklarını alır
+            self.live_settings = LiveSettings(self._collect_settings())
+            self.live_settings.attach([
+                (MouseController.SETTINGS_KEYS, self.mouse_controller.apply_settings),
+                (HandDetector.SETTINGS_KEYS, self.hand_detector.apply_settings),
+                (GestureRecognizer.SETTINGS_KEYS, self.gesture_recognizer.apply_settings),
+                (VolumeController.SETTINGS_KEYS, self.volume_controller.apply_settings),
+                (FrameClock.SETTINGS_KEYS, self.frame_clock.apply_settings),
+            ])
+            
+            print("✨ Sistem sıfırdan başlatıldı - Yeni ayarlar uygulandı!")
+            
+            # Thread başlat
+            self.running_flag = True
+            self.is_running = True
+            self.is_paused = False
+            self.process_thread = threading.Thread(target=self.process_loop, daemon=True)
+            self.process_thread.start()
+            
+            # UI güncelle
+            self.start_button.configure(text="⏹️ DURDUR", fg_color="red", hover_color="darkred")
+            self.pause_button.configure(state="normal")
+            self.status_label.configure(text="✅ Sistem Çalışıyor")
+            
+        except Exception as e:
+            messagebox.showerror("Başlatma Hatası", str(e))
+            import traceback
+            traceback.print_exc()
+    
     def stop_system(self):
         """Sistemi tamamen kapat (tüm modülleri yok et)"""
         print("🛑 Sistem kapatılıyor...")
@@ -738,6 +838,11 @@ class HandMouseGUI:
                 print("✅ Thread durduruldu")
                 self.process_thread = None
             
+            # Canlı ayar bağlantılarını kopar
+            if self.live_settings:
+                self.live_settings.detach()
+                self.live_settings = None
+            
             # Kamerayı kapat
             if self.camera:
                 print("📷 Kamera kapatılıyor...")
@@ -762,6 +867,13 @@ class HandMouseGUI:
                 self.speech_to_text = None
                 print("✅ Sesli yazma kapatıldı")
             
+            # Input arka ucunu kapat
+            if self.mouse_controller:
+                try:
+                    self.mouse_controller.close()
+                except:
+                    pass
+            
             # Tüm modülleri yok et (yeni başlatmada sıfırdan oluşturulacak)
             self.hand_detector = None
             self.mouse_controller = None
@@ -794,8 +906,9 @@ class HandMouseGUI:
         
         if self.is_running:
             if self.overlay_var.get() and not self.overlay:  # ✅ overlay_var
-                self.overlay = OverlayDisplay(position='topright')
-                self.overlay.start()
+                self.overlay = OverlayDisplay(position='topright', max_rate=Config.OVERLAY_MAX_FPS,
+                                              renderer=Config.OVERLAY_RENDERER)
+                self.overlay.start(master=self.root)
             elif not self.overlay_var.get() and self.overlay:  # ✅ overlay_var
                 self.overlay.stop()
                 self.overlay = None
@@ -858,18 +971,31 @@ class HandMouseGUI:
                 time.sleep(0.1)
                 continue
             
-            success, frame = self.camera.read()
+            success, frame = self.frame_clock.read(self.camera)
             if not success:
                 break
             
+            # Bayat frame (önizleme / tıklama döngüyü yavaşlattı): algılamaya sokmadan atla
+            if self.frame_clock.should_drop():
+                continue
+            frame_start = time.perf_counter()
+            
+            # GUI'den yeni ayar yayınlandıysa farkları bu frame'den önce uygula
+            if self.live_settings:
+                self.live_settings.apply_pending()
+            
             # Görüntüyü çevir
             if self.flip_camera_var.get():  # ✅ GUI değişkeni
                 frame = cv2.flip(frame, 1)
             
             # El algıla
             self.hand_detector.update_image_shape(frame)
+            self.mouse_controller.set_camera_size(frame.shape[1], frame.shape[0])
             frame = self.hand_detector.find_hands(frame, draw=self.show_landmarks_var.get())  # ✅ GUI değişkeni
             
+            # Bu frame'in mouse olaylarını topla (sonda tek seferde gönderilir)
+            self.mouse_controller.begin_frame()
+            
             # El var mı kontrol et
             if self.hand_detector.is_hand_present():
                 # El yeni mi göründü?
@@ -936,6 +1062,9 @@ class HandMouseGUI:
                 if self.hand_was_present:
                     self.hand_was_present = False
             
+            # Biriken mouse olaylarını gönder
+            self.mouse_controller.end_frame()
+            
             # FPS hesapla
             current_time = time.time()
             fps = int(1 / (current_time - prev_time)) if prev_time > 0 else 0
@@ -945,11 +1074,12 @@ class HandMouseGUI:
             self._current_fps = fps
             self._current_gesture = self.gesture_recognizer.get_gesture_name() if hasattr(self.gesture_recognizer, 'get_gesture_name') else ""
             
-            # Overlay güncelle
-            self._update_overlay(fps)
+            # Overlay güncelle (frame işleme gecikmesi ile)
+            self._update_overlay(fps, (time.perf_counter() - frame_start) * 1000)
             
-            # Kamera görüntüsünü güncelle
-            self.update_camera_display(frame)
+            # Kamera görüntüsünü güncelle (pencere görünürse ve önizleme hız sınırı içinde)
+            if self._preview_due():
+                self.update_camera_display(frame)
             
             time.sleep(0.01)
     
@@ -1149,8 +1279,8 @@ class HandMouseGUI:
                             self.gesture_recognizer.set_gesture_name("")
                         self.last_left_gesture = None
     
-    def _update_overlay(self, fps):
-        """Overlay display'i güncelle"""
+    def _update_overlay(self, fps, latency: float = 0.0):
+        """Overlay display'i güncelle (latency: frame işleme süresi, ms)"""
         if not self.overlay:
             return
         
@@ -1192,6 +1322,9 @@ class HandMouseGUI:
         # Overlay'i güncelle
         self.overlay.update(
             fps=fps,
+            latency=round(latency, 1),
+            frame_age=round(self.frame_clock.last_age_ms),
+            dropped=self.frame_clock.dropped,
             right_hand=right_status,
             right_hand_color=right_color,
             left_hand=left_status,
@@ -1256,59 +1389,67 @@ class HandMouseGUI:
             self.speech_in_progress = False
             print("🔴 Sesli yazma thread'i sonlandı\n")
     
+    def _preview_due(self) -> bool:
+        """Önizleme bu frame'de gösterilecek mi? (pencere görünür + hız sınırı)"""
+        if not self.preview_visible:
+            return False
+        now = time.perf_counter()
+        if now - self._last_preview < 1.0 / max(1, Config.PREVIEW_MAX_FPS):
+            return False
+        self._last_preview = now
+        return True
+    
+    def _on_root_visibility(self, event, visible: bool):
+        """Pencere simge durumuna küçültüldü / geri açıldı (önizleme çizimi durur / başlar)"""
+        if event.widget is self.root:
+            self.preview_visible = visible
+    
+    def _build_static_layer(self, w, h, crop):
+        """
+        Dead zone çizimleri (sadece boyut / kırpma değişince yeniden kurulur).
+        
+        Args:
+            w, h: Görüntü boyutu
+            crop: (sol, sağ, üst, alt) kırpma oranları
+            
+        Returns:
+            DisplayList: Aktif alan dikdörtgeni, "EKRAN ALANI" etiketi, dead zone yüzdesi
+        """
+        layer = DisplayList()
+        active_left, active_top, active_right, active_bottom = \
+            self.mouse_controller.frame_config.crop_rect(w, h)
+        
+        # Yeşil dikdörtgen (aktif alan = ekranınızı temsil eder)
+        layer.rect((active_left, active_top), (active_right, active_bottom), (0, 255, 0), 3)
+        
+        # Dikdörtgenin içine açıklama metni (siyah kutu üzerinde yeşil)
+        text_box(layer, "EKRAN ALANI", (active_left + 10, active_top + 30), 0.7, (0, 255, 0), 2)
+        
+        # Alt kısma Dead Zone yüzdesini yaz
+        layer.text(f"Dead Zone: %{int(crop[0] * 100)}", (10, h - 20), 0.6, (0, 255, 255), 2)
+        return layer
+    
     def update_camera_display(self, frame):
-        """Kamera görüntüsünü GUI'de güncelle"""
-        # Dead Zone göster - aktif alanı yeşil dikdörtgen ile işaretle
+        """
+        Kamera görüntüsünü GUI'de güncelle.
+        Frame bu noktadan sonra işlenmediği için çizimler doğrudan üzerine yapılır.
+        """
         h, w = frame.shape[:2]
         
-        # Aktif alan sınırlarını hesapla
-        active_left = int(w * Config.CAMERA_CROP_LEFT)
-        active_right = int(w * (1 - Config.CAMERA_CROP_RIGHT))
-        active_top = int(h * Config.CAMERA_CROP_TOP)
-        active_bottom = int(h * (1 - Config.CAMERA_CROP_BOTTOM))
-        
-        # Frame'in kopyasını al (orijinali bozmamak için)
-        frame_with_rect = frame.copy()
-        
-        # Yeşil dikdörtgen çiz (aktif alan = ekranınızı temsil eder)
-        cv2.rectangle(frame_with_rect, 
-                     (active_left, active_top), 
-                     (active_right, active_bottom), 
-                     (0, 255, 0),  # Yeşil renk (BGR)
-                     3)  # Kalınlık
-        
-        # Dikdörtgenin içine açıklama metni ekle
-        text = "EKRAN ALANI"
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        text_size = cv2.getTextSize(text, font, 0.7, 2)[0]
-        text_x = active_left + 10
-        text_y = active_top + 30
-        
-        # Metin arka planı (siyah kutu)
-        cv2.rectangle(frame_with_rect,
-                     (text_x - 5, text_y - text_size[1] - 5),
-                     (text_x + text_size[0] + 5, text_y + 5),
-                     (0, 0, 0),
-                     -1)  # Dolu kutu
-        
-        # Metni yaz (yeşil)
-        cv2.putText(frame_with_rect, text, (text_x, text_y),
-                   font, 0.7, (0, 255, 0), 2)
+        # El çizimleri (HandDetector kaydetti) + sabit dead zone maskesi (tek maskeli kopya)
+        self.hand_detector.annotations.render(frame)
+        self.static_layer.get(w, h, self.mouse_controller.frame_config.crop).render(frame)
         
-        # Alt kısma Dead Zone yüzdesini yaz
-        deadzone_percent = int(Config.CAMERA_CROP_LEFT * 100)
-        info_text = f"Dead Zone: %{deadzone_percent}"
-        cv2.putText(frame_with_rect, info_text, (10, h - 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
+        # Dinamik metinler
+        layer = self.status_layer
+        layer.clear()
         
         # FPS göster (eğer ayar aktifse)
         if hasattr(self, 'show_fps_var') and self.show_fps_var.get():
             # FPS bilgisini self içinden al (process_loop'ta set ediyoruz)
             fps = getattr(self, '_current_fps', 0)
             if fps > 0:
-                fps_text = f"FPS: {fps}"
-                cv2.putText(frame_with_rect, fps_text, (10, 30),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+                layer.text(f"FPS: {fps}", (10, 30), 0.7, (255, 255, 255), 2)
         
         # Jest adını göster (eğer ayar aktifse)
         if hasattr(self, 'show_gesture_var') and self.show_gesture_var.get():
@@ -1316,12 +1457,12 @@ class HandMouseGUI:
             if current_gesture:
                 gesture_text = f"Jest: {current_gesture}"
                 gesture_size = cv2.getTextSize(gesture_text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
-                gesture_x = w - gesture_size[0] - 10
-                cv2.putText(frame_with_rect, gesture_text, (gesture_x, 30),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 255), 2)
+                layer.text(gesture_text, (w - gesture_size[0] - 10, 30), 0.7, (0, 255, 255), 2)
+        
+        layer.render(frame)
         
         # BGR'den RGB'ye çevir
-        frame_rgb = cv2.cvtColor(frame_with_rect, cv2.COLOR_BGR2RGB)
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         
         # PIL Image'e çevir
         image = Image.fromarray(frame_rgb)
@@ -1343,93 +1484,95 @@ class HandMouseGUI:
         else:
             self.camera_label.configure(image="", text="Kamera Kapalı")
     
-    def apply_settings(self):
-        """Ayarları Config'e uygula (yeniden başlatmada kullanılacak)"""
+    def _collect_settings(self) -> dict:
+        """GUI'deki ayar değerlerini toplar."""
         # Kamera index'ini al (dropdown'dan)
         camera_str = self.camera_index_var.get()  # Format: "0: Kamera İsmi"
         try:
             camera_index = int(camera_str.split(":")[0].strip())  # "0: Kamera İsmi" -> 0
-            Config.CAMERA_INDEX = camera_index
         except:
-            Config.CAMERA_INDEX = 0
-        
-        Config.CAMERA_FPS = self.fps_var.get()
-        Config.CAMERA_CROP_LEFT = self.deadzone_var.get()
-        Config.CAMERA_CROP_RIGHT = self.deadzone_var.get()
-        Config.CAMERA_CROP_TOP = self.deadzone_var.get()
-        Config.CAMERA_CROP_BOTTOM = self.deadzone_var.get()
-        Config.MAX_HANDS = self.max_hands_var.get()
-        
-        Config.MOUSE_SPEED = self.mouse_speed_var.get()
-        Config.EMA_MIN = self.ema_min_var.get()
-        Config.EMA_MAX = self.ema_max_var.get()
-        Config.EMA_FUNCTION = self.ema_func_var.get()
-        
-        Config.SHOW_FPS = self.show_fps_var.get()
-        Config.SHOW_LANDMARKS = self.show_landmarks_var.get()
-        Config.SHOW_GESTURE_TEXT = self.show_gesture_var.get()
-        Config.FLIP_CAMERA = self.flip_camera_var.get()
-        
-        Config.VOLUME_STEP = self.volume_step_var.get()
-        
-        # Sesli yazma - sadece dil ve mikrofon (diğerleri Config'de sabit)
-        Config.SPEECH_LANGUAGE = self.speech_lang_var.get()
+            camera_index = 0
         
         # Mikrofon index'ini al (dropdown'dan)
         mic_str = self.speech_mic_var.get()  # Format: "0: Mikrofon Adı"
         try:
             mic_index = int(mic_str.split(":")[0].strip())
-            Config.SPEECH_MICROPHONE_INDEX = mic_index
         except:
-            Config.SPEECH_MICROPHONE_INDEX = None
+            mic_index = None
+        
+        deadzone = self.deadzone_var.get()
+        return {
+            'CAMERA_INDEX': camera_index,
+            'CAMERA_FPS': self.fps_var.get(),
+            'CAMERA_CROP_LEFT': deadzone,
+            'CAMERA_CROP_RIGHT': deadzone,
+            'CAMERA_CROP_TOP': deadzone,
+            'CAMERA_CROP_BOTTOM': deadzone,
+            'MAX_HANDS': self.max_hands_var.get(),
+            'MOUSE_SPEED': self.mouse_speed_var.get(),
+            'EMA_MIN': self.ema_min_var.get(),
+            'EMA_MAX': self.ema_max_var.get(),
+            'EMA_FUNCTION': self.ema_func_var.get(),
+            'SHOW_FPS': self.show_fps_var.get(),
+            'SHOW_LANDMARKS': self.show_landmarks_var.get(),
+            'SHOW_GESTURE_TEXT': self.show_gesture_var.get(),
+            'FLIP_CAMERA': self.flip_camera_var.get(),
+            'VOLUME_STEP': self.volume_step_var.get(),
+            # Sesli yazma - sadece dil ve mikrofon (diğerleri Config'de sabit)
+            'SPEECH_LANGUAGE': self.speech_lang_var.get(),
+            'SPEECH_MICROPHONE_INDEX': mic_index,
+        }
+    
+    def apply_settings(self, settings: Optional[dict] = None) -> list:
+        """
+        Ayarları Config'e yazar; sistem çalışıyorsa yeni ayar sürümünü yayınlar.
+        Bileşenler farkları bir sonraki frame'de uygular (sistem durdurulmaz).
         
-        print("⚙️ Ayarlar Config'e yazıldı (yeniden başlatmada uygulanacak)")
+        Args:
+            settings: Uygulanacak ayarlar (None = GUI'den topla)
+            
+        Returns:
+            Değişen ama sadece yeniden başlatmada uygulanabilen ayarlar
+        """
+        if settings is None:
+            settings = self._collect_settings()
+        
+        for key, value in settings.items():
+            setattr(Config, key, value)
+        
+        if not (self.is_running and self.live_settings):
+            print("⚙️ Ayarlar Config'e yazıldı (başlatmada uygulanacak)")
+            return []
+        
+        changed = self.live_settings.publish(settings)
+        restart = [key for key in changed if key in self.RESTART_KEYS]
+        if changed:
+            print(f"⚡ {len(changed) - len(restart)} ayar canlı uygulanıyor "
+                  f"(sürüm {self.live_settings.current.version})")
+        if restart:
+            print(f"⚠️ Yeniden başlatma gerektiren ayarlar: {', '.join(restart)}")
+        return restart
     
     def save_settings(self):
-        """Ayarları kalıcı olarak kaydet (settings.json)"""
-        self.apply_settings()
-        
+        """Ayarları kalıcı olarak kaydet (settings.json) ve çalışan sisteme uygula"""
         try:
-            # Ayarları dictionary olarak topla
-            settings = {
-                'CAMERA_INDEX': Config.CAMERA_INDEX,
-                'CAMERA_FPS': Config.CAMERA_FPS,
-                'CAMERA_CROP_LEFT': Config.CAMERA_CROP_LEFT,
-                'CAMERA_CROP_RIGHT': Config.CAMERA_CROP_RIGHT,
-                'CAMERA_CROP_TOP': Config.CAMERA_CROP_TOP,
-                'CAMERA_CROP_BOTTOM': Config.CAMERA_CROP_BOTTOM,
-                'MAX_HANDS': Config.MAX_HANDS,
-                'MOUSE_SPEED': Config.MOUSE_SPEED,
-                'EMA_MIN': Config.EMA_MIN,
-                'EMA_MAX': Config.EMA_MAX,
-                'EMA_FUNCTION': Config.EMA_FUNCTION,
-                'SHOW_FPS': Config.SHOW_FPS,
-                'SHOW_LANDMARKS': Config.SHOW_LANDMARKS,
-                'SHOW_GESTURE_TEXT': Config.SHOW_GESTURE_TEXT,
-                'FLIP_CAMERA': Config.FLIP_CAMERA,
-                'VOLUME_STEP': Config.VOLUME_STEP,
-                'SPEECH_LANGUAGE': Config.SPEECH_LANGUAGE,
-                'SPEECH_MICROPHONE_INDEX': Config.SPEECH_MICROPHONE_INDEX,
-            }
-            
-            # settings.json'a kaydet (hem normal hem EXE modunda çalışır)
-            if self.config_manager.save_settings(settings):
-                # Ayrıca config.py'yi de güncelle (sadece normal modda çalışır)
-                self.config_manager.update_config_file(settings)
-                
-                if self.is_running:
-                    messagebox.showinfo("Kaydedildi", 
+            settings = self._collect_settings()
+            restart = self.apply_settings(settings)
+            
+            # settings.json'a kaydet (doğrulanır, geçici dosya + yeniden adlandırma)
+            if self.settings_service.save(settings):
+                if not self.is_running:
+                    messagebox.showinfo("Kaydedildi",
                         "💾 Ayarlar kalıcı olarak kaydedildi!\n\n"
-                        "⚠️ Ayarların aktif olması için:\n"
-                        "1. Uygulamayı tamamen KAPATIN\n"
-                        "2. Uygulamayı yeniden AÇIN\n\n"
-                        "✅ Yeni açılışta ayarlar yüklenecek")
+                        "✅ Sistem başlatıldığında uygulanacak")
+                elif restart:
+                    messagebox.showinfo("Kaydedildi",
+                        "💾 Ayarlar kaydedildi ve anında uygulandı.\n\n"
+                        "⚠️ Kamera / mikrofon / dil değişikliği için:\n"
+                        "• Sistemi DURDURUN ve yeniden BAŞLATIN")
                 else:
                     messagebox.showinfo("Kaydedildi",
-                        "💾 Ayarlar kalıcı olarak kaydedildi!\n\n"
-                        "⚠️ Ayarların aktif olması için:\n"
-                        "• Uygulamayı KAPATIN ve yeniden AÇIN\n\n"
-                        "✅ Yeni açılışta ayarlar yüklenecek")
+                        "💾 Ayarlar kaydedildi ve anında uygulandı!")
             else:
                 messagebox.showerror("Hata", "Ayarlar kaydedilemedi!")
             
@@ -1440,6 +1583,10 @@ class HandMouseGUI:
         """GUI'yi çalıştır"""
         # Kapanma kontrolü
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # Simge durumuna küçültülünce önizleme çizimi ve dönüşümü atlanır
+        self.root.bind("<Unmap>", lambda event: self._on_root_visibility(event, False), add="+")
+        self.root.bind("<Map>", lambda event: self._on_root_visibility(event, True), add="+")
         self.root.mainloop()
     
     def show_help(self):
@@ -1558,8 +1705,43 @@ class HandMouseGUI:
             )
             desc_label.pack(side="left", padx=(5 if gesture else 15, 10), fill="x", expand=True)
     
+    def _on_settings_file_changed(self, report):
+        """settings.json dışarıdan değişti (izleme thread'i) - main thread'e aktar"""
+        self.root.after(0, lambda: self._apply_file_settings(report))
+    
+    def _apply_file_settings(self, report):
+        """Dosyadaki doğrulanmış değişiklikleri GUI'ye, Config'e ve çalışan sisteme uygula"""
+        # GUI kontrollerini dosyayla eşitle (sonraki KAYDET eski değeri geri yazmasın)
+        setting_vars = {
+            'CAMERA_FPS': self.fps_var,
+            'CAMERA_CROP_LEFT': self.deadzone_var,
+            'MAX_HANDS': self.max_hands_var,
+            'MOUSE_SPEED': self.mouse_speed_var,
+            'EMA_MIN': self.ema_min_var,
+            'EMA_MAX': self.ema_max_var,
+            'EMA_FUNCTION': self.ema_func_var,
+            'SHOW_FPS': self.show_fps_var,
+            'SHOW_LANDMARKS': self.show_landmarks_var,
+            'SHOW_GESTURE_TEXT': self.show_gesture_var,
+            'FLIP_CAMERA': self.flip_camera_var,
+            'VOLUME_STEP': self.volume_step_var,
+            'SPEECH_LANGUAGE': self.speech_lang_var,
+        }
+        for key, (old, new) in report.changed.items():
+            setattr(Config, key, new)
+            if key in setting_vars:
+                setting_vars[key].set(new)
+        
+        # Canlı ayarlar bir sonraki frame'de uygulanır
+        if self.is_running and self.live_settings and report.hot:
+            self.live_settings.publish(report.hot)
+        if self.is_running and report.cold:
+            print(f"⚠️ Yeniden başlatınca uygulanacak: {', '.join(report.cold)}")
+    
     def on_closing(self):
         """Pencere kapatılırken"""
+        self.settings_service.stop_watching()
+        self.camera_discovery.remove_listener(self._on_cameras_discovered)
         if self.is_running:
             if messagebox.askokcancel("Çıkış", "Sistem çalışıyor. Çıkmak istediğinizden emin misiniz?"):
                 self.stop_system()
@@ -5,7 +5,12 @@ MediaPipe kullanarak gerçek zamanlı el algılama ve landmark tespiti yapar.
 
 import cv2
 import mediapipe as mp
-from typing import Optional, Tuple, List
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, List
+
+sys.path.append(str(Path(__file__).parent))
+from annotations import DisplayList
 
 
 class HandDetector:
@@ -14,6 +19,9 @@ class HandDetector:
     MediaPipe Hands çözümünü kullanarak kamera görüntüsünden el tespiti yapar.
     """
     
+    # Çalışırken uygulanabilen ayarlar (bkz. apply_settings)
+    SETTINGS_KEYS = ('MAX_HANDS', 'DETECTION_CONFIDENCE', 'TRACKING_CONFIDENCE')
+    
     def __init__(self, 
                  max_hands: int = 1,
                  detection_confidence: float = 0.7,
@@ -49,6 +57,9 @@ class HandDetector:
         self.landmarks_list = []
         self.hand_labels = []  # "Left" veya "Right"
         self.results = None
+        
+        # Son frame'in çizimleri (frame'e yazılmaz, önizleme gösterilirken çizilir)
+        self.annotations = DisplayList()
     
     def update_settings(self, max_hands: int = None, 
                        detection_confidence: float = None,
@@ -76,16 +87,30 @@ class HandDetector:
             min_tracking_confidence=self.tracking_confidence
         )
     
+    def apply_settings(self, changes: Dict[str, Any]):
+        """
+        Canlı ayar değişikliklerini uygular (MediaPipe iki frame arasında yeniden kurulur).
+        
+        Args:
+            changes: {ayar anahtarı: yeni değer} (sadece SETTINGS_KEYS)
+        """
+        self.update_settings(
+            max_hands=changes.get('MAX_HANDS'),
+            detection_confidence=changes.get('DETECTION_CONFIDENCE'),
+            tracking_confidence=changes.get('TRACKING_CONFIDENCE')
+        )
+    
     def find_hands(self, image: cv2.Mat, draw: bool = True) -> cv2.Mat:
         """
-        Görüntüde el arar ve isteğe bağlı olarak çizer.
+        Görüntüde el arar ve isteğe bağlı olarak çizimleri kaydeder.
+        Görüntü değiştirilmez; çizimler self.annotations'a eklenir.
         
         Args:
             image: İşlenecek BGR formatında görüntü
-            draw: True ise tespit edilen eli görüntü üzerine çizer
+            draw: True ise tespit edilen elin parmak uçları kaydedilir
             
         Returns:
-            İşlenmiş görüntü (çizimlerle birlikte)
+            Aynı görüntü
         """
         # BGR'den RGB'ye çevir (MediaPipe RGB kullanır)
         image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
@@ -96,6 +121,7 @@ class HandDetector:
         # Liste temizle
         self.landmarks_list = []
         self.hand_labels = []
+        self.annotations.clear()
         
         # El bulundu mu kontrol et
         if self.results.multi_hand_landmarks:
@@ -115,7 +141,7 @@ class HandDetector:
                 
                 # Çizim isteniyorsa
                 if draw:
-                    # Sadece parmak uçlarını çiz
+                    # Sadece parmak uçlarını kaydet
                     self.draw_fingertips_only(image, hand_landmarks)
         else:
             self.hand_detected = False
@@ -124,13 +150,14 @@ class HandDetector:
     
     def draw_fingertips_only(self, image: cv2.Mat, hand_landmarks):
         """
-        Sadece parmak uçlarını (5 nokta) ve avuç içi merkezini çizer.
+        Sadece parmak uçlarını (5 nokta) ve avuç içi merkezini self.annotations'a kaydeder.
         
         Args:
-            image: Çizim yapılacak görüntü
+            image: Landmark'ların ait olduğu görüntü (sadece boyutu kullanılır)
             hand_landmarks: MediaPipe hand landmarks
         """
-        h, w, _ = image.shape
+        h, w = image.shape[:2]
+        layer = self.annotations
         
         # Parmak ucu indeksleri: Başparmak(4), İşaret(8), Orta(12), Yüzük(16), Serçe(20)
         fingertip_ids = [4, 8, 12, 16, 20]
@@ -141,9 +168,9 @@ class HandDetector:
             x = int(landmark.x * w)
             y = int(landmark.y * h)
             
-            # Daire çiz (parmak ucu)
-            cv2.circle(image, (x, y), 10, (0, 255, 0), cv2.FILLED)  # Yeşil dolu daire
-            cv2.circle(image, (x, y), 12, (255, 255, 255), 2)       # Beyaz çerçeve
+            # Daire (parmak ucu)
+            layer.circle((x, y), 10, (0, 255, 0), cv2.FILLED)  # Yeşil dolu daire
+            layer.circle((x, y), 12, (255, 255, 255), 2)       # Beyaz çerçeve
         
         # Avuç içi merkezi çiz (bilek ve orta parmak tabanı arasında)
         wrist = hand_landmarks.landmark[0]
@@ -158,10 +185,9 @@ class HandDetector:
         center_x = (wrist_x + palm_x_coord) // 2
         center_y = (wrist_y + palm_y_coord) // 2
         
-        # Avuç merkezini çiz (turuncu haç)
-        cv2.drawMarker(image, (center_x, center_y), (0, 165, 255), 
-                      cv2.MARKER_CROSS, 20, 3)
-        cv2.circle(image, (center_x, center_y), 8, (0, 165, 255), 2)
+        # Avuç merkezi (turuncu haç)
+        layer.marker((center_x, center_y), (0, 165, 255), cv2.MARKER_CROSS, 20, 3)
+        layer.circle((center_x, center_y), 8, (0, 165, 255), 2)
     
     def get_landmark_position(self, 
                             landmark_id: int,
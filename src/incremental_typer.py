@@ -0,0 +1,108 @@
+"""
+Incremental Typer Modülü
+Akış (streaming) tanımada gelen ara sonuçları artımlı olarak yazar.
+
+Ara sonuçlar (partial) kelime kelime büyür ve tanıyıcı önceki kelimeleri
+düzeltebilir. Sadece kararlı hale gelen kelimeler yazılır; daha önce yazılmış
+metin değişirse ortak önekten sonrası minimum sayıda Backspace ile silinip
+yeni son ek yazılır (tüm cümle tekrar yazılmaz).
+"""
+
+from typing import Callable, List
+
+
+class IncrementalTyper:
+    """
+    Yazılmış metni takip eder ve hedef metne minimum düzenleme ile ulaşır.
+    Klavye işlemleri dışarıdan verilir (backspace(n), insert(metin)).
+    """
+
+    def __init__(self,
+                 backspace: Callable[[int], None],
+                 insert: Callable[[str], None]):
+        """
+        IncrementalTyper sınıfını başlatır.
+
+        Args:
+            backspace: n kez Backspace basan fonksiyon
+            insert: Metni imleç konumuna yazan fonksiyon
+        """
+        self.backspace = backspace
+        self.insert = insert
+
+        # Bu cümlede şu ana kadar ekrana yazılan metin
+        self.typed = ''
+
+        # Önceki ara sonucun kelimeleri (kararlılık kontrolü için)
+        self._previous_words: List[str] = []
+
+        # İstatistik
+        self.backspace_count = 0
+        self.inserted_chars = 0
+
+    def update(self, text: str, final: bool = False) -> str:
+        """
+        Yeni tanıma sonucunu işler.
+
+        Ara sonuçta: önceki ara sonuçla aynı kalan kelimeler (sonuncusu hariç) yazılır.
+        Kesin sonuçta: metnin tamamı (+ boşluk) yazılır ve cümle kapatılır.
+
+        Args:
+            text: Tanıyıcının güncel metni
+            final: True ise cümle bitti (kesin sonuç)
+
+        Returns:
+            Ekranda olması gereken (yazılan) metin
+        """
+        words = text.split()
+
+        if final:
+            target = ' '.join(words) + ' ' if words else ''
+        else:
+            # İki ardışık ara sonuçta değişmeyen kelimeler kararlı kabul edilir;
+            # son kelime hâlâ uzayabileceği için beklenir
+            stable = 0
+            limit = min(len(words) - 1, len(self._previous_words))
+            while stable < limit and words[stable] == self._previous_words[stable]:
+                stable += 1
+            self._previous_words = words
+
+            target = ' '.join(words[:stable]) + ' ' if stable else ''
+
+            # Kararlı kısım kısaldıysa hemen silme - yazılan kısım bir sonraki
+            # kesin sonuçta düzeltilir (gereksiz sil-yaz titremesini önler)
+            if len(target) < len(self.typed) and self.typed.startswith(target):
+                target = self.typed
+
+        self._apply(target)
+
+        if final:
+            # Cümle bitti: yazılan metin artık kalıcı
+            self.reset()
+            return target
+        return self.typed
+
+    def reset(self):
+        """Yeni cümleye başlar (yazılmış metin korunur, takip sıfırlanır)."""
+        self.typed = ''
+        self._previous_words = []
+
+    def _apply(self, target: str):
+        """Ekrandaki metni minimum Backspace + ekleme ile hedef metne çevirir."""
+        typed = self.typed
+        prefix = 0
+        limit = min(len(typed), len(target))
+        while prefix < limit and typed[prefix] == target[prefix]:
+            prefix += 1
+
+        remove = len(typed) - prefix
+        add = target[prefix:]
+
+        if remove:
+            self.backspace(remove)
+            self.backspace_count += remove
+        if add:
+            self.insert(add)
+            self.inserted_chars += len(add)
+
+        self.typed = target
@@ -0,0 +1,586 @@
+"""
+Input Backend Modülü
+Mouse olaylarını işletim sistemine ileten değiştirilebilir arka uçlar.
+
+MouseController hangi API'nin kullanıldığını bilmez; sadece bir InputBackend
+nesnesine hareket / tuş / scroll komutları gönderir. Cursor pozisyonu
+arka uç tarafından takip edilir, her tıklamada işletim sisteminden
+tekrar okunmaz.
+
+Frame modu: begin_frame() ile end_frame() arasında üretilen tüm olaylar
+kuyrukta birleştirilir (ardışık hareketler → son pozisyon, ardışık scroll'lar
+→ tek çark değeri) ve tek bir enjeksiyon çağrısıyla gönderilir.
+"""
+
+import os
+import platform
+from typing import List, Optional, Tuple
+
+# Windows API (en hızlı yol)
+if platform.system() == 'Windows':
+    try:
+        import ctypes
+        from ctypes import wintypes
+        import win32api
+        import win32con
+        HAS_WIN32 = True
+    except ImportError:
+        HAS_WIN32 = False
+        print("⚠️  win32api yüklü değil, pyautogui kullanılacak")
+else:
+    HAS_WIN32 = False
+
+# PyAutoGUI (platform bağımsız yedek yol)
+try:
+    import pyautogui
+    pyautogui.FAILSAFE = True  # Fareyi köşeye götürerek acil durdurma
+    pyautogui.PAUSE = 0         # Gecikme KAPALI - maksimum hız için
+    HAS_PYAUTOGUI = True
+except Exception:
+    # Ekransız (DISPLAY yok) Linux'ta import sırasında hata verebilir
+    HAS_PYAUTOGUI = False
+
+# Linux: /dev/uinput (python-evdev)
+try:
+    from evdev import UInput, AbsInfo, ecodes
+    HAS_EVDEV = True
+except ImportError:
+    HAS_EVDEV = False
+
+# Linux: X11 XTest (python-xlib)
+try:
+    from Xlib import X
+    from Xlib import display as xdisplay
+    from Xlib.ext import xtest
+    HAS_XLIB = True
+except ImportError:
+    HAS_XLIB = False
+
+
+# SendInput yapıları (tek çağrıda birden fazla olay göndermek için)
+if HAS_WIN32:
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ('dx', wintypes.LONG),
+            ('dy', wintypes.LONG),
+            ('mouseData', wintypes.LONG),   # Negatif çark değerleri için işaretli
+            ('dwFlags', wintypes.DWORD),
+            ('time', wintypes.DWORD),
+            ('dwExtraInfo', ctypes.c_size_t),
+        ]
+
+    class _INPUT(ctypes.Structure):
+        # INPUT birliğinin en büyük üyesi MOUSEINPUT olduğu için boyut aynıdır
+        _fields_ = [('type', wintypes.DWORD), ('mi', _MOUSEINPUT)]
+
+    _INPUT_MOUSE = 0
+    _SendInput = ctypes.windll.user32.SendInput
+
+# Mutlak koordinatları tüm monitörleri kapsayan sanal masaüstüne göre yorumla
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+
+# Varsayılan ekran boyutu (ekran bilgisi alınamadığında)
+DEFAULT_SCREEN_SIZE = (1920, 1080)
+
+# Bir scroll çark adımının birim değeri (Windows WHEEL_DELTA standardı)
+WHEEL_DELTA = 120
+
+
+class InputBackend:
+    """
+    Mouse girdi arka uçlarının ortak arayüzü.
+    Alt sınıflar sadece _send metodunu uygular; olaylar
+    ('move', x, y), ('button', isim, basılı) ve ('wheel', birim) demetleridir.
+    """
+
+    name = 'base'
+
+    # Arka uç çark adımının altındaki değerleri (örn. 30/120) gönderebiliyor mu?
+    supports_hires_wheel = False
+
+    def __init__(self, screen_size: Optional[Tuple[int, int]] = None):
+        """
+        InputBackend sınıfını başlatır.
+
+        Args:
+            screen_size: (genişlik, yükseklik) - None ise arka uç kendisi belirler
+        """
+        self._screen_size = tuple(screen_size) if screen_size else DEFAULT_SCREEN_SIZE
+
+        # Sanal masaüstü (tüm monitörler): (x, y, genişlik, yükseklik)
+        self.virtual_desktop = (0, 0) + self._screen_size
+
+        # Takip edilen cursor pozisyonu (OS'tan tekrar okunmaz)
+        self.x = 0
+        self.y = 0
+
+        # Frame kuyruğu
+        self._pending: List[tuple] = []
+        self._in_frame = False
+
+        # Gönderilemeyen çark kesirleri (WHEEL_DELTA biriminde)
+        self._wheel_remainder = 0.0
+
+        # İstatistik: gönderilen batch / olay sayısı
+        self.batch_count = 0
+        self.event_count = 0
+
+    def screen_size(self) -> Tuple[int, int]:
+        """
+        Ekran boyutunu döndürür.
+
+        Returns:
+            (genişlik, yükseklik) piksel
+        """
+        return self._screen_size
+
+    def position(self) -> Tuple[int, int]:
+        """
+        Takip edilen cursor pozisyonunu döndürür.
+
+        Returns:
+            (x, y) ekran koordinatları
+        """
+        return (self.x, self.y)
+
+    def set_virtual_desktop(self, rect: Tuple[int, int, int, int]):
+        """
+        Sanal masaüstü dikdörtgenini bildirir (monitör topolojisi değişince çağrılır).
+
+        Args:
+            rect: (x, y, genişlik, yükseklik) - birincil monitörün sol üstü (0, 0)
+        """
+        self.virtual_desktop = tuple(rect)
+
+    def begin_frame(self):
+        """Frame başlatır: end_frame() çağrılana kadar olaylar kuyrukta bekler."""
+        self._in_frame = True
+
+    def end_frame(self):
+        """Frame'i bitirir ve kuyruktaki olayları tek seferde gönderir."""
+        self._in_frame = False
+        self.flush()
+
+    def move_to(self, x: int, y: int):
+        """
+        Cursor'ı mutlak ekran koordinatına taşır.
+
+        Args:
+            x: Ekran X koordinatı
+            y: Ekran Y koordinatı
+        """
+        self.x = x
+        self.y = y
+        self._queue(('move', x, y))
+
+    def button_down(self, button: str = 'left'):
+        """
+        Mouse tuşunu basar.
+
+        Args:
+            button: 'left' veya 'right'
+        """
+        self._queue(('button', button, True))
+
+    def button_up(self, button: str = 'left'):
+        """
+        Mouse tuşunu bırakır.
+
+        Args:
+            button: 'left' veya 'right'
+        """
+        self._queue(('button', button, False))
+
+    def click(self, button: str = 'left'):
+        """
+        Tek tıklama (bas + bırak, aynı batch içinde).
+
+        Args:
+            button: 'left' veya 'right'
+        """
+        self.button_down(button)
+        self.button_up(button)
+
+    def double_click(self, button: str = 'left'):
+        """
+        Çift tıklama (iki hızlı bas-bırak).
+
+        Args:
+            button: 'left' veya 'right'
+        """
+        self.click(button)
+        self.click(button)
+
+    def scroll(self, clicks: float):
+        """
+        Dikey scroll yapar. Kesirli değerler desteklenir (yüksek çözünürlüklü çark);
+        arka uç desteklemiyorsa kesirler biriktirilip tam adım olunca gönderilir.
+
+        Args:
+            clicks: Çark adımı (pozitif = yukarı, negatif = aşağı)
+        """
+        if not clicks:
+            return
+
+        units = self._wheel_remainder + clicks * WHEEL_DELTA
+        if self.supports_hires_wheel:
+            sent = int(units)
+        else:
+            sent = int(units / WHEEL_DELTA) * WHEEL_DELTA
+        self._wheel_remainder = units - sent
+
+        if sent:
+            self._queue(('wheel', sent))
+
+    def reset_scroll(self):
+        """Biriken çark kesirlerini sıfırlar (scroll jesti bittiğinde)."""
+        self._wheel_remainder = 0.0
+
+    def flush(self):
+        """Kuyruktaki olayları birleştirip tek enjeksiyon çağrısıyla gönderir."""
+        if not self._pending:
+            return
+
+        events = self._coalesce(self._pending)
+        self._pending = []
+
+        self.batch_count += 1
+        self.event_count += len(events)
+        self._send(events)
+
+    def close(self):
+        """Arka uç kaynaklarını serbest bırakır."""
+        pass
+
+    def _queue(self, event: tuple):
+        """Olayı kuyruğa ekler; frame dışındaysa hemen gönderir."""
+        self._pending.append(event)
+        if not self._in_frame:
+            self.flush()
+
+    @staticmethod
+    def _coalesce(events: List[tuple]) -> List[tuple]:
+        """
+        Ardışık hareket ve scroll olaylarını birleştirir.
+        Tuş olaylarının sırası korunur (sürükle-bırak için hareket → bas sırası önemli).
+
+        Args:
+            events: Kuyruktaki olaylar
+
+        Returns:
+            Birleştirilmiş olay listesi
+        """
+        merged = []
+        for event in events:
+            if merged and merged[-1][0] == event[0]:
+                if event[0] == 'move':
+                    merged[-1] = event
+                    continue
+                if event[0] == 'wheel':
+                    merged[-1] = ('wheel', merged[-1][1] + event[1])
+                    continue
+            merged.append(event)
+        return merged
+
+    def _send(self, events: List[tuple]):
+        """Birleştirilmiş olayları işletim sistemine gönderir (alt sınıf uygular)."""
+        raise NotImplementedError
+
+
+class Win32InputBackend(InputBackend):
+    """
+    Windows API ile doğrudan mouse kontrolü - en hızlı yol.
+    Frame'deki tüm olaylar tek bir SendInput çağrısıyla gönderilir.
+    """
+
+    name = 'win32'
+    supports_hires_wheel = True  # WHEEL mouseData 120'nin katı olmak zorunda değil
+
+    def __init__(self, screen_size: Optional[Tuple[int, int]] = None):
+        if not HAS_WIN32:
+            raise RuntimeError("win32api kullanılamıyor")
+
+        if screen_size is None:
+            screen_size = (win32api.GetSystemMetrics(0), win32api.GetSystemMetrics(1))
+        super().__init__(screen_size)
+
+        # SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN
+        self.virtual_desktop = tuple(win32api.GetSystemMetrics(i) for i in (76, 77, 78, 79))
+
+        # Başlangıç pozisyonunu bir kere oku, sonra kendimiz takip ederiz
+        self.x, self.y = win32api.GetCursorPos()
+
+        # (basma, bırakma) bayrakları
+        self._button_flags = {
+            'left': (win32con.MOUSEEVENTF_LEFTDOWN, win32con.MOUSEEVENTF_LEFTUP),
+            'right': (win32con.MOUSEEVENTF_RIGHTDOWN, win32con.MOUSEEVENTF_RIGHTUP),
+        }
+
+    def _send(self, events: List[tuple]):
+        left, top, width, height = self.virtual_desktop
+        inputs = (_INPUT * len(events))()
+
+        for i, event in enumerate(events):
+            item = inputs[i]
+            item.type = _INPUT_MOUSE
+            kind = event[0]
+
+            if kind == 'move':
+                # Mutlak koordinat sanal masaüstüne göre 0-65535 aralığına normalize edilir
+                # (göreli hareket Windows'un pointer ivmesinden etkilenir)
+                item.mi.dx = (event[1] - left) * 65535 // max(1, width - 1)
+                item.mi.dy = (event[2] - top) * 65535 // max(1, height - 1)
+                item.mi.dwFlags = (win32con.MOUSEEVENTF_MOVE | win32con.MOUSEEVENTF_ABSOLUTE |
+                                   MOUSEEVENTF_VIRTUALDESK)
+            elif kind == 'button':
+                down_flag, up_flag = self._button_flags[event[1]]
+                item.mi.dwFlags = down_flag if event[2] else up_flag
+            elif kind == 'wheel':
+                item.mi.mouseData = event[1]
+                item.mi.dwFlags = win32con.MOUSEEVENTF_WHEEL
+
+        _SendInput(len(events), inputs, ctypes.sizeof(_INPUT))
+
+
+class PyAutoGUIInputBackend(InputBackend):
+    """PyAutoGUI ile mouse kontrolü (platform bağımsız, daha yavaş)."""
+
+    name = 'pyautogui'
+
+    def __init__(self, screen_size: Optional[Tuple[int, int]] = None):
+        if not HAS_PYAUTOGUI:
+            raise RuntimeError("pyautogui kullanılamıyor")
+
+        if screen_size is None:
+            screen_size = tuple(pyautogui.size())
+        super().__init__(screen_size)
+
+        self.x, self.y = pyautogui.position()
+
+    def _send(self, events: List[tuple]):
+        # pyautogui toplu gönderim desteklemez; birleştirilmiş olaylar sırayla gider
+        for event in events:
+            kind = event[0]
+            if kind == 'move':
+                pyautogui.moveTo(event[1], event[2], duration=0, _pause=False)
+            elif kind == 'button':
+                if event[2]:
+                    pyautogui.mouseDown(button=event[1], _pause=False)
+                else:
+                    pyautogui.mouseUp(button=event[1], _pause=False)
+            elif kind == 'wheel':
+                pyautogui.scroll(event[1] // WHEEL_DELTA, _pause=False)
+
+
+class LinuxInputBackend(InputBackend):
+    """
+    Linux mouse kontrolü.
+    Önce /dev/uinput üzerinden sanal cihaz (python-evdev) dener,
+    olmazsa X11 XTest (python-xlib) kullanır.
+    """
+
+    name = 'linux'
+
+    # X11 tuş numaraları (1 = sol, 3 = sağ, 4/5 = scroll yukarı/aşağı)
+    _X11_BUTTONS = {'left': 1, 'right': 3}
+
+    def __init__(self, screen_size: Optional[Tuple[int, int]] = None):
+        self.uinput = None
+        self.display = None
+
+        # X11 bağlantısı (ekran boyutu için uinput modunda da faydalı)
+        if HAS_XLIB and os.environ.get('DISPLAY'):
+            try:
+                self.display = xdisplay.Display()
+            except Exception as e:
+                print(f"⚠️  X11 bağlantısı kurulamadı: {e}")
+                self.display = None
+
+        if screen_size is None and self.display is not None:
+            screen = self.display.screen()
+            screen_size = (screen.width_in_pixels, screen.height_in_pixels)
+        super().__init__(screen_size)
+
+        # Öncelik: uinput (kernel seviyesi, Wayland'da da çalışır)
+        if HAS_EVDEV and os.access('/dev/uinput', os.W_OK):
+            try:
+                self.uinput = self._create_uinput_device()
+            except Exception as e:
+                print(f"⚠️  /dev/uinput açılamadı: {e}")
+                self.uinput = None
+
+        if self.uinput is None and self.display is None:
+            raise RuntimeError("Ne /dev/uinput ne de X11 kullanılabilir")
+
+        self.mode = 'uinput' if self.uinput is not None else 'x11'
+
+        # Yüksek çözünürlüklü çark sadece uinput (REL_WHEEL_HI_RES) ile mümkün
+        self.supports_hires_wheel = self.mode == 'uinput' and hasattr(ecodes, 'REL_WHEEL_HI_RES')
+        self._hires_accumulator = 0
+
+        if self.mode == 'x11':
+            pointer = self.display.screen().root.query_pointer()
+            self.x, self.y = pointer.root_x, pointer.root_y
+
+    def _create_uinput_device(self):
+        """Mutlak konumlu sanal mouse cihazı oluşturur."""
+        width, height = self._screen_size
+        rel_codes = [ecodes.REL_WHEEL]
+        if hasattr(ecodes, 'REL_WHEEL_HI_RES'):
+            rel_codes.append(ecodes.REL_WHEEL_HI_RES)
+
+        capabilities = {
+            ecodes.EV_KEY: [ecodes.BTN_LEFT, ecodes.BTN_RIGHT, ecodes.BTN_MIDDLE],
+            ecodes.EV_ABS: [
+                (ecodes.ABS_X, AbsInfo(value=0, min=0, max=width - 1, fuzz=0, flat=0, resolution=0)),
+                (ecodes.ABS_Y, AbsInfo(value=0, min=0, max=height - 1, fuzz=0, flat=0, resolution=0)),
+            ],
+            ecodes.EV_REL: rel_codes,
+        }
+        return UInput(capabilities, name='HandMouse Virtual Pointer')
+
+    def _send(self, events: List[tuple]):
+        if self.uinput is not None:
+            self._send_uinput(events)
+        else:
+            self._send_x11(events)
+
+    def _send_uinput(self, events: List[tuple]):
+        """Tüm olayları yazar, tek bir EV_SYN ile çekirdeğe tek rapor olarak iletir."""
+        ui = self.uinput
+        for event in events:
+            kind = event[0]
+            if kind == 'move':
+                ui.write(ecodes.EV_ABS, ecodes.ABS_X, event[1])
+                ui.write(ecodes.EV_ABS, ecodes.ABS_Y, event[2])
+            elif kind == 'button':
+                # Tuş değişimi kendi raporunda olmalı (hareketle aynı rapora düşmesin)
+                ui.syn()
+                code = ecodes.BTN_LEFT if event[1] == 'left' else ecodes.BTN_RIGHT
+                ui.write(ecodes.EV_KEY, code, 1 if event[2] else 0)
+                ui.syn()
+            elif kind == 'wheel':
+                self._write_uinput_wheel(event[1])
+        ui.syn()
+
+    def _write_uinput_wheel(self, units: int):
+        """
+        Çark olayı yazar. Çekirdek kuralı: REL_WHEEL_HI_RES her değişimde,
+        REL_WHEEL ise biriken değer 120'ye ulaştığında gönderilir.
+        """
+        if not self.supports_hires_wheel:
+            self.uinput.write(ecodes.EV_REL, ecodes.REL_WHEEL, units // WHEEL_DELTA)
+            return
+
+        self.uinput.write(ecodes.EV_REL, ecodes.REL_WHEEL_HI_RES, units)
+        self._hires_accumulator += units
+        notches = int(self._hires_accumulator / WHEEL_DELTA)
+        if notches:
+            self.uinput.write(ecodes.EV_REL, ecodes.REL_WHEEL, notches)
+            self._hires_accumulator -= notches * WHEEL_DELTA
+
+    def _send_x11(self, events: List[tuple]):
+        """Tüm olayları XTest kuyruğuna ekler ve tek flush ile gönderir."""
+        for event in events:
+            kind = event[0]
+            if kind == 'move':
+                xtest.fake_input(self.display, X.MotionNotify, x=event[1], y=event[2])
+            elif kind == 'button':
+                event_type = X.ButtonPress if event[2] else X.ButtonRelease
+                xtest.fake_input(self.display, event_type, self._X11_BUTTONS[event[1]])
+            elif kind == 'wheel':
+                # X11'de scroll = 4 (yukarı) / 5 (aşağı) tuşuna bas-bırak
+                x_button = 4 if event[1] > 0 else 5
+                for _ in range(abs(event[1]) // WHEEL_DELTA):
+                    xtest.fake_input(self.display, X.ButtonPress, x_button)
+                    xtest.fake_input(self.display, X.ButtonRelease, x_button)
+        self.display.flush()
+
+    def close(self):
+        if self.uinput is not None:
+            try:
+                self.uinput.close()
+            except Exception:
+                pass
+            self.uinput = None
+        if self.display is not None:
+            try:
+                self.display.close()
+            except Exception:
+                pass
+            self.display = None
+
+
+class RecordingInputBackend(InputBackend):
+    """
+    Hiçbir şeyi işletim sistemine göndermeyen, olayları bellekte kaydeden arka uç.
+    Testler ve benchmark'lar için (ekran/cihaz gerektirmez).
+    """
+
+    name = 'recording'
+
+    supports_hires_wheel = True
+
+    def __init__(self, screen_size: Optional[Tuple[int, int]] = None):
+        super().__init__(screen_size)
+        self.events: List[tuple] = []    # Gönderilen tüm olaylar (sırayla)
+        self.batches: List[list] = []    # Her enjeksiyon çağrısı ayrı liste
+        self.pressed = set()
+
+    def _send(self, events: List[tuple]):
+        for event in events:
+            if event[0] == 'button':
+                if event[2]:
+                    self.pressed.add(event[1])
+                else:
+                    self.pressed.discard(event[1])
+        self.batches.append(events)
+        self.events.extend(events)
+
+    def clear(self):
+        """Kaydedilen olayları temizler."""
+        self.events.clear()
+        self.batches.clear()
+
+
+# İsim → sınıf eşlemesi (Config.INPUT_BACKEND değerleri)
+BACKENDS = {
+    'win32': Win32InputBackend,
+    'pyautogui': PyAutoGUIInputBackend,
+    'linux': LinuxInputBackend,
+    'recording': RecordingInputBackend,
+}
+
+
+def create_input_backend(name: str = 'auto',
+                         screen_size: Optional[Tuple[int, int]] = None) -> InputBackend:
+    """
+    İsme göre input arka ucu oluşturur.
+
+    Args:
+        name: 'auto', 'win32', 'pyautogui', 'linux' veya 'recording'
+        screen_size: Ekran boyutu (None = arka uç belirler)
+
+    Returns:
+        InputBackend nesnesi
+    """
+    if name != 'auto':
+        if name not in BACKENDS:
+            raise ValueError(f"Bilinmeyen input backend: {name}")
+        return BACKENDS[name](screen_size)
+
+    # Otomatik seçim: platforma göre en hızlı yol, olmazsa pyautogui
+    candidates = []
+    if HAS_WIN32:
+        candidates.append(Win32InputBackend)
+    if platform.system() == 'Linux' and (HAS_EVDEV or HAS_XLIB):
+        candidates.append(LinuxInputBackend)
+    candidates.append(PyAutoGUIInputBackend)
+
+    for backend_cls in candidates:
+        try:
+            return backend_cls(screen_size)
+        except Exception as e:
+            print(f"⚠️  {backend_cls.name} input backend kullanılamadı: {e}")
+
+    raise RuntimeError("Kullanılabilir input backend bulunamadı")
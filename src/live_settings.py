@@ -0,0 +1,128 @@
+"""
+Live Settings Modülü
+Çalışan sistemi durdurmadan ayar değişikliği uygulama.
+
+Ayarlar değiştirilemez, sürümlü bir görüntü (snapshot) olarak tutulur.
+GUI yeni görüntüyü tek bir referans atamasıyla yayınlar (atomik); işleme
+thread'i her frame başında sadece sürüm numarasını karşılaştırır ve değişiklik
+varsa her bileşene yalnızca ilgilendiği anahtarların farkını (delta) iletir.
+Böylece bileşenler ayarları kendi thread'inde, iki frame arasında uygular.
+"""
+
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Tuple
+
+
+class SettingsSnapshot(NamedTuple):
+    """Belirli bir sürümdeki ayarların değiştirilemez görüntüsü."""
+    version: int
+    values: Mapping[str, Any]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Anahtarın değeri (yoksa default)."""
+        return self.values.get(key, default)
+
+    def diff(self, older: 'SettingsSnapshot') -> Dict[str, Any]:
+        """
+        Eski görüntüye göre değişen anahtarlar.
+
+        Args:
+            older: Karşılaştırılacak eski görüntü
+
+        Returns:
+            {anahtar: yeni değer}
+        """
+        old = older.values
+        return {key: value for key, value in self.values.items()
+                if key not in old or old[key] != value}
+
+
+class LiveSettings:
+    """
+    Sürümlü ayar yayıncısı.
+    publish() herhangi bir thread'den, apply_pending() sadece işleme thread'inden çağrılır.
+    """
+
+    def __init__(self, values: Dict[str, Any]):
+        """
+        LiveSettings sınıfını başlatır.
+
+        Args:
+            values: Başlangıç ayarları
+        """
+        self._snapshot = SettingsSnapshot(0, MappingProxyType(dict(values)))
+        self._applied = self._snapshot
+        self._consumers: List[Tuple[frozenset, Callable[[Dict[str, Any]], None]]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> SettingsSnapshot:
+        """Son yayınlanan görüntü."""
+        return self._snapshot
+
+    @property
+    def applied_version(self) -> int:
+        """İşleme thread'inin uyguladığı son sürüm."""
+        return self._applied.version
+
+    def publish(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Yeni ayarları yayınlar (değişiklik yoksa sürüm artmaz).
+
+        Args:
+            values: Güncellenecek anahtarlar (verilmeyenler korunur)
+
+        Returns:
+            Değişen anahtarlar {anahtar: yeni değer}
+        """
+        with self._lock:
+            old = self._snapshot
+            changed = {key: value for key, value in values.items()
+                       if key not in old.values or old.values[key] != value}
+            if not changed:
+                return {}
+            merged = dict(old.values)
+            merged.update(changed)
+            # Tek referans ataması: okuyucular ya eski ya yeni görüntüyü görür
+            self._snapshot = SettingsSnapshot(old.version + 1, MappingProxyType(merged))
+        return changed
+
+    def attach(self, consumers: Iterable[Tuple[Iterable[str], Callable[[Dict[str, Any]], None]]]):
+        """
+        Bileşenleri bağlar ve mevcut görüntüyü uygulanmış sayar
+        (bileşenler zaten güncel ayarlarla oluşturulmuş olmalı).
+
+        Args:
+            consumers: [(ilgilenilen anahtarlar, apply(delta) fonksiyonu), ...]
+        """
+        with self._lock:
+            self._consumers = [(frozenset(keys), apply) for keys, apply in consumers]
+            self._applied = self._snapshot
+
+    def detach(self):
+        """Tüm bileşenleri ayırır (sistem durdurulurken)."""
+        with self._lock:
+            self._consumers = []
+
+    def apply_pending(self) -> Dict[str, Any]:
+        """
+        Yeni sürüm yayınlandıysa farkları bileşenlere uygular (işleme thread'inde).
+
+        Returns:
+            Uygulanan değişiklikler (yeni sürüm yoksa boş)
+        """
+        snapshot = self._snapshot
+        if snapshot.version == self._applied.version:
+            return {}
+
+        changes = snapshot.diff(self._applied)
+        self._applied = snapshot
+        for keys, apply in self._consumers:
+            delta = {key: value for key, value in changes.items() if key in keys}
+            if delta:
+                try:
+                    apply(delta)
+                except Exception as e:
+                    print(f"❌ Ayar uygulanamadı ({', '.join(delta)}): {e}")
+        return changes
@@ -0,0 +1,153 @@
+"""
+Motion Config Modülü
+Hareket hattının (dead zone, eşleme, EMA, scroll) değiştirilemez ayar görüntüsü.
+
+Frame başında bir kez alınır ve frame boyunca tüm adımlara aynı nesne verilir;
+bu sayede GUI thread'i ayarları değiştirse bile bir frame'in yarısı eski,
+yarısı yeni değerlerle çalışmaz. Nesne oluşturulurken değerler doğrulanır ve
+türetilmiş değerler (kırpma dikdörtgeni, aktif alan oranı, EMA tablosu) bir kez
+hesaplanır; sıcak yolda sadece slot okuması yapılır.
+"""
+
+import sys
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent))
+from ema_curve import EmaCurve
+
+
+# Ayar anahtarı → alan adı
+FIELD_FOR_KEY = {
+    'CAMERA_CROP_LEFT': 'crop_left',
+    'CAMERA_CROP_RIGHT': 'crop_right',
+    'CAMERA_CROP_TOP': 'crop_top',
+    'CAMERA_CROP_BOTTOM': 'crop_bottom',
+    'SCREEN_MARGIN': 'screen_margin',
+    'MAPPING_GAMMA': 'mapping_gamma',
+    'MOUSE_SPEED': 'mouse_speed',
+    'EMA_MIN': 'ema_min',
+    'EMA_MAX': 'ema_max',
+    'EMA_FUNCTION': 'ema_function',
+    'SPEED_MIN': 'speed_min',
+    'SPEED_MAX': 'speed_max',
+    'SIGMOID_STEEPNESS': 'sigmoid_steepness',
+    'SIGMOID_MIDPOINT': 'sigmoid_midpoint',
+    'SCROLL_THRESHOLD': 'scroll_threshold',
+    'SCROLL_SENSITIVITY': 'scroll_sensitivity',
+    'SCROLL_HIGH_RESOLUTION': 'scroll_high_resolution',
+}
+
+EMA_FUNCTIONS = ('linear', 'exponential', 'sigmoid')
+
+
+@dataclass(frozen=True, slots=True)
+class MotionConfig:
+    """Donmuş hareket ayarları + önceden hesaplanmış türetilmiş değerler."""
+
+    # Bu görüntünün kapsadığı ayar anahtarları (alan değil, sınıf sabiti)
+    KEYS = tuple(FIELD_FOR_KEY)
+
+    crop_left: float
+    crop_right: float
+    crop_top: float
+    crop_bottom: float
+    screen_margin: int
+    mapping_gamma: float
+    mouse_speed: float
+    ema_min: float
+    ema_max: float
+    ema_function: str
+    speed_min: float
+    speed_max: float
+    sigmoid_steepness: float
+    sigmoid_midpoint: float
+    scroll_threshold: float
+    scroll_sensitivity: float
+    scroll_high_resolution: bool
+
+    # Türetilmiş değerler (__post_init__ içinde hesaplanır)
+    crop: Tuple[float, float, float, float] = field(init=False, compare=False)
+    active_fraction: Tuple[float, float] = field(init=False, compare=False)
+    curve: EmaCurve = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self):
+        """Değerleri doğrular ve türetilmiş değerleri hesaplar."""
+        for name in ('crop_left', 'crop_right', 'crop_top', 'crop_bottom'):
+            value = getattr(self, name)
+            if not 0.0 <= value < 0.5:
+                raise ValueError(f"{name} 0.0 - 0.5 arasında olmalı: {value}")
+        if not 0.0 < self.ema_min <= self.ema_max <= 1.0:
+            raise ValueError(f"EMA aralığı geçersiz: {self.ema_min} - {self.ema_max}")
+        if self.ema_function not in EMA_FUNCTIONS:
+            raise ValueError(f"Bilinmeyen EMA fonksiyonu: {self.ema_function}")
+        if not 0.0 <= self.speed_min < self.speed_max:
+            raise ValueError(f"Hız aralığı geçersiz: {self.speed_min} - {self.speed_max}")
+        if self.mapping_gamma <= 0 or self.screen_margin < 0 or self.scroll_sensitivity <= 0:
+            raise ValueError("MAPPING_GAMMA ve SCROLL_SENSITIVITY pozitif, SCREEN_MARGIN >= 0 olmalı")
+
+        crop = (float(self.crop_left), float(self.crop_right),
+                float(self.crop_top), float(self.crop_bottom))
+        object.__setattr__(self, 'crop', crop)
+        object.__setattr__(self, 'active_fraction',
+                           (1.0 - crop[0] - crop[1], 1.0 - crop[2] - crop[3]))
+
+        # Hız → alpha tablosu bu görüntüye ait (frame içinde configure gerekmez)
+        curve = EmaCurve()
+        curve.configure(self.ema_min, self.ema_max, self.ema_function,
+                        self.speed_min, self.speed_max,
+                        self.sigmoid_steepness, self.sigmoid_midpoint)
+        object.__setattr__(self, 'curve', curve)
+
+    @classmethod
+    def from_config(cls, config, overrides: Optional[Dict[str, Any]] = None) -> 'MotionConfig':
+        """
+        Config sınıfından (ve isteğe bağlı değişikliklerden) görüntü oluşturur.
+
+        Args:
+            config: Config sınıfı (ayar anahtarları sınıf özelliği olarak)
+            overrides: {ayar anahtarı: değer} (Config'in üzerine yazılır)
+
+        Returns:
+            Doğrulanmış MotionConfig
+        """
+        overrides = overrides or {}
+        values = {name: overrides.get(key, getattr(config, key))
+                  for key, name in FIELD_FOR_KEY.items()}
+        return cls(**values)
+
+    def with_changes(self, changes: Dict[str, Any]) -> 'MotionConfig':
+        """
+        Değişiklikleri uygulanmış yeni görüntü (bu nesne değişmez).
+
+        Args:
+            changes: {ayar anahtarı: yeni değer} (tanınmayan anahtarlar yok sayılır)
+
+        Returns:
+            Yeni MotionConfig (değişiklik yoksa kendisi)
+
+        Raises:
+            ValueError: Yeni değerler geçersizse (eski görüntü kullanılmaya devam eder)
+        """
+        fields = {FIELD_FOR_KEY[key]: value for key, value in changes.items() if key in FIELD_FOR_KEY}
+        return replace(self, **fields) if fields else self
+
+    def crop_rect(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """
+        Kamera görüntüsündeki aktif alan (yeşil dikdörtgen).
+
+        Args:
+            width: Görüntü genişliği
+            height: Görüntü yüksekliği
+
+        Returns:
+            (sol, üst, sağ, alt) piksel
+        """
+        left, right, top, bottom = self.crop
+        return (int(width * left), int(height * top),
+                int(width * (1 - right)), int(height * (1 - bottom)))
+
+    def alpha_for(self, speed: float) -> float:
+        """Hıza karşılık gelen EMA alpha (önceden kurulmuş tablodan)."""
+        return self.curve.lookup(speed)
@@ -1,31 +1,24 @@
 """
 Mouse Controller Modülü
-pyautogui kullanarak mouse hareketleri ve tıklama işlemlerini yönetir.
+Koordinat dönüşümü, yumuşatma ve tıklama mantığını yönetir.
+Olaylar işletim sistemine bir InputBackend üzerinden iletilir.
 """
 
-import pyautogui
+import math
 import time
-from typing import Tuple, Optional
+from typing import Any, Dict, Tuple, Optional
 from collections import deque
-import platform
+import numpy as np
 import sys
 from pathlib import Path
 
 # Config'i import et
 sys.path.append(str(Path(__file__).parent))
 from config import Config
-
-# Windows için ek kütüphane
-if platform.system() == 'Windows':
-    try:
-        import win32api
-        import win32con
-        USE_WIN32 = True
-    except ImportError:
-        USE_WIN32 = False
-        print("⚠️  win32api yüklü değil, pyautogui kullanılacak")
-else:
-    USE_WIN32 = False
+from input_backend import InputBackend, create_input_backend
+from screen_mapping import CoordinateTransform
+from display_topology import DisplayTopology, create_display_topology
+from motion_config import MotionConfig
 
 
 class MouseController:
@@ -34,11 +27,16 @@ class MouseController:
     Koordinat dönüşümü, hareket yumuşatma ve tıklama işlemlerini yönetir.
     """
     
+    # Çalışırken uygulanabilen ayarlar (bkz. apply_settings)
+    SETTINGS_KEYS = MotionConfig.KEYS + ('TARGET_MONITOR',)
+    
     def __init__(self, 
                  camera_width: int,
                  camera_height: int,
                  smoothing_factor: int = 1,
-                 speed_multiplier: float = 3):
+                 speed_multiplier: float = 3,
+                 backend: Optional[InputBackend] = None,
+                 topology: Optional[DisplayTopology] = None):
         """
         MouseController sınıfını başlatır.
         
@@ -47,23 +45,45 @@ class MouseController:
             camera_height: Kamera görüntü yüksekliği (piksel)
             smoothing_factor: Hareket yumuşatma için kullanılacak frame sayısı
             speed_multiplier: Mouse hassasiyet çarpanı
+            backend: Mouse olaylarını gönderecek arka uç (None = Config.INPUT_BACKEND)
+            topology: Monitör topolojisi (None = işletim sisteminden oku)
         """
-        # Ekran boyutlarını al
-        self.screen_width, self.screen_height = pyautogui.size()
+        # Input arka ucu (win32 / linux / pyautogui / recording)
+        self.backend = backend if backend is not None else create_input_backend(Config.INPUT_BACKEND)
+        
+        # Monitör topolojisi (sadece ekran değişikliği olayında yenilenir)
+        self.topology = topology if topology is not None else create_display_topology(self.backend)
+        self.target_monitor = Config.TARGET_MONITOR
+        
+        # Hedef ekran alanı (sanal masaüstü koordinatlarında)
+        self.screen_x, self.screen_y, self.screen_width, self.screen_height = \
+            self.topology.target_rect(self.target_monitor)
+        self.backend.set_virtual_desktop(self.topology.virtual_rect())
+        
+        # Ekran değişikliği: izleme thread'i (hedef alan, sanal masaüstü) çiftini tek
+        # atamayla yayınlar, işleme thread'i begin_frame'de uygular (yarım alan okunmaz)
+        self._display = (self.topology.target_rect(self.target_monitor), self.topology.virtual_rect())
+        self._pending_display = self._display
+        self.topology.add_listener(self._on_display_change)
+        self.topology.start_watching()
         
         # Kamera boyutları
         self.camera_width = camera_width
         self.camera_height = camera_height
         
+        # Kamera → ekran dönüşümü (parametreler değişince yeniden hesaplanır)
+        self.transform = CoordinateTransform()
+        self.mirror_input = False  # Landmark'lar çevrilmemiş görüntüden geliyorsa True
+        
+        # Hareket ayarları: donmuş görüntü (apply_settings yenisiyle değiştirir),
+        # frame_config ise begin_frame'de alınan ve frame boyunca kullanılan görüntü
+        self.motion = MotionConfig.from_config(Config, {'MOUSE_SPEED': speed_multiplier})
+        self.frame_config = self.motion
+        
         # Hareket parametreleri
         self.speed_multiplier = speed_multiplier
         self.smoothing_factor = smoothing_factor
         
-        # EMA ayarları (Config'ten kopyala, sonra güncellenebilir)
-        self.ema_min = Config.EMA_MIN
-        self.ema_max = Config.EMA_MAX
-        self.ema_function = Config.EMA_FUNCTION
-        
         # Koordinat yumuşatma için buffer (FIFO kuyruk)
         self.smooth_x = deque(maxlen=smoothing_factor)
         self.smooth_y = deque(maxlen=smoothing_factor)
@@ -72,17 +92,13 @@ class MouseController:
         self.ema_x = None
         self.ema_y = None
         # Başlangıç alpha: Min ve Max'ın ortası
-        self.ema_alpha = (self.ema_min + self.ema_max) / 2
+        self.ema_alpha = (self.motion.ema_min + self.motion.ema_max) / 2
         
         # Dinamik smoothing için hız takibi
         self.prev_screen_x = None
         self.prev_screen_y = None
         self.current_speed = 0
         
-        # Güvenlik ayarları
-        pyautogui.FAILSAFE = True  # Fareyi köşeye götürerek acil durdurma
-        pyautogui.PAUSE = 0         # Gecikme KAPALI - maksimum hız için
-        
         # Durum değişkenleri
         self.last_click_time = 0
         self.click_cooldown = 0.3  # Tıklamalar arası minimum süre (saniye)
@@ -97,18 +113,22 @@ class MouseController:
         self.prev_scroll_y = None  # Scroll için önceki Y pozisyonu
         
         # Aktif alan hesapla
-        active_width_percent = (1 - Config.CAMERA_CROP_LEFT - Config.CAMERA_CROP_RIGHT) * 100
-        active_height_percent = (1 - Config.CAMERA_CROP_TOP - Config.CAMERA_CROP_BOTTOM) * 100
+        active_width_percent = self.motion.active_fraction[0] * 100
+        active_height_percent = self.motion.active_fraction[1] * 100
         
         print(f"🖱️  Mouse Controller başlatıldı")
-        print(f"   Ekran çözünürlüğü: {self.screen_width}x{self.screen_height}")
+        print(f"   Input backend: {self.backend.name}")
+        print(f"   Ekran çözünürlüğü: {self.screen_width}x{self.screen_height} "
+              f"({len(self.topology.monitors)} monitör, hedef: {self.target_monitor})")
         print(f"   Kamera çözünürlüğü: {self.camera_width}x{self.camera_height}")
         print(f"   Aktif alan: %{active_width_percent:.0f} x %{active_height_percent:.0f} (ortada)")
-        print(f"   Yumuşatma: Dinamik EMA ({self.ema_min}-{self.ema_max}) - {self.ema_function.upper()}")
+        print(f"   Yumuşatma: Dinamik EMA ({self.motion.ema_min}-{self.motion.ema_max}) - "
+              f"{self.motion.ema_function.upper()}")
     
     def map_coordinates(self, 
                        camera_x: int, 
-                       camera_y: int) -> Tuple[int, int]:
+                       camera_y: int,
+                       cfg: Optional[MotionConfig] = None) -> Tuple[int, int]:
         """
         Kamera koordinatlarını ekran koordinatlarına dönüştürür.
         Yeşil dikdörtgen = Ekranın kenarları
@@ -116,29 +136,95 @@ class MouseController:
         Args:
             camera_x: Kamera X koordinatı
             camera_y: Kamera Y koordinatı
+            cfg: Frame'in ayar görüntüsü (None = frame_config)
             
         Returns:
             (screen_x, screen_y) ekran koordinatları
         """
-        # Yeşil dikdörtgenin sınırları
-        rect_left = self.camera_width * Config.CAMERA_CROP_LEFT
-        rect_right = self.camera_width * (1 - Config.CAMERA_CROP_RIGHT)
-        rect_top = self.camera_height * Config.CAMERA_CROP_TOP
-        rect_bottom = self.camera_height * (1 - Config.CAMERA_CROP_BOTTOM)
+        self._refresh_transform(cfg or self.frame_config)
+        return self.transform.map_point(camera_x, camera_y)
+    
+    def map_landmarks(self, landmarks) -> np.ndarray:
+        """
+        Birden fazla kamera noktasını (örn. 21 landmark) tek seferde ekrana dönüştürür.
         
-        rect_width = rect_right - rect_left
-        rect_height = rect_bottom - rect_top
+        Args:
+            landmarks: [(x, y), ...] listesi veya Nx2 dizi
+            
+        Returns:
+            Nx2 ekran koordinatları
+        """
+        self._refresh_transform(self.frame_config)
+        return self.transform.map_points(landmarks)
+    
+    def set_camera_size(self, width: int, height: int):
+        """
+        Gerçek frame boyutunu bildirir (kamera istenen çözünürlüğü vermeyebilir).
+        
+        Args:
+            width: Frame genişliği
+            height: Frame yüksekliği
+        """
+        self.camera_width = width
+        self.camera_height = height
+    
+    def _refresh_transform(self, cfg: MotionConfig):
+        """Kırpma / çözünürlük / ekran değiştiyse dönüşümü yeniden hesaplar."""
+        self.transform.update(
+            camera_size=(self.camera_width, self.camera_height),
+            screen_size=(self.screen_width, self.screen_height),
+            crop=cfg.crop,
+            margin=cfg.screen_margin,
+            gamma=cfg.mapping_gamma,
+            mirror=self.mirror_input,
+            screen_origin=(self.screen_x, self.screen_y)
+        )
+    
+    def apply_settings(self, changes: Dict[str, Any]):
+        """
+        Canlı ayar değişikliklerini uygular (işleme thread'inde, iki frame arasında).
+        Yeni donmuş görüntü bir sonraki begin_frame'de devreye girer.
         
-        # Basit mapping: Dikdörtgen = Ekran
-        # Sol üst köşe (rect_left, rect_top) = Ekran (0, 0)
-        # Sağ alt köşe (rect_right, rect_bottom) = Ekran (screen_width, screen_height)
-        norm_x = (camera_x - rect_left) / rect_width
-        norm_y = (camera_y - rect_top) / rect_height
+        Args:
+            changes: {ayar anahtarı: yeni değer} (sadece SETTINGS_KEYS)
+            
+        Raises:
+            ValueError: Değerler geçersizse (önceki görüntü kullanılmaya devam eder)
+        """
+        self.motion = self.motion.with_changes(changes)
+        self.speed_multiplier = self.motion.mouse_speed
         
-        screen_x = int(norm_x * self.screen_width)
-        screen_y = int(norm_y * self.screen_height)
+        if 'TARGET_MONITOR' in changes:
+            self.set_target_monitor(changes['TARGET_MONITOR'])
+    
+    def set_target_monitor(self, selection):
+        """
+        Kamera alanının eşleneceği ekranı seçer.
         
-        return (screen_x, screen_y)
+        Args:
+            selection: 'primary', 'virtual' veya monitör index'i
+        """
+        self.target_monitor = selection
+        self._on_display_change(self.topology)
+    
+    def _on_display_change(self, topology: DisplayTopology):
+        """
+        Monitör eklendi / çıkarıldı / çözünürlük veya DPI değişti.
+        İzleme thread'inden çağrılır; yeni alan bir sonraki begin_frame'de uygulanır.
+        """
+        self._pending_display = (topology.target_rect(self.target_monitor), topology.virtual_rect())
+    
+    def _apply_display_change(self):
+        """Bekleyen ekran değişikliğini uygular (işleme thread'i, frame başında)."""
+        pending = self._pending_display
+        if pending is self._display:
+            return
+        self._display = pending
+        rect, virtual = pending
+        self.screen_x, self.screen_y, self.screen_width, self.screen_height = rect
+        self.backend.set_virtual_desktop(virtual)
+        print(f"🖥️  Ekran değişti: {self.screen_width}x{self.screen_height} "
+              f"@ ({self.screen_x}, {self.screen_y})")
     
     def calculate_speed(self, x: int, y: int) -> float:
         """
@@ -158,10 +244,7 @@ class MouseController:
             return 0
         
         # Önceki pozisyona göre mesafe hesapla
-        import math
-        dx = x - self.prev_screen_x
-        dy = y - self.prev_screen_y
-        speed = math.sqrt(dx*dx + dy*dy)
+        speed = math.hypot(x - self.prev_screen_x, y - self.prev_screen_y)
         
         # Pozisyonu güncelle
         self.prev_screen_x = x
@@ -169,60 +252,26 @@ class MouseController:
         
         return speed
     
-    def update_dynamic_ema(self, speed: float):
+    def update_dynamic_ema(self, speed: float, cfg: Optional[MotionConfig] = None):
         """
-        Hareket hızına göre EMA alpha değerini sürekli fonksiyonla hesaplar.
+        Hareket hızına göre EMA alpha değerini günceller.
         
-        3 Fonksiyon Tipi:
-        - Linear: Doğrusal artış (basit, tahmin edilebilir)
-        - Exponential: Üstel artış (hızlı tepki)
-        - Sigmoid: S-eğrisi (en doğal, yumuşak geçişler)
+        Eğri (linear / exponential / sigmoid) ayar görüntüsüyle birlikte bir kez
+        kurulan tablodan okunur.
         
         Args:
             speed: Hareket hızı (piksel/frame)
+            cfg: Frame'in ayar görüntüsü (None = frame_config)
         """
-        import math
-        
-        # Hızı normalize et (0.0 - 1.0 arası)
-        normalized_speed = max(0.0, min(1.0, 
-            (speed - Config.SPEED_MIN) / (Config.SPEED_MAX - Config.SPEED_MIN)
-        ))
-        
-        # Fonksiyon tipine göre EMA hesapla
-        if self.ema_function == 'linear':
-            # Doğrusal interpolasyon (basit)
-            ema_normalized = normalized_speed
-        
-        elif self.ema_function == 'exponential':
-            # Üstel fonksiyon (hızlı tepki)
-            # y = x^2 (daha yumuşak başlangıç, hızlı bitiş)
-            ema_normalized = normalized_speed ** 2
-        
-        elif self.ema_function == 'sigmoid':
-            # Sigmoid (lojistik) fonksiyon (en doğal)
-            # S-eğrisi: Yavaş başlangıç, hızlı orta, yavaş bitiş
-            # f(x) = 1 / (1 + e^(-k*(x - x0)))
-            k = Config.SIGMOID_STEEPNESS
-            x0 = Config.SIGMOID_MIDPOINT
-            
-            # Sigmoid'i orijinal hız değerine uygula (daha iyi sonuç)
-            sigmoid_value = 1.0 / (1.0 + math.exp(-k * (speed - x0)))
-            ema_normalized = sigmoid_value
-        
-        else:
-            # Varsayılan: Linear
-            ema_normalized = normalized_speed
-        
-        # EMA alpha değerini hesapla (min-max arasında)
-        self.ema_alpha = self.ema_min + (self.ema_max - self.ema_min) * ema_normalized
-        
-        # Sınırları kontrol et
-        self.ema_alpha = max(self.ema_min, min(self.ema_max, self.ema_alpha))
+        self.ema_alpha = (cfg or self.frame_config).alpha_for(speed)
         
         # Hız takibi (EMA ile yumuşat)
         self.current_speed = 0.3 * speed + 0.7 * self.current_speed
     
-    def smooth_coordinates(self, x: int, y: int) -> Tuple[int, int]:
+    def smooth_coordinates(self,
+                           x: int,
+                           y: int,
+                           cfg: Optional[MotionConfig] = None) -> Tuple[int, int]:
         """
         Koordinatları yumuşatarak titreşimi azaltır.
         Dinamik Exponential Moving Average (EMA) kullanır - hıza göre otomatik ayarlama.
@@ -230,6 +279,7 @@ class MouseController:
         Args:
             x: Ham X koordinatı
             y: Ham Y koordinatı
+            cfg: Frame'in ayar görüntüsü (None = frame_config)
             
         Returns:
             (smoothed_x, smoothed_y) yumuşatılmış koordinatlar
@@ -238,7 +288,7 @@ class MouseController:
         speed = self.calculate_speed(x, y)
         
         # Hıza göre EMA alpha'yı dinamik ayarla
-        self.update_dynamic_ema(speed)
+        self.update_dynamic_ema(speed, cfg)
         
         # İlk değer ise direkt ata
         if self.ema_x is None:
@@ -255,29 +305,39 @@ class MouseController:
         
         return (int(self.ema_x), int(self.ema_y))
     
+    def begin_frame(self):
+        """
+        Frame başlangıcı: bu frame'de üretilen hareket, tuş ve scroll olayları
+        end_frame() çağrılana kadar birleştirilmek üzere bekletilir.
+        Ayar görüntüsü ve ekran değişikliği burada bir kez alınır ve frame boyunca değişmez.
+        """
+        self._apply_display_change()
+        self.frame_config = self.motion
+        self.backend.begin_frame()
+    
+    def end_frame(self):
+        """Frame sonu: bekleyen olayları tek enjeksiyon çağrısıyla gönderir."""
+        self.backend.end_frame()
+    
     def move_mouse(self, camera_x: int, camera_y: int):
         """
         Mouse'u belirtilen kamera koordinatına göre hareket ettirir.
         Koordinat dönüşümü ve yumuşatma uygular.
-        Win32 API kullanarak maksimum hız sağlar.
         
         Args:
             camera_x: Kamera X koordinatı
             camera_y: Kamera Y koordinatı
         """
+        cfg = self.frame_config
+        
         # Koordinat dönüşümü yap
-        screen_x, screen_y = self.map_coordinates(camera_x, camera_y)
+        screen_x, screen_y = self.map_coordinates(camera_x, camera_y, cfg)
         
         # Yumuşatma uygula (EMA - her zaman aktif)
-        smooth_x, smooth_y = self.smooth_coordinates(screen_x, screen_y)
-        
-        # Mouse'u hareket ettir - Win32 API çok daha hızlı!
-        if USE_WIN32:
-            # Direkt Windows API kullan (en hızlı yöntem)
-            win32api.SetCursorPos((smooth_x, smooth_y))
-        else:
-            # PyAutoGUI fallback (daha yavaş)
-            pyautogui.moveTo(smooth_x, smooth_y, duration=0, _pause=False)
+        smooth_x, smooth_y = self.smooth_coordinates(screen_x, screen_y, cfg)
+        
+        # Mouse'u hareket ettir (arka uç pozisyonu kendisi takip eder)
+        self.backend.move_to(smooth_x, smooth_y)
     
     def left_click(self) -> bool:
         """
@@ -294,18 +354,8 @@ class MouseController:
             return False
         
         try:
-            # Windows'ta doğrudan win32api kullan (daha güvenilir)
-            if USE_WIN32:
-                x, y = pyautogui.position()
-                win32api.SetCursorPos((x, y))
-                win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, x, y, 0, 0)
-                time.sleep(0.05)
-                win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, x, y, 0, 0)
-                print("✅ Sol tıklama (win32) gerçekleştirildi!")
-            else:
-                # PyAutoGUI kullan
-                pyautogui.click(button='left', clicks=1, interval=0.1)
-                print("✅ Sol tıklama (pyautogui) gerçekleştirildi!")
+            self.backend.click('left')
+            print(f"✅ Sol tıklama ({self.backend.name}) gerçekleştirildi!")
         except Exception as e:
             print(f"❌ Sol tıklama hatası: {e}")
             return False
@@ -324,11 +374,7 @@ class MouseController:
             return False  # Zaten basılı
         
         try:
-            if USE_WIN32:
-                x, y = pyautogui.position()
-                win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, x, y, 0, 0)
-            else:
-                pyautogui.mouseDown(button='left')
+            self.backend.button_down('left')
             
             self.left_button_pressed = True
             print("🔵 Sol tuş basıldı (basılı tutuluyor)")
@@ -348,11 +394,7 @@ class MouseController:
             return False  # Zaten bırakılmış
         
         try:
-            if USE_WIN32:
-                x, y = pyautogui.position()
-                win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, x, y, 0, 0)
-            else:
-                pyautogui.mouseUp(button='left')
+            self.backend.button_up('left')
             
             self.left_button_pressed = False
             print("⚪ Sol tuş bırakıldı")
@@ -376,18 +418,8 @@ class MouseController:
             return False
         
         try:
-            # Windows'ta doğrudan win32api kullan (daha güvenilir)
-            if USE_WIN32:
-                x, y = pyautogui.position()
-                win32api.SetCursorPos((x, y))
-                win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTDOWN, x, y, 0, 0)
-                time.sleep(0.05)
-                win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTUP, x, y, 0, 0)
-                print("✅ Sağ tıklama (win32) gerçekleştirildi!")
-            else:
-                # PyAutoGUI kullan
-                pyautogui.click(button='right', clicks=1, interval=0.1)
-                print("✅ Sağ tıklama (pyautogui) gerçekleştirildi!")
+            self.backend.click('right')
+            print(f"✅ Sağ tıklama ({self.backend.name}) gerçekleştirildi!")
         except Exception as e:
             print(f"❌ Sağ tıklama hatası: {e}")
             return False
@@ -406,11 +438,7 @@ class MouseController:
             return False  # Zaten basılı
         
         try:
-            if USE_WIN32:
-                x, y = pyautogui.position()
-                win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTDOWN, x, y, 0, 0)
-            else:
-                pyautogui.mouseDown(button='right')
+            self.backend.button_down('right')
             
             self.right_button_pressed = True
             print("🔴 Sağ tuş basıldı (basılı tutuluyor)")
@@ -430,11 +458,7 @@ class MouseController:
             return False  # Zaten bırakılmış
         
         try:
-            if USE_WIN32:
-                x, y = pyautogui.position()
-                win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTUP, x, y, 0, 0)
-            else:
-                pyautogui.mouseUp(button='right')
+            self.backend.button_up('right')
             
             self.right_button_pressed = False
             print("⚪ Sağ tuş bırakıldı")
@@ -467,28 +491,27 @@ class MouseController:
         # Y farkını hesapla
         y_diff = self.prev_scroll_y - y_position  # Yukarı hareket = pozitif
         
+        cfg = self.frame_config
+        
         # Minimum hareket eşiğini kontrol et
-        if abs(y_diff) < Config.SCROLL_THRESHOLD:
+        if abs(y_diff) < cfg.scroll_threshold:
             return False
         
-        # Scroll miktarını hesapla
-        scroll_amount = int(y_diff / Config.SCROLL_SENSITIVITY)
+        # Scroll miktarını hesapla (yüksek çözünürlükte kesirli çark adımı)
+        scroll_amount = y_diff / cfg.scroll_sensitivity
+        if not cfg.scroll_high_resolution:
+            scroll_amount = int(scroll_amount)
         
         if scroll_amount != 0:
             try:
-                if USE_WIN32:
-                    # Win32 API ile scroll (120 birim = 1 scroll çark adımı)
-                    win32api.mouse_event(win32con.MOUSEEVENTF_WHEEL, 0, 0, scroll_amount * 120, 0)
-                else:
-                    # PyAutoGUI ile scroll
-                    pyautogui.scroll(scroll_amount)
+                self.backend.scroll(scroll_amount)
                 
                 # Pozisyonu güncelle
                 self.prev_scroll_y = y_position
                 self.last_scroll_time = current_time
                 
                 direction = "↑" if scroll_amount > 0 else "↓"
-                print(f"🔄 Scroll {direction} ({scroll_amount})")
+                print(f"🔄 Scroll {direction} ({scroll_amount:.2f})")
                 return True
             except Exception as e:
                 print(f"❌ Scroll hatası: {e}")
@@ -502,6 +525,7 @@ class MouseController:
         Scroll jesti bittiğinde çağrılmalı.
         """
         self.prev_scroll_y = None
+        self.backend.reset_scroll()
     
     def double_click(self) -> bool:
         """
@@ -517,7 +541,7 @@ class MouseController:
             return False
         
         # Çift tıklama yap
-        pyautogui.doubleClick()
+        self.backend.double_click('left')
         self.last_click_time = current_time
         
         return True
@@ -541,9 +565,15 @@ class MouseController:
     
     def get_current_position(self) -> Tuple[int, int]:
         """
-        Şu anki mouse pozisyonunu döndürür.
+        Şu anki mouse pozisyonunu döndürür (arka ucun takip ettiği değer).
         
         Returns:
             (x, y) ekran koordinatları
         """
-        return pyautogui.position()
+        return self.backend.position()
+    
+    def close(self):
+        """Input arka ucunu ve ekran izlemeyi kapatır."""
+        self.topology.remove_listener(self._on_display_change)
+        self.topology.stop_watching()
+        self.backend.close()
@@ -1,12 +1,20 @@
 """
 Overlay Display Modülü
 Ekran üzerinde her zaman görünen, tıklanamayan (click-through) bilgi paneli.
+
+İki çalışma şekli vardır:
+- Bağımsız: kendi thread'inde ayrı bir tk.Tk() çalıştırır (main.py, OpenCV döngüsü)
+- Gömülü: mevcut bir Tk kökünün Toplevel'ı olur (GUI); durum kilit altında tek
+  bir son-durum sözlüğüne işlenir, kökün kendi thread'i after() yoklamasıyla
+  değişenleri çizer (ikinci Tcl yorumlayıcısı yok)
 """
 
 import tkinter as tk
-from typing import Dict, Optional
+from collections import deque
+from typing import Dict, List, Optional
 import threading
 import platform
+import time
 
 # Windows API için
 if platform.system() == 'Windows':
@@ -28,18 +36,66 @@ class OverlayDisplay:
     Her zaman en üstte kalır ve durum bilgilerini gösterir.
     """
     
-    def __init__(self, position: str = 'topright'):
+    # Veri anahtarı → etkilediği label
+    _LABEL_FOR_KEY = {
+        'fps': 'fps',
+        'latency': 'latency',
+        'frame_age': 'frames',
+        'dropped': 'frames',
+        'right_hand': 'right_hand',
+        'right_hand_color': 'right_hand',
+        'left_hand': 'left_hand',
+        'left_hand_color': 'left_hand',
+        'global_pause': 'global_pause',
+        'current_gesture': 'gesture',
+        'speech_active': 'speech',
+    }
+    
+    # Canvas çizici yerleşimi: sparkline kutuları (x, y, genişlik, yükseklik)
+    _GRAPH_BOXES = {
+        'fps_graph': (20, 189, 150, 45),
+        'latency_graph': (180, 189, 150, 45),
+    }
+    
+    def __init__(self,
+                 position: str = 'topright',
+                 max_rate: float = 12.0,
+                 renderer: str = 'widgets',
+                 history: int = 120):
         """
         OverlayDisplay sınıfını başlatır.
         
         Args:
             position: Pencerenin konumu ('topright', 'topleft', 'bottomright', 'bottomleft')
+            max_rate: Saniyedeki maksimum ekran yenileme sayısı (Hz)
+            renderer: 'widgets' (Label/Frame ağacı) veya 'canvas' (tek Canvas + sparkline)
+            history: Sparkline halka tamponunun uzunluğu (örnek sayısı)
         """
         self.position = position
+        self.renderer = renderer if renderer in ('widgets', 'canvas') else 'widgets'
         self.window = None
         self.labels = {}
         self.is_running = False
         
+        # Canvas çizici: tek Canvas ve önceden oluşturulmuş item id'leri
+        self.canvas = None
+        self.items = {}
+        
+        # Sparkline halka tamponları (sadece canvas çizicide doldurulur)
+        self.fps_history = deque(maxlen=history)
+        self.latency_history = deque(maxlen=history)
+        
+        # Yenileme kontrolü: değişen label'lar, bekleyen yenileme, hız sınırı
+        self.min_interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.poll_interval = max(self.min_interval, 0.01)
+        self._dirty = set()
+        self._refresh_pending = False
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+        
+        # Gömülü mod: ana Tk kökü (durum status_data'ya işlenir, kök yoklar)
+        self.master = None
+        
         # Renkler (hex formatında)
         self.colors = {
             'bg': '#1a1a1a',           # Koyu gri arka plan
@@ -54,6 +110,9 @@ class OverlayDisplay:
         # Durum verileri
         self.status_data = {
             'fps': 0,
+            'latency': 0.0,
+            'frame_age': 0.0,
+            'dropped': 0,
             'right_hand': 'YOK',
             'right_hand_color': 'red',
             'left_hand': 'YOK',
@@ -65,16 +124,29 @@ class OverlayDisplay:
         
         print("📺 Overlay Display hazırlanıyor...")
     
-    def start(self):
-        """Overlay penceresini başlatır (ayrı thread'de)."""
+    def start(self, master: Optional[tk.Misc] = None):
+        """
+        Overlay penceresini başlatır.
+        
+        Args:
+            master: Mevcut Tk kökü (verilirse onun Toplevel'ı olarak, aynı thread'de
+                    çalışır; None ise ayrı thread'de kendi Tk kökünü açar)
+        """
         if self.is_running:
             return
         
         self.is_running = True
         
-        # Tkinter'ı ayrı thread'de çalıştır
-        self.thread = threading.Thread(target=self._run_window, daemon=True)
-        self.thread.start()
+        if master is not None:
+            # Gömülü mod: çağıran thread Tk kökünün thread'i olmalı
+            self.master = master
+            self.window = tk.Toplevel(master)
+            self._setup_window()
+            self.window.after(int(self.poll_interval * 1000), self._poll_updates)
+        else:
+            # Tkinter'ı ayrı thread'de çalıştır
+            self.thread = threading.Thread(target=self._run_window, daemon=True)
+            self.thread.start()
         
         print("✅ Overlay Display başlatıldı (monitör üzerinde)")
     
@@ -82,11 +154,18 @@ class OverlayDisplay:
         """Tkinter penceresini oluşturur ve çalıştırır."""
         # Ana pencere oluştur
         self.window = tk.Tk()
+        self._setup_window()
+        
+        # Pencereyi çalıştır
+        self.window.mainloop()
+    
+    def _setup_window(self):
+        """Pencere konumunu, görünümünü ve click-through ayarını yapar."""
         self.window.title("Hand Mouse - Status")
         
-        # Pencere boyutu
+        # Pencere boyutu (canvas çizici sparkline'lar için daha uzun)
         width = 350
-        height = 330
+        height = 424 if self.renderer == 'canvas' else 355
         
         # Pencere konumunu belirle
         screen_width = self.window.winfo_screenwidth()
@@ -119,7 +198,10 @@ class OverlayDisplay:
         self.window.overrideredirect(True)
         
         # UI elementlerini oluştur
-        self._create_ui()
+        if self.renderer == 'canvas':
+            self._create_canvas_ui()
+        else:
+            self._create_ui()
         
         # Windows'ta click-through yap (mouse geçsin, tıklanamaz olsun)
         if HAS_WIN32:
@@ -136,9 +218,6 @@ class OverlayDisplay:
             # Şeffaflığı ayarla (0-255, 245 = %96)
             win32gui.SetLayeredWindowAttributes(hwnd, 0, 120, win32con.LWA_ALPHA)
             print("✅ Click-through aktif - Mouse altındaki pencerelerle etkileşir")
-        
-        # Pencereyi çalıştır
-        self.window.mainloop()
     
     def _create_ui(self):
         """UI elementlerini oluşturur."""
@@ -177,6 +256,27 @@ class OverlayDisplay:
         )
         self.labels['fps'].pack(side='right')
         
+        # Frame yaşı / atılan frame sayısı
+        frames_frame = tk.Frame(self.window, bg=self.colors['bg'])
+        frames_frame.pack(fill='x', padx=20, pady=3)
+        
+        tk.Label(
+            frames_frame,
+            text="FRAME YAŞI:",
+            font=('Consolas', 11, 'bold'),
+            bg=self.colors['bg'],
+            fg=self.colors['text']
+        ).pack(side='left')
+        
+        self.labels['frames'] = tk.Label(
+            frames_frame,
+            text="0 ms / 0 atıldı",
+            font=('Consolas', 11),
+            bg=self.colors['bg'],
+            fg=self.colors['yellow']
+        )
+        self.labels['frames'].pack(side='right')
+        
         # Sağ El Durumu
         right_frame = tk.Frame(self.window, bg=self.colors['bg'])
         right_frame.pack(fill='x', padx=20, pady=3)
@@ -274,82 +374,238 @@ class OverlayDisplay:
         )
         self.labels['speech'].pack(side='bottom', pady=8)
     
+    def _create_canvas_ui(self):
+        """
+        Tüm paneli tek bir Canvas üzerine çizer.
+        Metin ve çizgi item'ları bir kez oluşturulur; yenilemede sadece
+        itemconfigure / coords ile değiştirilir (widget ağacı yok).
+        """
+        bg = self.colors['bg']
+        self.canvas = tk.Canvas(self.window, bg=bg, highlightthickness=0, bd=0)
+        self.canvas.pack(fill='both', expand=True)
+        c = self.canvas
+        
+        # Başlık ve ayırıcı
+        c.create_text(175, 22, text="🖐️ HAND MOUSE CONTROLLER",
+                      font=('Consolas', 14, 'bold'), fill=self.colors['cyan'])
+        c.create_line(10, 44, 340, 44, fill=self.colors['cyan'], width=2)
+        
+        # Etiket: değer satırları
+        rows = [
+            ('fps', "FPS:", 66, "0", 'yellow'),
+            ('latency', "GECİKME:", 90, "0.0 ms", 'yellow'),
+            ('right_hand', "SAĞ EL:", 114, "YOK", 'red'),
+            ('left_hand', "SOL EL:", 138, "YOK", 'red'),
+            ('frames', "FRAME YAŞI:", 162, "0 ms / 0 atıldı", 'yellow'),
+        ]
+        for key, caption, y, text, color in rows:
+            c.create_text(20, y, text=caption, anchor='w',
+                          font=('Consolas', 11, 'bold'), fill=self.colors['text'])
+            self.items[key] = c.create_text(330, y, text=text, anchor='e',
+                                            font=('Consolas', 11, 'bold'),
+                                            fill=self.colors[color])
+        
+        # Sparkline kutuları (FPS ve gecikme)
+        for key, caption, color in (('fps_graph', "FPS", 'green'),
+                                    ('latency_graph', "ms", 'orange')):
+            x, y, w, h = self._GRAPH_BOXES[key]
+            c.create_rectangle(x, y, x + w, y + h, outline='#333333')
+            c.create_text(x + 3, y + 2, text=caption, anchor='nw',
+                          font=('Consolas', 7), fill='#777777')
+            self.items[key] = c.create_line(x, y + h, x + w, y + h,
+                                            fill=self.colors[color], width=1)
+        
+        c.create_line(10, 250, 340, 250, fill=self.colors['cyan'], width=2)
+        
+        # Global Pause
+        self.items['global_pause'] = c.create_text(175, 274, text="",
+                                                   font=('Consolas', 12, 'bold'),
+                                                   fill=self.colors['red'])
+        
+        # Güncel Jest
+        c.create_text(20, 302, text="Jest:", anchor='w',
+                      font=('Consolas', 10), fill=self.colors['text'])
+        self.items['gesture'] = c.create_text(330, 302, text="Bekleniyor...", anchor='e',
+                                              font=('Consolas', 10), fill=self.colors['yellow'])
+        
+        # Sesli Yazma Durumu ve alt bilgi
+        self.items['speech'] = c.create_text(175, 364, text="🎤 Hazır",
+                                             font=('Consolas', 11, 'bold'),
+                                             fill=self.colors['green'])
+        c.create_text(175, 406, text="'q' - Çıkış | İşaret parmakları - Pause",
+                      font=('Consolas', 8), fill=self.colors['text'])
+    
     def update(self, **kwargs):
         """
-        Overlay verilerini günceller.
+        Overlay verilerini günceller (herhangi bir thread'den çağrılabilir).
         
         Args:
-            **kwargs: Güncellenecek veriler (fps, right_hand, left_hand, vb.)
+            **kwargs: Güncellenecek veriler (fps, latency, right_hand, left_hand, vb.)
         """
         if not self.is_running or not self.window:
             return
         
-        # Verileri güncelle
-        for key, value in kwargs.items():
-            if key in self.status_data:
-                self.status_data[key] = value
+        with self._lock:
+            self._merge(kwargs)
+            
+            # Gömülü mod: Tk'ye dokunma, değişenler kök thread'inin yoklamasında çizilir
+            # (kök meşgulken gelen örnekler de son duruma işlenir, hiçbiri kaybolmaz)
+            if self.master is not None:
+                return
+            
+            # Değişiklik yoksa ya da yenileme zaten planlandıysa yeni çağrı planlama
+            if not self._dirty or self._refresh_pending:
+                return
+            self._refresh_pending = True
+            
+            # Hız sınırı: son yenilemeden min_interval geçmediyse kalan süre kadar beklet
+            delay = self._last_refresh + self.min_interval - time.perf_counter()
         
         # UI'ı güncelle (thread-safe)
         try:
-            self.window.after(0, self._update_ui)
+            self.window.after(max(0, int(delay * 1000)), self._update_ui)
         except:
-            pass
+            self._refresh_pending = False
+    
+    def _merge(self, values: dict):
+        """Gelen verileri durum sözlüğüne işler ve değişen alanları işaretler (kilit altında)."""
+        # Sadece değişen verileri işaretle
+        for key, value in values.items():
+            if key in self.status_data and self.status_data[key] != value:
+                self.status_data[key] = value
+                self._dirty.add(self._LABEL_FOR_KEY[key])
+        
+        # Sparkline'lar her örnekte kayar (değer aynı kalsa bile)
+        if self.renderer == 'canvas':
+            if 'fps' in values:
+                self.fps_history.append(values['fps'])
+                self._dirty.add('fps_graph')
+            if 'latency' in values:
+                self.latency_history.append(values['latency'])
+                self._dirty.add('latency_graph')
+    
+    def _poll_updates(self):
+        """Gömülü mod: değişen alanları çizer ve yeniden planlanır (kök thread'inde)."""
+        if not self.is_running:
+            self._do_close()
+            return
+        
+        with self._lock:
+            dirty = bool(self._dirty)
+        if dirty:
+            self._update_ui()
+        
+        try:
+            self.window.after(int(self.poll_interval * 1000), self._poll_updates)
+        except Exception:
+            pass  # Pencere kapatıldı
     
     def _update_ui(self):
-        """UI elementlerini günceller (main thread'de çalışmalı)."""
+        """Değişen UI elementlerini günceller (main thread'de çalışmalı)."""
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+            self._refresh_pending = False
+            self._last_refresh = time.perf_counter()
+            graphs = {}
+            if 'fps_graph' in dirty:
+                graphs['fps_graph'] = list(self.fps_history)
+            if 'latency_graph' in dirty:
+                graphs['latency_graph'] = list(self.latency_history)
+        
         try:
-            # FPS
-            if 'fps' in self.labels:
-                self.labels['fps'].config(text=str(self.status_data['fps']))
-            
-            # Sağ El
-            if 'right_hand' in self.labels:
-                text = self.status_data['right_hand']
-                color = self.colors[self.status_data['right_hand_color']]
-                self.labels['right_hand'].config(text=text, fg=color)
-            
-            # Sol El
-            if 'left_hand' in self.labels:
-                text = self.status_data['left_hand']
-                color = self.colors[self.status_data['left_hand_color']]
-                self.labels['left_hand'].config(text=text, fg=color)
-            
-            # Global Pause
-            if 'global_pause' in self.labels:
-                if self.status_data['global_pause']:
-                    self.labels['global_pause'].config(
-                        text="⏸️ GLOBAL PAUSE",
-                        fg=self.colors['red']
-                    )
-                else:
-                    self.labels['global_pause'].config(text="")
-            
-            # Güncel Jest
-            if 'gesture' in self.labels:
-                self.labels['gesture'].config(
-                    text=self.status_data['current_gesture']
-                )
-            
-            # Sesli Yazma
-            if 'speech' in self.labels:
-                if self.status_data['speech_active']:
-                    self.labels['speech'].config(
-                        text="🎤 DİNLENİYOR...",
-                        fg=self.colors['red']
-                    )
-                else:
-                    self.labels['speech'].config(
-                        text="🎤 Hazır",
-                        fg=self.colors['green']
-                    )
+            if self.renderer == 'canvas':
+                self._render_canvas(dirty, graphs)
+            else:
+                self._render_widgets(dirty)
         except:
             pass
     
+    def _content(self, name: str) -> tuple:
+        """
+        Bir alanın gösterilecek metni ve rengi.
+        
+        Args:
+            name: Alan adı (fps, latency, frames, right_hand, left_hand, global_pause, gesture, speech)
+            
+        Returns:
+            (metin, hex renk)
+        """
+        data = self.status_data
+        if name == 'fps':
+            return str(data['fps']), self.colors['yellow']
+        if name == 'latency':
+            return f"{data['latency']:.1f} ms", self.colors['yellow']
+        if name == 'frames':
+            return f"{data['frame_age']:.0f} ms / {data['dropped']} atıldı", self.colors['yellow']
+        if name == 'right_hand':
+            return data['right_hand'], self.colors[data['right_hand_color']]
+        if name == 'left_hand':
+            return data['left_hand'], self.colors[data['left_hand_color']]
+        if name == 'global_pause':
+            return ("⏸️ GLOBAL PAUSE" if data['global_pause'] else ""), self.colors['red']
+        if name == 'gesture':
+            return data['current_gesture'], self.colors['yellow']
+        if data['speech_active']:
+            return "🎤 DİNLENİYOR...", self.colors['red']
+        return "🎤 Hazır", self.colors['green']
+    
+    def _render_widgets(self, dirty: set):
+        """Label ağacında sadece değişen label'ları günceller."""
+        for name in dirty:
+            label = self.labels.get(name)
+            if label is not None:
+                text, color = self._content(name)
+                label.config(text=text, fg=color)
+    
+    def _render_canvas(self, dirty: set, graphs: Dict[str, List[float]]):
+        """Canvas'ta değişen metin item'larını ve sparkline'ları günceller."""
+        for name in dirty:
+            item = self.items.get(name)
+            if item is None:
+                continue
+            if name in graphs:
+                points = self._sparkline_points(graphs[name], self._GRAPH_BOXES[name])
+                if points:
+                    self.canvas.coords(item, *points)
+            else:
+                text, color = self._content(name)
+                self.canvas.itemconfigure(item, text=text, fill=color)
+    
+    def _sparkline_points(self, values: List[float], box: tuple) -> List[float]:
+        """
+        Halka tamponundaki değerleri kutuya sığan çizgi noktalarına çevirir.
+        En yeni örnek sağ kenarda; dikey ölçek penceredeki en büyük değerdir.
+        
+        Args:
+            values: Örnekler (eskiden yeniye)
+            box: (x, y, genişlik, yükseklik)
+            
+        Returns:
+            Düz [x0, y0, x1, y1, ...] listesi (2'den az örnekte boş)
+        """
+        if len(values) < 2:
+            return []
+        x, y, w, h = box
+        step = w / max(1, self.fps_history.maxlen - 1)
+        peak = max(max(values), 1e-6)
+        right = x + w
+        last = len(values) - 1
+        points = []
+        for i, value in enumerate(values):
+            points.append(right - (last - i) * step)
+            points.append(y + h - 2 - (h - 4) * min(value, peak) / peak)
+        return points
+    
     def stop(self):
         """Overlay penceresini kapatır (thread-safe)."""
         self.is_running = False
         print("🔴 Overlay Display kapatılıyor...")
         
+        # Gömülü mod: pencereyi bir sonraki yoklamada kök thread'i kapatır
+        if self.master is not None:
+            return
+        
         # Pencereyi kendi thread'inde kapat
         if self.window:
             try:
@@ -0,0 +1,193 @@
+"""
+Recognition Pool Modülü
+Ses → metin tanıma işlerini sabit sayıda işçi thread ile yürütür.
+
+- Kuyruk sınırlıdır: doluysa en eski (bayat) ses atılır, yeni ses kabul edilir.
+- Her ses parçasına sıra numarası verilir; sonuçlar tanıma bitiş sırasına göre
+  değil, konuşma sırasına göre teslim edilir (metin karışmaz).
+- Kuyrukta max_age'den uzun bekleyen ses tanınmadan atılır.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+
+class RecognitionPool:
+    """
+    Sabit boyutlu tanıma havuzu.
+    recognize(audio) -> Optional[str] işçi thread'lerde çağrılır,
+    deliver(text) sonuçlar sırayla hazır oldukça (tek seferde bir tane) çağrılır.
+    """
+
+    def __init__(self,
+                 recognize: Callable[[Any], Optional[str]],
+                 deliver: Callable[[str], None],
+                 workers: int = 2,
+                 max_queue: int = 4,
+                 max_age: float = 5.0):
+        """
+        RecognitionPool sınıfını başlatır.
+
+        Args:
+            recognize: Ses verisini metne çeviren fonksiyon (bloklayabilir)
+            deliver: Tanınan metni işleyen fonksiyon (sırayla çağrılır)
+            workers: İşçi thread sayısı
+            max_queue: Kuyrukta bekleyebilecek maksimum ses sayısı
+            max_age: Saniye - bundan eski ses tanınmadan atılır (0 = sınırsız)
+        """
+        self.recognize = recognize
+        self.deliver = deliver
+        self.max_queue = max(1, int(max_queue))
+        self.max_age = max_age
+
+        # Bekleyen işler: (sıra, eklenme zamanı, ses)
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._running = True
+
+        # Sıralı teslim: bitmiş ama sırası gelmemiş sonuçlar
+        self._next_seq = 0
+        self._next_deliver = 0
+        self._results: Dict[int, Optional[str]] = {}
+        self._deliver_lock = threading.Lock()
+
+        # İstatistikler (birden fazla thread günceller: sadece _cond altında yazılır)
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.last_latency = 0.0
+        self.avg_latency = 0.0
+        self.max_latency = 0.0
+
+        self._workers = []
+        for i in range(max(1, int(workers))):
+            worker = threading.Thread(target=self._worker_loop, name=f"recognizer-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, audio) -> Optional[int]:
+        """
+        Sesi tanıma kuyruğuna ekler (bloklamaz).
+        Kuyruk doluysa en eski bekleyen ses atılır.
+
+        Args:
+            audio: Ses verisi
+
+        Returns:
+            Sıra numarası (havuz durdurulmuşsa None)
+        """
+        with self._cond:
+            if not self._running:
+                return None
+
+            seq = self._next_seq
+            self._next_seq += 1
+            self.submitted += 1
+
+            dropped = []
+            while len(self._queue) >= self.max_queue:
+                dropped.append(self._queue.popleft()[0])
+            self.dropped += len(dropped)
+
+            self._queue.append((seq, time.perf_counter(), audio))
+            self._cond.notify()
+
+        for old_seq in dropped:
+            self._finish(old_seq, None)
+        return seq
+
+    def queue_depth(self) -> int:
+        """Kuyrukta bekleyen ses sayısı."""
+        with self._cond:
+            return len(self._queue)
+
+    def get_stats(self) -> dict:
+        """
+        Havuz istatistiklerini döndürür.
+
+        Returns:
+            Kuyruk derinliği, sayaçlar ve gecikme (saniye) bilgileri
+        """
+        with self._cond:
+            return {
+                'queue_depth': len(self._queue),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'last_latency': self.last_latency,
+                'avg_latency': self.avg_latency,
+                'max_latency': self.max_latency,
+            }
+
+    def stop(self, timeout: float = 2.0):
+        """
+        Havuzu durdurur. Bekleyen sesler atılır, çalışan tanımalar bitince thread'ler çıkar.
+
+        Args:
+            timeout: Her thread için maksimum bekleme süresi (saniye)
+        """
+        with self._cond:
+            self._running = False
+            pending = [item[0] for item in self._queue]
+            self._queue.clear()
+            self.dropped += len(pending)
+            self._cond.notify_all()
+
+        for worker in self._workers:
+            if worker is not threading.current_thread():
+                worker.join(timeout=timeout)
+        self._workers = []
+
+    def _worker_loop(self):
+        """İşçi döngüsü: kuyruktan al, tanı, sırayla teslim et."""
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                seq, queued_at, audio = self._queue.popleft()
+
+            # Bayat ses: tanımaya değmez (kullanıcı çoktan devam etti)
+            if self.max_age and time.perf_counter() - queued_at > self.max_age:
+                with self._cond:
+                    self.dropped += 1
+                self._finish(seq, None)
+                continue
+
+            text = None
+            failed = False
+            try:
+                text = self.recognize(audio)
+            except Exception as e:
+                failed = True
+                print(f"❌ Tanıma hatası: {e}")
+
+            latency = time.perf_counter() - queued_at
+            with self._cond:
+                if failed:
+                    self.failed += 1
+                else:
+                    self.completed += 1
+                self.last_latency = latency
+                self.avg_latency = latency if self.completed <= 1 else self.avg_latency * 0.8 + latency * 0.2
+                self.max_latency = max(self.max_latency, latency)
+
+            self._finish(seq, text)
+
+    def _finish(self, seq: int, text: Optional[str]):
+        """Sonucu kaydeder ve sırası gelen tüm sonuçları teslim eder."""
+        with self._deliver_lock:
+            self._results[seq] = text
+            while self._next_deliver in self._results:
+                result = self._results.pop(self._next_deliver)
+                self._next_deliver += 1
+                if result and self._running:
+                    try:
+                        self.deliver(result)
+                    except Exception as e:
+                        print(f"❌ Yazma hatası: {e}")
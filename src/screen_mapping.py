@@ -0,0 +1,201 @@
+"""
+Screen Mapping Modülü
+Kamera koordinatlarını ekran koordinatlarına dönüştüren önceden hesaplanmış dönüşüm.
+
+Kırpma dikdörtgeni, kamera çözünürlüğü ve ekran boyutu değişmediği sürece
+dönüşüm katsayıları tekrar hesaplanmaz. Tek nokta için saf Python (çarp-topla),
+landmark dizileri için numpy ile vektörel çalışır.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+
+class CoordinateTransform:
+    """
+    Kamera → ekran afin dönüşümü (+ isteğe bağlı doğrusal olmayan eğri ve sınırlama).
+
+    Adımlar:
+        1. Kamera pikseli → kırpma dikdörtgeninde normalize (0.0 - 1.0) [afin]
+        2. Hızlanma eğrisi: merkeze göre |u|^gamma (gamma = 1.0 ise atlanır)
+        3. Normalize → ekran pikseli [afin]
+        4. Ekran kenar boşluğuna (margin) göre sınırlama
+    gamma = 1.0 iken 1. ve 3. adım tek bir 2x3 matrise birleştirilir.
+    """
+
+    def __init__(self):
+        """CoordinateTransform sınıfını başlatır (ilk update() çağrısında hesaplanır)."""
+        self._key = None
+
+        # Kamera → normalize (2x3) ve normalize → ekran (2x3)
+        self.to_normalized = np.zeros((2, 3))
+        self.to_screen = np.zeros((2, 3))
+
+        # Birleşik matris (sadece doğrusal durumda geçerli)
+        self.matrix = np.zeros((2, 3))
+
+        # Tek nokta için skaler katsayılar: x' = ax * x + bx, y' = ay * y + by
+        self._ax = self._bx = self._ay = self._by = 0.0
+        self._nax = self._nbx = self._nay = self._nby = 0.0
+        self._sax = self._sbx = self._say = self._sby = 0.0
+
+        # Sınırlar ve eğri
+        self.gamma = 1.0
+        self.min_x = self.min_y = 0
+        self.max_x = self.max_y = 0
+
+        # İstatistik: kaç kez yeniden hesaplandı
+        self.rebuild_count = 0
+
+    def update(self,
+               camera_size: Tuple[int, int],
+               screen_size: Tuple[int, int],
+               crop: Tuple[float, float, float, float],
+               margin: int = 0,
+               gamma: float = 1.0,
+               mirror: bool = False,
+               screen_origin: Tuple[int, int] = (0, 0)) -> bool:
+        """
+        Parametreler değiştiyse dönüşümü yeniden hesaplar.
+
+        Args:
+            camera_size: (genişlik, yükseklik) kamera pikseli
+            screen_size: (genişlik, yükseklik) hedef ekran pikseli
+            crop: (sol, sağ, üst, alt) kırpma oranları
+            margin: Ekran kenarlarından sınırlama mesafesi (piksel)
+            gamma: Hızlanma eğrisi üssü (1.0 = doğrusal)
+            mirror: True ise X ekseni aynalanır (görüntü çevrilmeden verilen landmark'lar için)
+            screen_origin: Hedef ekranın sanal masaüstündeki sol üst köşesi
+
+        Returns:
+            True: Dönüşüm yeniden hesaplandı
+        """
+        key = (tuple(camera_size), tuple(screen_size), tuple(crop),
+               margin, gamma, mirror, tuple(screen_origin))
+        if key == self._key:
+            return False
+
+        cam_w, cam_h = camera_size
+        scr_w, scr_h = screen_size
+        crop_left, crop_right, crop_top, crop_bottom = crop
+        origin_x, origin_y = screen_origin
+
+        # Kırpma dikdörtgeni (yeşil dikdörtgen = ekran)
+        rect_left = cam_w * crop_left
+        rect_right = cam_w * (1 - crop_right)
+        rect_top = cam_h * crop_top
+        rect_bottom = cam_h * (1 - crop_bottom)
+        rect_width = max(1e-6, rect_right - rect_left)
+        rect_height = max(1e-6, rect_bottom - rect_top)
+
+        # 1. Kamera → normalize
+        nax = 1.0 / rect_width
+        nbx = -rect_left / rect_width
+        if mirror:
+            # x_ayna = cam_w - x  →  norm = (cam_w - x - left) / width
+            nax = -nax
+            nbx = (cam_w - rect_left) / rect_width
+        nay = 1.0 / rect_height
+        nby = -rect_top / rect_height
+
+        # 3. Normalize → ekran
+        sax, sbx = float(scr_w), float(origin_x)
+        say, sby = float(scr_h), float(origin_y)
+
+        self._nax, self._nbx, self._nay, self._nby = nax, nbx, nay, nby
+        self._sax, self._sbx, self._say, self._sby = sax, sbx, say, sby
+
+        # Birleşik katsayılar (ekran = s * (n * kamera + nb) + sb)
+        self._ax, self._bx = sax * nax, sax * nbx + sbx
+        self._ay, self._by = say * nay, say * nby + sby
+
+        self.to_normalized = np.array([[nax, 0.0, nbx], [0.0, nay, nby]])
+        self.to_screen = np.array([[sax, 0.0, sbx], [0.0, say, sby]])
+        self.matrix = np.array([[self._ax, 0.0, self._bx], [0.0, self._ay, self._by]])
+
+        self.gamma = float(gamma)
+
+        # 4. Sınırlar (margin ekranın yarısını geçemez)
+        margin_x = min(int(margin), (scr_w - 1) // 2)
+        margin_y = min(int(margin), (scr_h - 1) // 2)
+        self.min_x = origin_x + margin_x
+        self.max_x = origin_x + scr_w - 1 - margin_x
+        self.min_y = origin_y + margin_y
+        self.max_y = origin_y + scr_h - 1 - margin_y
+
+        self._key = key
+        self.rebuild_count += 1
+        return True
+
+    def invalidate(self):
+        """Bir sonraki update() çağrısında yeniden hesaplamayı zorlar."""
+        self._key = None
+
+    def map_point(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Tek bir kamera noktasını ekran koordinatına dönüştürür.
+
+        Args:
+            x: Kamera X koordinatı
+            y: Kamera Y koordinatı
+
+        Returns:
+            (screen_x, screen_y) ekran koordinatları
+        """
+        if self.gamma == 1.0:
+            sx = self._ax * x + self._bx
+            sy = self._ay * y + self._by
+        else:
+            nx = self._curve(self._nax * x + self._nbx)
+            ny = self._curve(self._nay * y + self._nby)
+            sx = self._sax * nx + self._sbx
+            sy = self._say * ny + self._sby
+
+        sx = int(sx)
+        sy = int(sy)
+
+        # Sınırlama
+        if sx < self.min_x:
+            sx = self.min_x
+        elif sx > self.max_x:
+            sx = self.max_x
+        if sy < self.min_y:
+            sy = self.min_y
+        elif sy > self.max_y:
+            sy = self.max_y
+
+        return (sx, sy)
+
+    def map_points(self, points) -> np.ndarray:
+        """
+        Nx2 kamera noktası dizisini tek seferde ekran koordinatına dönüştürür.
+
+        Args:
+            points: [(x, y), ...] listesi veya Nx2 numpy dizisi
+
+        Returns:
+            Nx2 int32 ekran koordinatları
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
+        if self.gamma == 1.0:
+            out = pts @ self.matrix[:, :2].T + self.matrix[:, 2]
+        else:
+            norm = pts @ self.to_normalized[:, :2].T + self.to_normalized[:, 2]
+            u = 2.0 * norm - 1.0
+            norm = (np.sign(u) * np.abs(u) ** self.gamma + 1.0) * 0.5
+            out = norm @ self.to_screen[:, :2].T + self.to_screen[:, 2]
+
+        out = out.astype(np.int32)
+        np.clip(out[:, 0], self.min_x, self.max_x, out=out[:, 0])
+        np.clip(out[:, 1], self.min_y, self.max_y, out=out[:, 1])
+        return out
+
+    def _curve(self, n: float) -> float:
+        """Normalize değere merkeze göre simetrik üs eğrisi uygular."""
+        u = 2.0 * n - 1.0
+        if u >= 0:
+            u = u ** self.gamma
+        else:
+            u = -((-u) ** self.gamma)
+        return (u + 1.0) * 0.5
@@ -0,0 +1,478 @@
+"""
+Settings Service Modülü
+settings.json için şema doğrulaması, değişiklik izleme ve güvenli kaydetme.
+
+- Şema: her anahtarın tipi, geçerli aralığı / seçenekleri ve "canlı" (hot) mu
+  yoksa yeniden başlatma (cold) mı gerektirdiği
+- İzleme: Linux'ta inotify, Windows'ta dizin değişiklik bildirimi, diğerlerinde
+  mtime yoklaması; dosya değişince sadece farklar doğrulanıp dinleyicilere iletilir
+- Kaydetme: geçici dosyaya yazıp yeniden adlandırma (yarım yazılmış dosya okunmaz)
+
+config.py kaynak dosyası hiçbir zaman yeniden yazılmaz; kalıcı ayarlar sadece
+settings.json'dadır.
+"""
+
+import json
+import os
+import platform
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+sys.path.append(str(Path(__file__).parent))
+from config_manager import ConfigManager
+
+# Linux inotify (isteğe bağlı)
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    HAS_INOTIFY = True
+except ImportError:
+    HAS_INOTIFY = False
+
+# Windows dizin değişiklik bildirimi
+if platform.system() == 'Windows':
+    try:
+        import win32con
+        import win32event
+        import win32file
+        HAS_WIN32_NOTIFY = True
+    except ImportError:
+        HAS_WIN32_NOTIFY = False
+else:
+    HAS_WIN32_NOTIFY = False
+
+
+class SettingSpec(NamedTuple):
+    """Tek ayarın şeması."""
+    type: type
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    choices: Optional[Tuple[Any, ...]] = None
+    hot: bool = True            # True: çalışırken uygulanabilir, False: yeniden başlatma gerekir
+    nullable: bool = False      # None kabul edilir mi?
+
+
+# settings.json'da bulunabilecek ayarlar
+SCHEMA: Dict[str, SettingSpec] = {
+    # Genel
+    'DEBUG_MODE': SettingSpec(bool, hot=False),
+
+    # Kamera (cihaz yeniden açılmalı)
+    'CAMERA_INDEX': SettingSpec(int, 0, 63, hot=False),
+    'CAMERA_WIDTH': SettingSpec(int, 160, 3840, hot=False),
+    'CAMERA_HEIGHT': SettingSpec(int, 120, 2160, hot=False),
+    'CAMERA_FPS': SettingSpec(int, 1, 240, hot=False),
+    'CAMERA_NEGOTIATE': SettingSpec(bool, hot=False),
+    'FRAME_MAX_AGE_MS': SettingSpec(int, 0, 2000),
+
+    # Dead zone ve eşleme
+    'CAMERA_CROP_LEFT': SettingSpec(float, 0.0, 0.49),
+    'CAMERA_CROP_RIGHT': SettingSpec(float, 0.0, 0.49),
+    'CAMERA_CROP_TOP': SettingSpec(float, 0.0, 0.49),
+    'CAMERA_CROP_BOTTOM': SettingSpec(float, 0.0, 0.49),
+    'SCREEN_MARGIN': SettingSpec(int, 0, 500),
+    'MAPPING_GAMMA': SettingSpec(float, 0.2, 5.0),
+    'TARGET_MONITOR': SettingSpec(str),
+    'INPUT_BACKEND': SettingSpec(str, choices=('auto', 'win32', 'linux', 'pyautogui', 'recording'),
+                                 hot=False),
+
+    # MediaPipe
+    'MAX_HANDS': SettingSpec(int, 1, 2),
+    'DETECTION_CONFIDENCE': SettingSpec(float, 0.0, 1.0),
+    'TRACKING_CONFIDENCE': SettingSpec(float, 0.0, 1.0),
+
+    # Hareket ve EMA
+    'MOUSE_SPEED': SettingSpec(float, 0.1, 20.0),
+    'MOUSE_SMOOTHING': SettingSpec(int, 1, 20, hot=False),
+    'EMA_MIN': SettingSpec(float, 0.001, 1.0),
+    'EMA_MAX': SettingSpec(float, 0.001, 1.0),
+    'EMA_FUNCTION': SettingSpec(str, choices=('linear', 'exponential', 'sigmoid')),
+    'SPEED_MIN': SettingSpec(float, 0.0, 5000.0),
+    'SPEED_MAX': SettingSpec(float, 1.0, 5000.0),
+    'SIGMOID_STEEPNESS': SettingSpec(float, 0.001, 10.0),
+    'SIGMOID_MIDPOINT': SettingSpec(float, 0.0, 5000.0),
+
+    # Jest ve scroll
+    'PINCH_THRESHOLD': SettingSpec(int, 10, 100),
+    'STABLE_FRAMES': SettingSpec(int, 1, 60),
+    'GESTURE_COOLDOWN': SettingSpec(float, 0.0, 5.0, hot=False),
+    'SCROLL_SENSITIVITY': SettingSpec(float, 1.0, 500.0),
+    'SCROLL_THRESHOLD': SettingSpec(float, 0.0, 500.0),
+    'SCROLL_COOLDOWN': SettingSpec(float, 0.0, 5.0, hot=False),
+    'SCROLL_HIGH_RESOLUTION': SettingSpec(bool),
+
+    # Görsel
+    'SHOW_FPS': SettingSpec(bool),
+    'SHOW_LANDMARKS': SettingSpec(bool),
+    'SHOW_GESTURE_TEXT': SettingSpec(bool),
+    'FLIP_CAMERA': SettingSpec(bool),
+    'PREVIEW_MAX_FPS': SettingSpec(int, 1, 240),
+    'OVERLAY_MAX_FPS': SettingSpec(int, 1, 120, hot=False),
+    'OVERLAY_RENDERER': SettingSpec(str, choices=('widgets', 'canvas'), hot=False),
+
+    # Ses
+    'VOLUME_STEP': SettingSpec(int, 1, 20),
+    'VOLUME_COOLDOWN': SettingSpec(float, 0.0, 5.0, hot=False),
+
+    # Sesli yazma (tanıyıcı / mikrofon yeniden açılmalı)
+    'SPEECH_ENABLED': SettingSpec(bool, hot=False),
+    'SPEECH_LANGUAGE': SettingSpec(str, hot=False),
+    'SPEECH_ENGINE': SettingSpec(str, choices=('google', 'vosk', 'whisper', 'auto'), hot=False),
+    'SPEECH_MODEL_PATH': SettingSpec(str, hot=False),
+    'SPEECH_STREAMING': SettingSpec(bool, hot=False),
+    'SPEECH_MICROPHONE_INDEX': SettingSpec(int, 0, 255, hot=False, nullable=True),
+    'SPEECH_AUTO_START': SettingSpec(bool, hot=False),
+    'SPEECH_AUTO_WRITE': SettingSpec(bool, hot=False),
+    'SPEECH_TIMEOUT': SettingSpec(float, 0.5, 60.0),
+    'SPEECH_AUTO_ENTER': SettingSpec(bool),
+    'SPEECH_WORKERS': SettingSpec(int, 1, 8, hot=False),
+    'SPEECH_QUEUE_SIZE': SettingSpec(int, 1, 64, hot=False),
+    'SPEECH_MAX_AUDIO_AGE': SettingSpec(float, 0.5, 60.0, hot=False),
+    'SPEECH_MAX_PHRASE': SettingSpec(float, 1.0, 60.0, hot=False),
+    'SPEECH_VAD_AGGRESSIVENESS': SettingSpec(int, 0, 3, hot=False),
+    'SPEECH_VAD_PRE_ROLL': SettingSpec(float, 0.0, 2.0, hot=False),
+    'SPEECH_VAD_HANGOVER': SettingSpec(float, 0.1, 5.0, hot=False),
+}
+
+
+def coerce_setting(key: str, value: Any) -> Any:
+    """
+    Değeri şemaya göre doğrular ve tipine çevirir.
+
+    Args:
+        key: Ayar anahtarı
+        value: Ham değer (JSON'dan)
+
+    Returns:
+        Doğrulanmış değer
+
+    Raises:
+        KeyError: Anahtar şemada yok
+        ValueError: Tip / aralık / seçenek uymuyor
+    """
+    spec = SCHEMA[key]
+
+    if value is None:
+        if spec.nullable:
+            return None
+        raise ValueError("boş olamaz")
+
+    if spec.type is bool:
+        if not isinstance(value, bool):
+            raise ValueError(f"true/false olmalı, {value!r} verildi")
+    elif spec.type is int:
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or int(value) != value:
+            raise ValueError(f"tam sayı olmalı, {value!r} verildi")
+        value = int(value)
+    elif spec.type is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"sayı olmalı, {value!r} verildi")
+        value = float(value)
+    elif key == 'TARGET_MONITOR':
+        # 'primary' / 'virtual' veya monitör index'i
+        if not (value in ('primary', 'virtual') or (isinstance(value, int) and value >= 0)):
+            raise ValueError(f"'primary', 'virtual' veya monitör index'i olmalı, {value!r} verildi")
+        return value
+    elif not isinstance(value, spec.type):
+        raise ValueError(f"{spec.type.__name__} olmalı, {value!r} verildi")
+
+    if spec.minimum is not None and value < spec.minimum:
+        raise ValueError(f"en az {spec.minimum} olmalı, {value} verildi")
+    if spec.maximum is not None and value > spec.maximum:
+        raise ValueError(f"en fazla {spec.maximum} olmalı, {value} verildi")
+    if spec.choices is not None and value not in spec.choices:
+        raise ValueError(f"{', '.join(map(str, spec.choices))} olmalı, {value!r} verildi")
+    return value
+
+
+def split_unknown(settings: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Ham ayarları şemadaki ve şemada olmayan anahtarlar olarak ayırır.
+
+    Args:
+        settings: Ham ayarlar
+
+    Returns:
+        (şemadaki ayarlar, bilinmeyen ayarlar)
+    """
+    known = {key: value for key, value in settings.items() if key in SCHEMA}
+    extra = {key: value for key, value in settings.items() if key not in SCHEMA}
+    return known, extra
+
+
+def validate_settings(settings: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Tüm ayarları doğrular; geçersiz ve bilinmeyen anahtarlar ayıklanır.
+
+    Args:
+        settings: Ham ayarlar
+
+    Returns:
+        (geçerli ayarlar, hata mesajları)
+    """
+    valid = {}
+    errors = []
+    for key, value in settings.items():
+        if key not in SCHEMA:
+            errors.append(f"{key}: bilinmeyen ayar")
+            continue
+        try:
+            valid[key] = coerce_setting(key, value)
+        except ValueError as e:
+            errors.append(f"{key}: {e}")
+    return valid, errors
+
+
+class SettingsReport(NamedTuple):
+    """Dosya yeniden yüklendiğinde oluşan fark raporu."""
+    changed: Dict[str, Tuple[Any, Any]]     # {anahtar: (eski, yeni)}
+    errors: List[str]
+
+    @property
+    def hot(self) -> Dict[str, Any]:
+        """Canlı uygulanabilen değişiklikler {anahtar: yeni değer}."""
+        return {key: new for key, (old, new) in self.changed.items() if SCHEMA[key].hot}
+
+    @property
+    def cold(self) -> Dict[str, Any]:
+        """Yeniden başlatma gerektiren değişiklikler {anahtar: yeni değer}."""
+        return {key: new for key, (old, new) in self.changed.items() if not SCHEMA[key].hot}
+
+    def format(self) -> str:
+        """Konsol için okunabilir fark listesi."""
+        lines = []
+        for key, (old, new) in self.changed.items():
+            mode = "canlı" if SCHEMA[key].hot else "yeniden başlatınca"
+            lines.append(f"   {key}: {old!r} → {new!r} ({mode})")
+        for error in self.errors:
+            lines.append(f"   ⚠️ {error} (yok sayıldı)")
+        return '\n'.join(lines)
+
+
+class SettingsService:
+    """
+    settings.json okuma / yazma / izleme servisi.
+    Dinleyiciler izleme thread'inden SettingsReport ile çağrılır.
+    """
+
+    def __init__(self, settings_file: str = 'settings.json', poll_interval: float = 1.0):
+        """
+        SettingsService sınıfını başlatır (dosyayı henüz okumaz).
+
+        Args:
+            settings_file: Ayar dosyasının adı (ConfigManager ile aynı konum kuralı)
+            poll_interval: mtime yoklama aralığı (saniye, bildirim yoksa)
+        """
+        self.store = ConfigManager(settings_file)
+        self.path: Path = self.store.config_path
+        self.poll_interval = poll_interval
+
+        # Son bilinen (doğrulanmış) dosya içeriği
+        self.values: Dict[str, Any] = {}
+        # Şemada olmayan anahtarlar (eski / yeni sürüm ayarları): kaydederken aynen korunur
+        self.extra: Dict[str, Any] = {}
+
+        self._listeners: List[Callable[[SettingsReport], None]] = []
+        self._lock = threading.Lock()
+        self._watching = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ==================== OKUMA / YAZMA ====================
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Dosyayı okur ve doğrular (geçersiz anahtarlar uyarıyla atlanır,
+        bilinmeyen anahtarlar kullanılmaz ama dosyada korunur).
+
+        Returns:
+            Geçerli ayarlar
+        """
+        known, extra = split_unknown(self._read() or {})
+        valid, errors = validate_settings(known)
+        for error in errors:
+            print(f"⚠️ settings.json: {error} (varsayılan kullanılıyor)")
+        for key in extra:
+            print(f"⚠️ settings.json: {key}: bilinmeyen ayar (kullanılmıyor, dosyada korunuyor)")
+        with self._lock:
+            self.values = valid
+            self.extra = extra
+        return dict(valid)
+
+    def save(self, settings: Dict[str, Any]) -> bool:
+        """
+        Ayarları doğrulayıp atomik olarak kaydeder (dosyadaki diğer anahtarlar,
+        bilinmeyenler dahil, korunur).
+
+        Args:
+            settings: Kaydedilecek ayarlar
+
+        Returns:
+            True: Kaydedildi
+        """
+        valid, errors = validate_settings(settings)
+        for error in errors:
+            print(f"⚠️ Kaydedilmedi - {error}")
+
+        with self._lock:
+            merged = dict(self.values)
+            merged.update(valid)
+            content = dict(self.extra)
+            content.update(merged)
+            if not self.store.save_settings(content):
+                return False
+            # Kendi yazdığımız içerik: izleyici bunu değişiklik saymaz
+            self.values = merged
+        return True
+
+    def reload(self) -> Optional[SettingsReport]:
+        """
+        Dosyayı yeniden okur ve son bilinen içerikle karşılaştırır.
+
+        Returns:
+            Fark raporu (değişiklik ve hata yoksa None)
+        """
+        raw = self._read()
+        if raw is None:
+            return None
+        known, extra = split_unknown(raw)
+        valid, errors = validate_settings(known)
+
+        with self._lock:
+            # Sadece yeni eklenen bilinmeyen anahtarlar uyarılır
+            errors.extend(f"{key}: bilinmeyen ayar" for key in extra if key not in self.extra)
+            self.extra = extra
+            old = self.values
+            changed = {key: (old.get(key), value) for key, value in valid.items()
+                       if key not in old or old[key] != value}
+            # Geçersiz değerler uygulanmaz: eski geçerli değer korunur
+            merged = dict(old)
+            merged.update(valid)
+            self.values = merged
+
+        if not changed and not errors:
+            return None
+        return SettingsReport(changed, errors)
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """Ham JSON içeriği (dosya yoksa boş, bozuksa None)."""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ settings.json okunamadı: {e}")
+            return None
+        if not isinstance(data, dict):
+            print("⚠️ settings.json bir JSON nesnesi olmalı")
+            return None
+        return data
+
+    # ==================== İZLEME ====================
+
+    def add_listener(self, callback: Callable[[SettingsReport], None]):
+        """Dosya değişikliği dinleyicisi ekler (izleme thread'inden çağrılır)."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[SettingsReport], None]):
+        """Dinleyiciyi kaldırır."""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def start_watching(self):
+        """Dosya izleme thread'ini başlatır (zaten çalışıyorsa bir şey yapmaz)."""
+        if self._watching:
+            return
+        if not self.values:
+            self.load()
+        self._watching = True
+        if HAS_INOTIFY:
+            target = self._watch_inotify
+        elif HAS_WIN32_NOTIFY:
+            target = self._watch_win32
+        else:
+            target = self._watch_poll
+        self._thread = threading.Thread(target=target, name="settings-watcher", daemon=True)
+        self._thread.start()
+
+    def stop_watching(self):
+        """İzlemeyi durdurur (thread en geç bir bekleme aralığında çıkar)."""
+        self._watching = False
+
+    def _notify(self):
+        """Dosya değişti: farkları hesapla ve dinleyicilere ilet."""
+        report = self.reload()
+        if report is None:
+            return
+        print("📝 settings.json değişti:")
+        print(report.format())
+        for callback in list(self._listeners):
+            try:
+                callback(report)
+            except Exception as e:
+                print(f"❌ Ayar dinleyici hatası: {e}")
+
+    def _stat(self) -> Optional[Tuple[float, int]]:
+        """Dosyanın (mtime, boyut) bilgisi (yoksa None)."""
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_mtime, stat.st_size)
+        except OSError:
+            return None
+
+    def _watch_poll(self):
+        """mtime / boyut yoklaması (bildirim mekanizması yoksa)."""
+        last = self._stat()
+        wait = threading.Event()
+        while self._watching:
+            wait.wait(self.poll_interval)
+            current = self._stat()
+            if current != last:
+                last = current
+                self._notify()
+
+    def _watch_inotify(self):
+        """Linux: dizini izle (yeniden adlandırma ile kaydetme dosyanın inode'unu değiştirir)."""
+        inotify = INotify()
+        mask = inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO
+        inotify.add_watch(str(self.path.parent), mask)
+        try:
+            while self._watching:
+                events = inotify.read(timeout=int(self.poll_interval * 1000))
+                if any(event.name == self.path.name for event in events):
+                    self._notify()
+        finally:
+            inotify.close()
+
+    def _watch_win32(self):
+        """Windows: dizin değişiklik bildirimi (yazma / yeniden adlandırma)."""
+        handle = win32file.FindFirstChangeNotification(
+            str(self.path.parent), False,
+            win32con.FILE_NOTIFY_CHANGE_LAST_WRITE | win32con.FILE_NOTIFY_CHANGE_FILE_NAME)
+        last = self._stat()
+        try:
+            while self._watching:
+                result = win32event.WaitForSingleObject(handle, int(self.poll_interval * 1000))
+                if result == win32event.WAIT_OBJECT_0:
+                    # Bildirim dizin geneli: sadece bizim dosyamız değiştiyse işle
+                    current = self._stat()
+                    if current != last:
+                        last = current
+                        self._notify()
+                    win32file.FindNextChangeNotification(handle)
+        finally:
+            win32file.FindCloseChangeNotification(handle)
+
+
+# Süreç başına tek servis
+_SERVICE: Optional[SettingsService] = None
+
+
+def get_settings_service() -> SettingsService:
+    """Paylaşılan SettingsService nesnesini döndürür (ilk çağrıda dosyadan yüklenir)."""
+    global _SERVICE
+    if _SERVICE is None:
+        _SERVICE = SettingsService()
+        _SERVICE.load()
+    return _SERVICE
@@ -0,0 +1,327 @@
+"""
+Speech Engines Modülü
+Ses → metin tanıma motorları için ortak arayüz.
+
+- 'google' : speech_recognition üzerinden Google Web Speech (internet gerekir)
+- 'vosk'   : Vosk / Kaldi yerel model (CPU, tamamen çevrimdışı)
+- 'whisper': faster-whisper yerel model (CPU int8, çevrimdışı)
+
+Yerel modeller süreç başına bir kere yüklenir ve önbellekte tutulur (sıcak kalır);
+GUI'de Başlat/Durdur yapıldığında model tekrar diskten okunmaz.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Google Web Speech (speech_recognition)
+try:
+    import speech_recognition as sr
+    HAS_SPEECH = True
+except ImportError:
+    HAS_SPEECH = False
+
+# Vosk (çevrimdışı)
+try:
+    import vosk
+    vosk.SetLogLevel(-1)
+    HAS_VOSK = True
+except ImportError:
+    HAS_VOSK = False
+
+# faster-whisper (çevrimdışı)
+try:
+    from faster_whisper import WhisperModel
+    HAS_WHISPER = True
+except ImportError:
+    HAS_WHISPER = False
+
+
+# Yerel motorların beklediği örnekleme hızı (mono, 16-bit)
+SAMPLE_RATE = 16000
+
+# Yüklenmiş modeller: (motor, model yolu/boyutu) → model
+_MODEL_CACHE: Dict[Tuple[str, str], object] = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def _cached_model(key: Tuple[str, str], loader) -> Tuple[object, bool]:
+    """
+    Modeli önbellekten döndürür, yoksa bir kere yükler.
+
+    Returns:
+        (model, yeni_yüklendi_mi) - True ise model henüz ısıtılmamıştır
+    """
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is not None:
+            return model, False
+        model = loader()
+        _MODEL_CACHE[key] = model
+        return model, True
+
+
+def audio_to_pcm16(audio) -> bytes:
+    """
+    speech_recognition AudioData → 16 kHz mono 16-bit PCM.
+
+    Args:
+        audio: sr.AudioData nesnesi veya hazır PCM byte dizisi
+
+    Returns:
+        PCM byte dizisi
+    """
+    if isinstance(audio, (bytes, bytearray, memoryview)):
+        return bytes(audio)
+    return audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)
+
+
+class SpeechEngine:
+    """
+    Tanıma motorlarının ortak arayüzü.
+    recognize() sesi anlayamazsa None döndürür; motor hatasında mesaj basar ve None döndürür.
+    """
+
+    name = 'base'
+
+    # İnternet bağlantısı olmadan çalışabiliyor mu?
+    offline = False
+
+    # Ses parçaları geldikçe ara sonuç (partial) üretebiliyor mu?
+    supports_streaming = False
+
+    # Model bu nesne oluşturulurken mi yüklendi? (önbellekten geldiyse zaten ısınmıştır)
+    model_loaded = False
+
+    def __init__(self, language: str = 'tr-TR'):
+        """
+        SpeechEngine sınıfını başlatır.
+
+        Args:
+            language: Tanıma dili (tr-TR, en-US ...)
+        """
+        self.language = language
+
+    def recognize(self, audio) -> Optional[str]:
+        """
+        Ses verisini metne çevirir (bloklayabilir).
+
+        Args:
+            audio: sr.AudioData veya 16 kHz mono 16-bit PCM
+
+        Returns:
+            Tanınan metin veya None
+        """
+        raise NotImplementedError
+
+    def create_stream(self, sample_rate: int = SAMPLE_RATE) -> 'SpeechStream':
+        """
+        Akış tanıma oturumu açar (sadece supports_streaming = True motorlarda).
+
+        Args:
+            sample_rate: Gelecek PCM verisinin örnekleme hızı (mono, 16-bit)
+
+        Returns:
+            SpeechStream nesnesi
+        """
+        raise NotImplementedError(f"{self.name} motoru akış tanımayı desteklemiyor")
+
+    def warm_up(self):
+        """Modeli ilk gerçek cümleden önce ısıtır (ilk tanıma gecikmesini önler)."""
+        pass
+
+    def close(self):
+        """Motor kaynaklarını serbest bırakır (önbellekteki model korunur)."""
+        pass
+
+
+class SpeechStream:
+    """Akış tanıma oturumu: PCM parçaları verilir, ara / kesin sonuçlar alınır."""
+
+    def accept(self, pcm: bytes) -> Tuple[str, bool]:
+        """
+        Yeni ses parçasını işler.
+
+        Args:
+            pcm: Mono 16-bit PCM parça (bytes veya int16 numpy görünümü;
+                 motor gerekiyorsa kendi sınırında bytes'a çevirir)
+
+        Returns:
+            (metin, kesin_mi) - kesin_mi True ise cümle bitti, yeni cümle başlar
+        """
+        raise NotImplementedError
+
+    def finish(self) -> str:
+        """Oturumu kapatır ve kalan metni kesin sonuç olarak döndürür."""
+        raise NotImplementedError
+
+
+class GoogleSpeechEngine(SpeechEngine):
+    """Google Web Speech API (speech_recognition.recognize_google)."""
+
+    name = 'google'
+
+    def __init__(self, recognizer, language: str = 'tr-TR'):
+        if not HAS_SPEECH:
+            raise RuntimeError("speech_recognition yüklü değil")
+        super().__init__(language)
+        self.recognizer = recognizer
+
+    def recognize(self, audio) -> Optional[str]:
+        try:
+            return self.recognizer.recognize_google(audio, language=self.language)
+        except sr.UnknownValueError:
+            # Ses anlaşılamadı - sessizce devam et (çok yaygın)
+            return None
+        except sr.RequestError as e:
+            print(f"❌ Google API hatası: {e}")
+            return None
+
+
+class VoskSpeechEngine(SpeechEngine):
+    """Vosk yerel model (Kaldi) - CPU'da çevrimdışı tanıma."""
+
+    name = 'vosk'
+    offline = True
+    supports_streaming = True
+
+    def __init__(self, language: str = 'tr-TR', model_path: str = ''):
+        if not HAS_VOSK:
+            raise RuntimeError("vosk yüklü değil (pip install vosk)")
+        super().__init__(language)
+
+        # Model yolu verilmediyse models/vosk-<dil> klasörüne bak (örn. models/vosk-tr)
+        if not model_path:
+            model_path = os.path.join('models', f"vosk-{language.split('-')[0].lower()}")
+        if not os.path.isdir(model_path):
+            raise RuntimeError(f"Vosk modeli bulunamadı: {model_path}")
+
+        self.model_path = model_path
+        self.model, self.model_loaded = _cached_model((self.name, os.path.abspath(model_path)),
+                                                      lambda: vosk.Model(model_path))
+
+    def create_recognizer(self, sample_rate: int = SAMPLE_RATE):
+        """Yeni bir Kaldi tanıyıcı oluşturur (model paylaşılır, oluşturması ucuzdur)."""
+        return vosk.KaldiRecognizer(self.model, sample_rate)
+
+    def create_stream(self, sample_rate: int = SAMPLE_RATE) -> 'VoskStream':
+        return VoskStream(self.create_recognizer(sample_rate))
+
+    def recognize(self, audio) -> Optional[str]:
+        recognizer = self.create_recognizer()
+        recognizer.AcceptWaveform(audio_to_pcm16(audio))
+        text = json.loads(recognizer.FinalResult()).get('text', '').strip()
+        return text or None
+
+    def warm_up(self):
+        # 0.5 saniyelik sessizlik
+        self.recognize(bytes(SAMPLE_RATE))
+
+
+class VoskStream(SpeechStream):
+    """Vosk akış oturumu (PartialResult / Result)."""
+
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+
+    def accept(self, pcm: bytes) -> Tuple[str, bool]:
+        # Kaldi bağlaması bytes ister ve len() ile bayt sayısını okur (numpy görünümü olmaz)
+        if self.recognizer.AcceptWaveform(memoryview(pcm).cast('B').tobytes()):
+            # Sessizlik algılandı - cümle bitti
+            return json.loads(self.recognizer.Result()).get('text', '').strip(), True
+        return json.loads(self.recognizer.PartialResult()).get('partial', '').strip(), False
+
+    def finish(self) -> str:
+        return json.loads(self.recognizer.FinalResult()).get('text', '').strip()
+
+
+class WhisperSpeechEngine(SpeechEngine):
+    """faster-whisper yerel model - CPU'da int8 çevrimdışı tanıma."""
+
+    name = 'whisper'
+    offline = True
+
+    def __init__(self, language: str = 'tr-TR', model_path: str = ''):
+        if not HAS_WHISPER:
+            raise RuntimeError("faster-whisper yüklü değil (pip install faster-whisper)")
+        super().__init__(language)
+
+        # Model yolu veya boyut adı ('tiny', 'base', 'small' ...)
+        self.model_path = model_path or 'base'
+        self.model, self.model_loaded = _cached_model(
+            (self.name, self.model_path),
+            lambda: WhisperModel(self.model_path, device='cpu', compute_type='int8'))
+
+        # Whisper kısa dil kodu kullanır (tr-TR → tr)
+        self.whisper_language = language.split('-')[0].lower()
+
+        # Model tek; havuzdaki işçiler sırayla kullanır (CPU zaten paylaşılıyor)
+        self._lock = threading.Lock()
+
+    def recognize(self, audio) -> Optional[str]:
+        samples = np.frombuffer(audio_to_pcm16(audio), dtype=np.int16).astype(np.float32) / 32768.0
+        with self._lock:
+            segments, _info = self.model.transcribe(samples, language=self.whisper_language,
+                                                    beam_size=1, vad_filter=False)
+            text = ' '.join(segment.text.strip() for segment in segments).strip()
+        return text or None
+
+    def warm_up(self):
+        self.recognize(bytes(SAMPLE_RATE))
+
+
+# İsim → sınıf
+ENGINES = {
+    'google': GoogleSpeechEngine,
+    'vosk': VoskSpeechEngine,
+    'whisper': WhisperSpeechEngine,
+}
+
+
+def create_speech_engine(name: str = 'google',
+                         recognizer=None,
+                         language: str = 'tr-TR',
+                         model_path: str = '') -> Optional[SpeechEngine]:
+    """
+    İsme göre tanıma motoru oluşturur.
+    'auto': önce yerel motorlar (vosk, whisper), olmazsa Google.
+    Yerel motor yüklenemezse Google'a geri düşülür.
+
+    Args:
+        name: 'auto', 'google', 'vosk' veya 'whisper'
+        recognizer: sr.Recognizer (Google motoru için)
+        language: Tanıma dili
+        model_path: Yerel model klasörü / whisper model boyutu
+
+    Returns:
+        SpeechEngine nesnesi (hiçbiri kullanılamazsa None)
+    """
+    if name == 'auto':
+        candidates = ['vosk', 'whisper', 'google']
+    elif name in ENGINES:
+        candidates = [name] if name == 'google' else [name, 'google']
+    else:
+        print(f"⚠️  Bilinmeyen tanıma motoru: {name}, Google kullanılacak")
+        candidates = ['google']
+
+    for candidate in candidates:
+        try:
+            if candidate == 'google':
+                if recognizer is None:
+                    continue
+                engine = GoogleSpeechEngine(recognizer, language)
+            else:
+                engine = ENGINES[candidate](language, model_path)
+                # Sadece yeni yüklenen model ısıtılır (her BAŞLAT'ta tam tanıma turu yapılmaz)
+                if engine.model_loaded:
+                    engine.warm_up()
+            print(f"✅ Tanıma motoru: {engine.name}{' (çevrimdışı)' if engine.offline else ''}")
+            return engine
+        except Exception as e:
+            if name != 'auto':
+                print(f"⚠️  {candidate} motoru başlatılamadı: {e}")
+
+    return None
@@ -6,7 +6,18 @@ Sesli yazma için mikrofon dinleme ve metin dönüştürme.
 import time
 from typing import Optional
 import threading
-import pyperclip  # Clipboard için
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+from config import Config
+from recognition_pool import RecognitionPool
+from speech_engines import SpeechEngine, create_speech_engine
+from incremental_typer import IncrementalTyper
+from voice_activity import VoiceActivityDetector
+from device_cache import get_device_cache
+from text_injector import HAS_KEYBOARD, TextInjector
+from audio_capture import AudioSubscription, get_capture_service
 
 # Ses tanıma için
 try:
@@ -17,13 +28,6 @@ except ImportError:
     print("⚠️  speech_recognition yüklü değil. Sesli yazma çalışmayacak.")
     print("   Yüklemek için: pip install SpeechRecognition pyaudio")
 
-# Klavye girdisi için
-try:
-    import pyautogui
-    HAS_KEYBOARD = True
-except ImportError:
-    HAS_KEYBOARD = False
-
 # Windows API (cursor pozisyon kontrolü için)
 try:
     import win32gui
@@ -41,19 +45,24 @@ class SpeechToText:
     Mikrofon ile ses kaydı alır ve metne çevirir.
     """
     
-    def __init__(self, language: str = 'tr-TR', microphone_index: Optional[int] = None):
+    def __init__(self,
+                 language: str = 'tr-TR',
+                 microphone_index: Optional[int] = None,
+                 engine: Optional[str] = None):
         """
         SpeechToText sınıfını başlatır.
         
         Args:
             language: Tanıma dili (tr-TR: Türkçe, en-US: İngilizce)
             microphone_index: Mikrofon device index (None = varsayılan, 0,1,2... = belirli mikrofon)
+            engine: Tanıma motoru ('google', 'vosk', 'whisper', 'auto'; None = Config.SPEECH_ENGINE)
         """
         self.language = language
         self.microphone_index = microphone_index
         self.is_listening = False
         self.recognizer = None
         self.microphone = None
+        self.engine: Optional[SpeechEngine] = None
         
         # Sürekli dinleme için
         self.continuous_listening = False
@@ -61,6 +70,12 @@ class SpeechToText:
         self.stop_continuous = threading.Event()
         self.writing_enabled = False  # YAZMA MODU (açık/kapalı toggle)
         
+        # Tanıma havuzu (sürekli dinleme başlayınca oluşturulur)
+        self.recognition_pool = None
+        
+        # Tek yazma thread'i: tüm yapıştırma / tuş işlemleri buradan sırayla geçer
+        self.injector = TextInjector()
+        
         print("="*60)
         print("🎤 SPEECH-TO-TEXT BAŞLATILIYOR...")
         print("="*60)
@@ -72,9 +87,9 @@ class SpeechToText:
                 self.recognizer = sr.Recognizer()
                 print("✅ Recognizer oluşturuldu")
                 
-                # Mikrofon cihazını listele
+                # Mikrofon cihazını listele (önbellekten - cihazlar tekrar açılmaz)
                 try:
-                    mic_list = sr.Microphone.list_microphone_names()
+                    mic_list = [name for _, name in self.get_microphone_list()]
                     print(f"\n🎤 Bulunan mikrofonlar ({len(mic_list)} adet):")
                     for i, name in enumerate(mic_list):
                         if microphone_index is not None and i == microphone_index:
@@ -114,6 +129,14 @@ class SpeechToText:
                 print(f"   Phrase eşiği: {self.recognizer.phrase_threshold}s (HEMEN BAŞLA)")
                 print(f"   Non-speaking: {self.recognizer.non_speaking_duration}s (HIZLI BİTİR)")
                 
+                # Tanıma motoru (yerel modeller bir kere yüklenip sıcak tutulur)
+                self.engine = create_speech_engine(
+                    engine if engine is not None else Config.SPEECH_ENGINE,
+                    recognizer=self.recognizer,
+                    language=language,
+                    model_path=Config.SPEECH_MODEL_PATH
+                )
+                
                 print("\n✅ MİKROFON HAZIR!")
                 print("="*60)
             except Exception as e:
@@ -129,9 +152,14 @@ class SpeechToText:
             print("="*60)
     
     @staticmethod
-    def get_microphone_list():
+    def get_microphone_list(refresh: bool = False):
         """
         Mevcut mikrofon cihazlarının listesini döndürür.
+        Liste süreç başına bir kere okunur; refresh=True ise yeniden listelenir
+        (cihaz değiştiyse önbellekteki eski kayıtlar silinir).
+        
+        Args:
+            refresh: True ise cihazları yeniden listele
         
         Returns:
             List[tuple]: [(index, name), ...] formatında mikrofon listesi
@@ -139,12 +167,8 @@ class SpeechToText:
         if not HAS_SPEECH:
             return []
         
-        try:
-            mic_list = sr.Microphone.list_microphone_names()
-            return [(i, name) for i, name in enumerate(mic_list)]
-        except Exception as e:
-            print(f"❌ Mikrofon listesi alınamadı: {e}")
-            return []
+        devices = get_device_cache().devices(refresh=refresh)
+        return [(device['index'], device['name']) for device in devices]
     
     @staticmethod
     def is_cursor_in_text_field() -> bool:
@@ -201,13 +225,15 @@ class SpeechToText:
             return False
     
     @staticmethod
-    def detect_working_microphone(test_duration: float = 1.0):
+    def detect_working_microphone(test_duration: float = 1.0, use_cache: bool = True):
         """
         Çalışan mikrofonu otomatik tespit eder.
-        Her mikrofonu sırayla test edip ses alan ilkini döndürür.
+        Önbellekte son çalıştığı bilinen mikrofon takılıysa test etmeden onu döndürür;
+        aksi halde her mikrofonu sırayla test edip ses alan ilkini döndürür.
         
         Args:
             test_duration: Her mikrofon için test süresi (saniye)
+            use_cache: False ise önbelleği yok say, hepsini yeniden test et
             
         Returns:
             int or None: Çalışan mikrofonun index'i veya None
@@ -216,55 +242,71 @@ class SpeechToText:
             print("❌ speech_recognition yüklü değil!")
             return None
         
+        cache = get_device_cache()
+        
         print("="*60)
         print("🔍 OTOMATİK MİKROFON TESPİTİ")
         print("="*60)
         
-        mic_list = SpeechToText.get_microphone_list()
+        mic_list = SpeechToText.get_microphone_list(refresh=True)
         
         if not mic_list:
             print("❌ Mikrofon bulunamadı!")
             return None
         
+        last_good = cache.last_working_index()
+        if use_cache and last_good is not None:
+            print(f"⚡ Önbellek: son çalışan mikrofon [{last_good}] (test atlandı)")
+            print("="*60)
+            return last_good
+        
+        # Son çalışan mikrofonu önce dene
+        if last_good is not None:
+            mic_list.sort(key=lambda item: item[0] != last_good)
+        
         print(f"\n📋 {len(mic_list)} mikrofon test edilecek...")
         print(f"⏱️ Her test süresi: {test_duration} saniye\n")
         
-        recognizer = sr.Recognizer()
-        recognizer.energy_threshold = 300  # Hassas
-        recognizer.dynamic_energy_threshold = False  # Test için statik
-        
         for idx, name in mic_list:
+            subscription = None
             try:
                 print(f"🔍 Test ediliyor: [{idx}] {name}")
                 
-                # Bu mikrofonu aç
-                mic = sr.Microphone(device_index=idx)
+                # Paylaşılan kayıt akışı (dikte bu mikrofonu kullanıyorsa tekrar açılmaz)
+                service = get_capture_service(idx)
+                subscription = service.subscribe()
                 
-                with mic as source:
-                    # Ortam gürültüsünü ölç
-                    recognizer.adjust_for_ambient_noise(source, duration=0.3)
-                    energy_before = recognizer.energy_threshold
-                    
-                    print(f"   Enerji eşiği: {energy_before}")
-                    print(f"   Dinleniyor... ({test_duration}s)")
+                # Gürültü tabanı ilk çerçevelerden öğrenilir, konuşma VAD ile aranır
+                vad = SpeechToText._create_vad(service.sample_rate, service.sample_width)
+                print(f"   Dinleniyor... ({test_duration}s)")
+                
+                deadline = time.time() + test_duration
+                while time.time() < deadline and not (vad.triggered or vad.segments_emitted):
+                    chunk = subscription.read()
+                    if chunk is None and not service.running:
+                        break
+                    if chunk is not None:
+                        vad.process(chunk)
+                
+                if vad.triggered or vad.segments_emitted:
+                    # Ses algılandı!
+                    print(f"   ✅ SES ALGILANDI! (seviye {service.level():.0f})")
+                    print(f"   ✅ ÇALIŞAN MİKROFON BULUNDU!")
+                    print("="*60)
                     
-                    try:
-                        # Kısa süre dinle (timeout ile)
-                        audio = recognizer.listen(source, timeout=test_duration, phrase_time_limit=test_duration)
-                        
-                        # Ses algılandı!
-                        audio_size = len(audio.frame_data)
-                        print(f"   ✅ SES ALGILANDI! ({audio_size} byte)")
-                        print(f"   ✅ ÇALIŞAN MİKROFON BULUNDU!")
-                        print("="*60)
-                        
-                        return idx
-                        
-                    except sr.WaitTimeoutError:
-                        print(f"   ⏱️ Timeout - Ses yok")
+                    cache.set_calibration(idx, noise_floor=vad.noise_floor)
+                    cache.mark(idx, True)
+                    return idx
+                
+                print(f"   ⏱️ Timeout - Ses yok")
+                cache.mark(idx, False)
                         
             except Exception as e:
                 print(f"   ❌ Hata: {e}")
+                cache.mark(idx, False)
+            finally:
+                if subscription:
+                    subscription.close()
             
             print()  # Boş satır
         
@@ -285,7 +327,8 @@ class SpeechToText:
         Returns:
             True: Sesli yazma kullanılabilir
         """
-        return HAS_SPEECH and self.recognizer is not None and self.microphone is not None
+        return (HAS_SPEECH and self.recognizer is not None and self.microphone is not None
+                and self.engine is not None)
     
     def listen_once(self, timeout: int = 5) -> Optional[str]:
         """
@@ -307,49 +350,78 @@ class SpeechToText:
             print(f"   📢 ŞİMDİ KONUŞUN! (Max {timeout} saniye)")
             print("="*60)
             
-            with self.microphone as source:
-                # Ortam gürültüsüne göre ayarla
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.3)
-                
-                # Eşiği sınırla
-                if self.recognizer.energy_threshold > 800:
-                    self.recognizer.energy_threshold = 800
-                
-                print(f"� Dinleniyor...")
-                
-                # Ses kaydı al
-                audio = self.recognizer.listen(
-                    source, 
-                    timeout=timeout, 
-                    phrase_time_limit=5  # 10 yerine 5 - daha hızlı
-                )
+            service = get_capture_service(self.microphone_index)
+            subscription = service.subscribe()
+            try:
+                print(f"👂 Dinleniyor...")
                 
-                print("✅ Ses alındı, işleniyor...")
+                # Ses kaydı al (gürültü tabanı önbellekten - her seferinde ölçülmez)
+                segment = self._capture_phrase(subscription, timeout=timeout, phrase_time_limit=5)
+            finally:
+                subscription.close()
             
-            # Google Speech Recognition ile metne çevir
-            text = self.recognizer.recognize_google(audio, language=self.language)
+            if segment is None:
+                print("⏱️  Timeout - ses algılanmadı")
+                print("="*60)
+                return None
+            
+            print("✅ Ses alındı, işleniyor...")
+            
+            # Seçili motor ile metne çevir
+            text = self.engine.recognize(sr.AudioData(segment, service.sample_rate, service.sample_width))
+            
+            if not text:
+                print("❌ Ses anlaşılamadı - daha net konuş")
+                print("="*60)
+                return None
             
             print(f"✅ Tanındı: '{text}'")
             print("="*60)
             return text
             
-        except sr.WaitTimeoutError:
-            print("⏱️  Timeout - ses algılanmadı")
-            print("="*60)
-            return None
-        except sr.UnknownValueError:
-            print("❌ Ses anlaşılamadı - daha net konuş")
-            print("="*60)
-            return None
-        except sr.RequestError as e:
-            print(f"❌ Google API hatası: {e}")
-            print("="*60)
-            return None
         except Exception as e:
             print(f"❌ Hata: {e}")
             print("="*60)
             return None
     
+    def _capture_phrase(self,
+                        subscription: AudioSubscription,
+                        timeout: float,
+                        phrase_time_limit: float) -> Optional[bytes]:
+        """
+        Abonelikten tek bir konuşma bölümü yakalar.
+        
+        Args:
+            subscription: Kayıt aboneliği
+            timeout: Konuşma başlamazsa vazgeçme süresi (saniye)
+            phrase_time_limit: Maksimum cümle uzunluğu (saniye)
+            
+        Returns:
+            PCM bölümü veya None (timeout)
+        """
+        service = subscription.service
+        cache = get_device_cache()
+        calibration = cache.calibration(self.microphone_index) or {}
+        vad = self._create_vad(service.sample_rate, service.sample_width,
+                               noise_floor=calibration.get('noise_floor'))
+        vad.max_frames = max(vad.start_frames + 1, int(phrase_time_limit * 1000 / vad.frame_ms))
+        
+        deadline = time.time() + timeout
+        segment = None
+        while segment is None and (vad.triggered or time.time() < deadline):
+            chunk = subscription.read()
+            if chunk is None:
+                if not service.running:
+                    break
+                continue
+            segments = vad.process(chunk)
+            if segments:
+                segment = segments[0]
+        
+        if vad.noise_floor is not None:
+            cache.set_calibration(self.microphone_index, noise_floor=vad.noise_floor)
+        return segment
+    
     def start_listening(self):
         """
         Sürekli dinleme modunu başlatır (non-blocking).
@@ -401,24 +473,12 @@ class SpeechToText:
             print("="*60)
             return
         
-        try:
-            print(f"⌨️  Yazılıyor: '{text}'")
-            
-            # CLIPBOARD YÖNTEMI: Çok daha hızlı!
-            pyperclip.copy(text)
-            pyautogui.hotkey('ctrl', 'v')
-            
-            # HER ZAMAN sonuna boşluk ekle
-            pyautogui.press('space')
-            
-            # Otomatik Enter
-            if auto_enter:
-                pyautogui.press('enter')
-            
+        print(f"⌨️  Yazılıyor: '{text}'")
+        
+        # Yazma thread'i: clipboard saklanır, metin + boşluk tek Ctrl+V ile yapıştırılır
+        self.injector.submit(text, auto_enter=auto_enter)
+        if self.injector.flush():
             print("✅ Yazıldı!")
-                
-        except Exception as e:
-            print(f"❌ Yazma hatası: {e}")
     
     def dictate_mode(self, auto_enter: bool = False):
         """
@@ -496,9 +556,28 @@ class SpeechToText:
         self.writing_enabled = auto_write  # Config'den al
         self.stop_continuous.clear()
         
+        # Akış modu: motor destekliyorsa kelimeler konuşulurken yazılır
+        streaming = getattr(Config, 'SPEECH_STREAMING', False)
+        if streaming and not self.engine.supports_streaming:
+            print(f"⚠️  {self.engine.name} motoru akış tanımayı desteklemiyor, cümle modu kullanılacak")
+            streaming = False
+        
+        if streaming:
+            target = self._streaming_listening_loop
+        else:
+            # Sabit boyutlu tanıma havuzu (ses başına thread yerine)
+            self.recognition_pool = RecognitionPool(
+                recognize=self._recognize_audio,
+                deliver=lambda text: self._write_text(text, auto_enter),
+                workers=getattr(Config, 'SPEECH_WORKERS', 2),
+                max_queue=getattr(Config, 'SPEECH_QUEUE_SIZE', 4),
+                max_age=getattr(Config, 'SPEECH_MAX_AUDIO_AGE', 5.0)
+            )
+            target = self._continuous_listening_loop
+        
         # Arka planda sürekli dinleme thread'i başlat
         self.continuous_thread = threading.Thread(
-            target=self._continuous_listening_loop,
+            target=target,
             args=(auto_enter,),
             daemon=True
         )
@@ -542,13 +621,19 @@ class SpeechToText:
         if self.continuous_thread and self.continuous_thread.is_alive():
             self.continuous_thread.join(timeout=2.0)
         
-        # Auto-enter aktifse ENTER bas
+        # Tanıma havuzunu durdur (bekleyen sesler atılır)
+        if self.recognition_pool:
+            stats = self.recognition_pool.get_stats()
+            self.recognition_pool.stop()
+            self.recognition_pool = None
+            print(f"📊 Tanıma: {stats['completed']} tamam, {stats['dropped']} atıldı, "
+                  f"ort. gecikme {stats['avg_latency']:.2f}s")
+        
+        # Auto-enter aktifse ENTER bas (kuyruktaki metinden sonra)
         if auto_enter and HAS_KEYBOARD:
-            try:
-                pyautogui.press('enter')
-                print("✅ Enter tuşuna basıldı")
-            except Exception as e:
-                print(f"⚠️  Enter basılamadı: {e}")
+            self.injector.press_enter()
+            print("✅ Enter tuşuna basıldı")
+        self.injector.flush()
         
         print("✅ SÜREKLI DİNLEME DURDU")
         print("="*60)
@@ -556,50 +641,44 @@ class SpeechToText:
     def _continuous_listening_loop(self, auto_enter: bool):
         """
         Sürekli dinleme döngüsü (arka plan thread'inde çalışır).
-        TAMAMEN NON-BLOCKING: Mikrofonu açmadan kapatmadan sürekli dinler.
+        Mikrofon parçaları VAD'den geçer; sadece konuşma bölümleri (pre-roll ile)
+        tanıma havuzuna gönderilir. Okuma bloklar, döngü boşa dönmez.
         
         Args:
             auto_enter: Her cümleden sonra ENTER tuşuna bassın mı?
         """
-        source = None
+        subscription = None
+        vad = None
         try:
-            # Mikrofonu aç (tek seferlik)
-            source = self.microphone.__enter__()
-            
-            print("🎧 Ortam gürültüsü ayarlanıyor...")
-            self.recognizer.adjust_for_ambient_noise(source, duration=0.3)
+            # Paylaşılan kayıt akışına abone ol (mikrofon zaten açıksa tekrar açılmaz)
+            service = get_capture_service(self.microphone_index)
+            subscription = service.subscribe()
             
-            # Eşiği çok yüksek olmasını engelle
-            if self.recognizer.energy_threshold > 800:
-                self.recognizer.energy_threshold = 800
-                print(f"⚠️  Eşik çok yüksek! 800'e düşürüldü")
+            # Konuşma algılayıcı (gürültü tabanı önbellekten, yoksa ilk çerçevelerden öğrenilir)
+            cache = get_device_cache()
+            calibration = cache.calibration(self.microphone_index) or {}
+            vad = self._create_vad(service.sample_rate, service.sample_width,
+                                   noise_floor=calibration.get('noise_floor'))
             
-            print(f"✅ Ayarlanmış enerji eşiği: {self.recognizer.energy_threshold}")
+            print(f"✅ Konuşma algılama: {vad.mode.upper()} "
+                  f"(pre-roll {vad.pre_roll_frames * vad.frame_ms} ms)")
             print("🎤 DİNLEME BAŞLADI - Konuşmaya başlayabilirsiniz!")
             print()
             
             while not self.stop_continuous.is_set():
                 try:
-                    # Hızlı tepki için kısa timeout
-                    timeout_duration = 0.3  # 0.3 saniye - responsive
+                    # Halka tampondan kopyasız görünüm (yeni ses yoksa kısa süre bekler)
+                    chunk = subscription.read()
+                    if chunk is None:
+                        continue
                     
-                    # Timeout ile dinle
-                    audio = self.recognizer.listen(source, timeout=timeout_duration, phrase_time_limit=6)
-                    
-                    # Ses algılandı - İŞLE (yazma moduna bakılmaksızın)
-                    if not self.stop_continuous.is_set():
-                        # Thread'de işle - ana döngüyü bloklamaz
-                        process_thread = threading.Thread(
-                            target=self._process_audio,
-                            args=(audio, auto_enter),
-                            daemon=True
-                        )
-                        process_thread.start()
-                    # Yazma kapalıysa sesi görmezden gel (kaynak tasarrufu)
+                    # Tamamlanan konuşma bölümlerini tanıma havuzuna gönder (ana döngüyü bloklamaz)
+                    # Kuyruk doluysa en eski ses atılır, metin konuşma sırasıyla yazılır
+                    for segment in vad.process(chunk):
+                        if not self.stop_continuous.is_set():
+                            self.recognition_pool.submit(
+                                sr.AudioData(segment, service.sample_rate, service.sample_width))
                 
-                except sr.WaitTimeoutError:
-                    # Timeout - sadece devam et (çok sık olur, normal)
-                    continue
                 except Exception as e:
                     if not self.stop_continuous.is_set():
                         print(f"⚠️  Dinleme hatası: {e}")
@@ -608,57 +687,140 @@ class SpeechToText:
         except Exception as e:
             print(f"❌ Sürekli dinleme hatası: {e}")
         finally:
-            # Mikrofonu kapat (temizlik)
-            if source:
-                try:
-                    self.microphone.__exit__(None, None, None)
-                except:
-                    pass
+            # Aboneliği kapat (son abone ise mikrofon kapanır)
+            if subscription:
+                subscription.close()
+            if vad:
+                print(f"📊 VAD: {vad.frames_voiced}/{vad.frames_total} sesli çerçeve, "
+                      f"{vad.segments_emitted} bölüm")
+                # Öğrenilen gürültü tabanını ve cihaz durumunu sonraki açılış için sakla
+                if vad.noise_floor is not None:
+                    cache.set_calibration(self.microphone_index, noise_floor=vad.noise_floor)
+                if vad.segments_emitted:
+                    cache.mark(self.microphone_index, True)
             print("🔴 Sürekli dinleme döngüsü sonlandı")
     
-    def _process_audio(self, audio, auto_enter: bool):
+    @staticmethod
+    def _create_vad(sample_rate: int,
+                    sample_width: int,
+                    noise_floor: Optional[float] = None) -> VoiceActivityDetector:
         """
-        Ses verisini metne çevirir ve yazar.
-        UYARI: Bu fonksiyon ayrı thread'de çalışır, bloklanabilir.
-        NOT: Sadece writing_enabled=True ise yazar!
+        Config ayarlarıyla konuşma algılayıcı oluşturur.
         
         Args:
-            audio: Ses verisi
-            auto_enter: Yazdıktan sonra ENTER tuşuna bassın mı?
+            sample_rate: Mikrofon örnekleme hızı
+            sample_width: Örnek genişliği (byte)
+            noise_floor: Önbellekteki gürültü tabanı (None = ölçülür)
+            
+        Returns:
+            VoiceActivityDetector nesnesi
+        """
+        return VoiceActivityDetector(
+            sample_rate,
+            sample_width,
+            aggressiveness=Config.SPEECH_VAD_AGGRESSIVENESS,
+            pre_roll=Config.SPEECH_VAD_PRE_ROLL,
+            hangover=Config.SPEECH_VAD_HANGOVER,
+            max_segment=Config.SPEECH_MAX_PHRASE,
+            noise_floor=noise_floor
+        )
+    
+    def _streaming_listening_loop(self, auto_enter: bool):
         """
+        Akış dinleme döngüsü (arka plan thread'inde çalışır).
+        Mikrofon parçaları doğrudan tanıyıcıya verilir; kararlı kelimeler
+        cümle bitmeden yazılır, düzeltmeler minimum Backspace ile yapılır.
+        
+        Args:
+            auto_enter: Her cümleden sonra ENTER tuşuna bassın mı?
+        """
+        subscription = None
+        typer = IncrementalTyper(backspace=self.injector.backspace, insert=self.injector.insert)
         try:
-            # Google Speech Recognition ile metne çevir (bu bloklanabilir ama ayrı thread'deyiz)
-            text = self.recognizer.recognize_google(audio, language=self.language)
+            # Paylaşılan kayıt akışına abone ol
+            service = get_capture_service(self.microphone_index)
+            subscription = service.subscribe()
+            stream = self.engine.create_stream(service.sample_rate)
             
-            if text:
-                # SADECE YAZMA MODU AÇIKSA YAZ
-                if self.writing_enabled:
-                    # Metni yaz (MAKSIMUM HIZLI - Clipboard kullan)
-                    if HAS_KEYBOARD:
-                        try:
-                            # CLIPBOARD YÖNTEMI: Çok daha hızlı!
-                            # 1. Metni clipboard'a kopyala
-                            pyperclip.copy(text)
-                            # 2. Ctrl+V ile yapıştır (anında)
-                            pyautogui.hotkey('ctrl', 'v')
-                            
-                            # HER ZAMAN sonuna boşluk ekle (kelimeler bitişik olmasın)
-                            pyautogui.press('space')
-                            
-                            # Auto-enter aktifse ENTER da ekle
-                            if auto_enter:
-                                pyautogui.press('enter')
-                        except Exception as e:
-                            print(f"❌ Yazma hatası: {e}")
-                # Yazma kapalıysa sessizce atla (print yok - performans için)
-        
-        except sr.UnknownValueError:
-            # Ses anlaşılamadı - sessizce devam et (çok yaygın)
-            pass
-        except sr.RequestError as e:
-            print(f"❌ Google API hatası: {e}")
+            print(f"🎤 AKIŞ DİNLEME BAŞLADI ({self.engine.name}) - Konuşmaya başlayabilirsiniz!")
+            print()
+            
+            while not self.stop_continuous.is_set():
+                chunk = subscription.read()
+                if chunk is None:
+                    continue
+                text, final = stream.accept(chunk)
+                
+                # Yazma kapalıysa sonuçları at, yarım cümleyi takip etme
+                if not self.writing_enabled or not HAS_KEYBOARD:
+                    typer.reset()
+                    continue
+                
+                if text or final:
+                    typer.update(text, final=final)
+                    if final and text and auto_enter:
+                        self.injector.press_enter()
+            
+            # Kalan metni tamamla
+            if self.writing_enabled and HAS_KEYBOARD:
+                typer.update(stream.finish(), final=True)
+        
         except Exception as e:
-            print(f"❌ İşleme hatası: {e}")
+            print(f"❌ Akış dinleme hatası: {e}")
+        finally:
+            if subscription:
+                subscription.close()
+            print(f"🔴 Akış dinleme döngüsü sonlandı "
+                  f"({typer.inserted_chars} karakter, {typer.backspace_count} düzeltme)")
+    
+    def _recognize_audio(self, audio) -> Optional[str]:
+        """
+        Ses verisini metne çevirir.
+        UYARI: Tanıma havuzunun işçi thread'inde çalışır, bloklanabilir.
+        
+        Args:
+            audio: Ses verisi
+            
+        Returns:
+            Tanınan metin veya None
+        """
+        # Seçili motor ile metne çevir (anlaşılamayan ses → None)
+        return self.engine.recognize(audio)
+    
+    def _write_text(self, text: str, auto_enter: bool):
+        """
+        Tanınan metni yazma kuyruğuna ekler (tanıma havuzu tarafından konuşma sırasıyla çağrılır).
+        NOT: Sadece writing_enabled=True ise yazar!
+        
+        Args:
+            text: Tanınan metin
+            auto_enter: Yazdıktan sonra ENTER tuşuna bassın mı?
+        """
+        # SADECE YAZMA MODU AÇIKSA YAZ
+        if not self.writing_enabled or not HAS_KEYBOARD:
+            return  # Yazma kapalıysa sessizce atla (print yok - performans için)
+        
+        # Kuyrukta biriken cümleler tek yapıştırmada birleşir, boşluk/enter metne eklenir
+        self.injector.submit(text, auto_enter=auto_enter)
+    
+    def get_input_level(self) -> float:
+        """
+        Mikrofon giriş seviyesi (seviye göstergesi için, akış açık değilse 0).
+        
+        Returns:
+            RMS değeri (0 - 32768)
+        """
+        return get_capture_service(self.microphone_index).level()
+    
+    def get_recognition_stats(self) -> Optional[dict]:
+        """
+        Tanıma havuzu istatistikleri (kuyruk derinliği, gecikme, atılan ses sayısı).
+        
+        Returns:
+            İstatistik sözlüğü veya None (sürekli dinleme kapalıysa)
+        """
+        pool = self.recognition_pool
+        return pool.get_stats() if pool else None
     
     def is_continuous_active(self) -> bool:
         """
@@ -677,4 +839,13 @@ class SpeechToText:
             self.stop_continuous_listening(auto_enter=False)
         
         self.stop_listening()
+        
+        # Yazma kuyruğunu boşalt ve thread'i kapat
+        self.injector.stop()
+        
+        if self.engine:
+            self.engine.close()
+        
+        # Oturumda öğrenilen gürültü tabanını kaydet
+        get_device_cache().flush()
         print("🔴 Speech-to-Text kapatıldı")
@@ -0,0 +1,94 @@
+"""
+Telemetry Modülü
+Görüntüsüz (headless) çalışmada performans ve durum kayıtları.
+
+Her frame'in ölçümü bellekte toplanır; belirli aralıklarla (varsayılan 1 sn)
+tek bir JSON satırı yazılır: frame sayısı, FPS, ortalama / en kötü işleme
+süresi, frame yaşı, atılan frame ve el / jest durumu. Çıktı stdout veya dosya
+olabilir; satır başına bir JSON olduğu için CI'da kolayca işlenir. '-' her zaman
+gerçek stdout'tur (sys.__stdout__): main.py görüntüsüz modda print() loglarını
+stderr'e yönlendirir, böylece stdout sadece telemetri satırlarını içerir.
+"""
+
+import json
+import sys
+import time
+from typing import Any, Dict, TextIO
+
+
+class TelemetryWriter:
+    """
+    Aralıklı JSON satırı (JSON Lines) yazıcı.
+    Sadece işleme thread'inden kullanılır.
+    """
+
+    def __init__(self, path: str = '-', interval: float = 1.0):
+        """
+        TelemetryWriter sınıfını başlatır.
+
+        Args:
+            path: '-' = stdout, aksi halde dosya yolu (üzerine yazılır)
+            interval: Kayıt aralığı (saniye)
+        """
+        self.path = path
+        self.interval = interval
+        self._stream: TextIO = sys.__stdout__ if path == '-' else open(path, 'w', encoding='utf-8')
+
+        self._start = time.perf_counter()
+        self._window_start = self._start
+        self.total_frames = 0
+        self._reset_window()
+
+    def _reset_window(self):
+        """Aralık toplamlarını sıfırlar."""
+        self._frames = 0
+        self._latency_sum = 0.0
+        self._latency_max = 0.0
+        self._age_sum = 0.0
+        self._last: Dict[str, Any] = {}
+
+    def record(self, latency_ms: float, frame_age_ms: float = 0.0, **state):
+        """
+        Bir frame'in ölçümünü ekler (aralık dolduysa satır yazar).
+
+        Args:
+            latency_ms: Frame işleme süresi
+            frame_age_ms: Frame'in işlemeye girdiğindeki yaşı
+            **state: Son durum (dropped, hands, gesture, ...) - satıra olduğu gibi yazılır
+        """
+        self.total_frames += 1
+        self._frames += 1
+        self._latency_sum += latency_ms
+        self._latency_max = max(self._latency_max, latency_ms)
+        self._age_sum += frame_age_ms
+        self._last = state
+
+        if time.perf_counter() - self._window_start >= self.interval:
+            self.flush()
+
+    def flush(self):
+        """Biriken aralığı yazar (aralıkta frame yoksa bir şey yapmaz)."""
+        if not self._frames:
+            return
+        now = time.perf_counter()
+        elapsed = now - self._window_start
+        line = {
+            't': round(now - self._start, 3),
+            'frames': self.total_frames,
+            'fps': round(self._frames / elapsed, 1) if elapsed > 0 else 0.0,
+            'latency_ms': round(self._latency_sum / self._frames, 2),
+            'latency_max_ms': round(self._latency_max, 2),
+            'frame_age_ms': round(self._age_sum / self._frames, 1),
+        }
+        line.update(self._last)
+        self._stream.write(json.dumps(line, ensure_ascii=False) + '\n')
+        self._stream.flush()
+
+        self._window_start = now
+        self._reset_window()
+
+    def close(self):
+        """Kalan aralığı yazar ve dosyayı kapatır (stdout kapatılmaz)."""
+        self.flush()
+        if self._stream is not sys.__stdout__:
+            self._stream.close()
@@ -0,0 +1,210 @@
+"""
+Text Injector Modülü
+Tanınan metni tek bir yazma thread'i üzerinden aktif pencereye yapıştırır.
+
+- Tüm yazma işlemleri bir kuyruktan sırayla yapılır (tanıma thread'leri yarışmaz).
+- Kuyrukta biriken ardışık cümleler tek bir Ctrl+V ile yapıştırılır.
+- Boşluk yapıştırılan metne eklenir (ayrı tuş basımı yok); Enter grup sonunda bir kez basılır.
+- Kullanıcının clipboard içeriği yapıştırmadan önce saklanır ve sonra geri yüklenir.
+"""
+
+import queue
+import threading
+import time
+from typing import List, Optional
+
+try:
+    import pyperclip
+    HAS_CLIPBOARD = True
+except ImportError:
+    HAS_CLIPBOARD = False
+
+try:
+    import pyautogui
+    HAS_KEYBOARD = True
+except Exception:
+    HAS_KEYBOARD = False
+
+
+class TextInjector:
+    """
+    Kuyruk beslemeli metin yazma thread'i.
+    İşlemler: ('text', metin, enter), ('insert', metin), ('backspace', adet), ('enter',)
+    """
+
+    def __init__(self, restore_delay: float = 0.05):
+        """
+        TextInjector sınıfını başlatır ve yazma thread'ini çalıştırır.
+
+        Args:
+            restore_delay: Yapıştırdıktan sonra clipboard geri yüklenmeden önceki bekleme
+                           (hedef uygulama Ctrl+V'yi işleyip clipboard'u okuyabilsin)
+        """
+        self.restore_delay = restore_delay
+        self._queue = queue.Queue()
+        self._running = True
+        self._last_pasted = None
+
+        # İstatistik
+        self.pastes = 0
+        self.items = 0
+
+        self._thread = threading.Thread(target=self._run, name="text-injector", daemon=True)
+        self._thread.start()
+
+    # ==================== KUYRUK ====================
+
+    def submit(self, text: str, auto_enter: bool = False):
+        """
+        Cümle yazar (sonuna boşluk eklenir).
+
+        Args:
+            text: Yazılacak metin
+            auto_enter: Sonrasında Enter basılsın mı?
+        """
+        if text:
+            self._queue.put(('text', text, auto_enter))
+
+    def insert(self, text: str):
+        """Metni olduğu gibi yazar (boşluk eklenmez)."""
+        if text:
+            self._queue.put(('insert', text))
+
+    def backspace(self, count: int):
+        """count kez Backspace basar (sırası korunur)."""
+        if count > 0:
+            self._queue.put(('backspace', count))
+
+    def press_enter(self):
+        """Enter basar (sırası korunur)."""
+        self._queue.put(('enter',))
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """
+        Kuyruktaki tüm işlemler bitene kadar bekler.
+
+        Args:
+            timeout: Maksimum bekleme (saniye)
+
+        Returns:
+            True: Kuyruk boşaldı
+        """
+        done = threading.Event()
+        self._queue.put(('sync', done))
+        return done.wait(timeout)
+
+    def stop(self, timeout: float = 2.0):
+        """Kuyruğu boşaltıp thread'i durdurur."""
+        if not self._running:
+            return
+        self.flush(timeout)
+        self._running = False
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+
+    # ==================== YAZMA THREAD'İ ====================
+
+    def _run(self):
+        """Kuyruktan işlem al, birikenleri birleştir, yaz."""
+        while True:
+            op = self._queue.get()
+            if op is None:
+                return
+
+            # Kuyrukta bekleyen diğer işlemleri de al (toplu yazma)
+            ops = [op]
+            while True:
+                try:
+                    extra = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is None:
+                    self._queue.put(None)
+                    break
+                ops.append(extra)
+
+            try:
+                self._execute(ops)
+            except Exception as e:
+                print(f"❌ Yazma hatası: {e}")
+
+    def _execute(self, ops: List[tuple]):
+        """İşlem listesini birleştirerek uygular."""
+        saved_clipboard = self._save_clipboard(ops)
+        pending = ''
+        pasted_any = False
+
+        for op in ops:
+            kind = op[0]
+
+            if kind == 'text':
+                pending += op[1] + ' '
+                self.items += 1
+                if op[2]:
+                    self._paste(pending)
+                    pasted_any = pasted_any or bool(pending)
+                    pending = ''
+                    self._press('enter')
+            elif kind == 'insert':
+                pending += op[1]
+                self.items += 1
+            else:
+                # Backspace / Enter / senkron: önce biriken metin yazılmalı (sıra korunur)
+                if pending:
+                    self._paste(pending)
+                    pasted_any = True
+                    pending = ''
+                if kind == 'backspace':
+                    self._press('backspace', op[1])
+                elif kind == 'enter':
+                    self._press('enter')
+                elif kind == 'sync':
+                    if pasted_any:
+                        self._restore_clipboard(saved_clipboard)
+                        pasted_any = False
+                    op[1].set()
+
+        if pending:
+            self._paste(pending)
+            pasted_any = True
+        if pasted_any:
+            self._restore_clipboard(saved_clipboard)
+
+    def _paste(self, text: str):
+        """Metni clipboard üzerinden yapıştırır (Türkçe karakterler için güvenli)."""
+        if not text:
+            return
+        if not (HAS_CLIPBOARD and HAS_KEYBOARD):
+            print(f"   Metin (manuel): '{text}'")
+            return
+        pyperclip.copy(text)
+        pyautogui.hotkey('ctrl', 'v')
+        self._last_pasted = text
+        self.pastes += 1
+
+    @staticmethod
+    def _press(key: str, count: int = 1):
+        """Tuşa count kez basar."""
+        if HAS_KEYBOARD:
+            pyautogui.press(key, presses=count, interval=0)
+
+    @staticmethod
+    def _save_clipboard(ops: List[tuple]) -> Optional[str]:
+        """Yapıştırma yapılacaksa kullanıcının clipboard içeriğini saklar."""
+        if not HAS_CLIPBOARD or not any(op[0] in ('text', 'insert') for op in ops):
+            return None
+        try:
+            return pyperclip.paste()
+        except Exception:
+            return None
+
+    def _restore_clipboard(self, saved: Optional[str]):
+        """Clipboard'u geri yükler (bu arada kullanıcı başka bir şey kopyaladıysa dokunmaz)."""
+        if saved is None or not HAS_CLIPBOARD:
+            return
+        time.sleep(self.restore_delay)
+        try:
+            if pyperclip.paste() == self._last_pasted:
+                pyperclip.copy(saved)
+        except Exception:
+            pass
@@ -0,0 +1,209 @@
+"""
+Voice Activity Modülü
+Ham PCM çerçeveleri üzerinde konuşma algılama (VAD).
+
+Mikrofon parçaları sabit uzunluklu çerçevelere (10/20/30 ms) bölünür ve her
+çerçeve sesli / sessiz olarak sınıflandırılır:
+- webrtcvad yüklüyse ve örnekleme hızı destekleniyorsa WebRTC VAD
+- aksi halde enerji (RMS) + sıfır geçiş oranı (ZCR) modeli, uyarlanır gürültü tabanı ile
+
+Sadece konuşma içeren bölümler, başlangıcından önceki kısa bir ön kayıt
+(pre-roll) ile birlikte dışarı verilir; sessizlik ve gürültü tanıyıcıya gitmez.
+"""
+
+from collections import deque
+from typing import List, Optional
+
+import numpy as np
+
+# WebRTC VAD (isteğe bağlı)
+try:
+    import webrtcvad
+    HAS_WEBRTCVAD = True
+except ImportError:
+    HAS_WEBRTCVAD = False
+
+# WebRTC VAD'nin kabul ettiği örnekleme hızları
+WEBRTC_RATES = (8000, 16000, 32000, 48000)
+
+
+class VoiceActivityDetector:
+    """
+    Çerçeve tabanlı konuşma bölütleyici.
+    process() ile PCM parçaları verilir, tamamlanan konuşma bölümleri döner.
+    """
+
+    def __init__(self,
+                 sample_rate: int,
+                 sample_width: int = 2,
+                 frame_ms: int = 30,
+                 aggressiveness: int = 2,
+                 pre_roll: float = 0.3,
+                 hangover: float = 0.5,
+                 min_speech: float = 0.15,
+                 max_segment: float = 6.0,
+                 noise_floor: Optional[float] = None):
+        """
+        VoiceActivityDetector sınıfını başlatır.
+
+        Args:
+            sample_rate: Örnekleme hızı (Hz)
+            sample_width: Örnek genişliği (byte, sadece 2 = int16 desteklenir)
+            frame_ms: Çerçeve uzunluğu (10, 20 veya 30 ms)
+            aggressiveness: 0-3 arası (yüksek = gürültüyü daha çok reddeder)
+            pre_roll: Konuşma başlangıcından önce eklenecek ses (saniye)
+            hangover: Konuşma bitti sayılması için gereken sessizlik (saniye)
+            min_speech: Konuşma başladı sayılması için gereken ardışık sesli süre (saniye)
+            max_segment: Bir bölümün maksimum uzunluğu (saniye, aşılırsa kesilir)
+            noise_floor: Başlangıç gürültü tabanı (RMS; None = ilk çerçevelerden öğrenilir)
+        """
+        if sample_width != 2:
+            raise ValueError("Sadece 16-bit PCM destekleniyor")
+
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame_bytes = sample_rate * frame_ms // 1000 * sample_width
+        self.aggressiveness = max(0, min(3, int(aggressiveness)))
+
+        # Çerçeve sayıları
+        self.pre_roll_frames = max(1, int(pre_roll * 1000 / frame_ms))
+        self.hangover_frames = max(1, int(hangover * 1000 / frame_ms))
+        self.start_frames = max(1, int(min_speech * 1000 / frame_ms))
+        self.max_frames = max(self.start_frames + 1, int(max_segment * 1000 / frame_ms))
+
+        # Sınıflandırıcı
+        self.vad = None
+        if HAS_WEBRTCVAD and sample_rate in WEBRTC_RATES and frame_ms in (10, 20, 30):
+            self.vad = webrtcvad.Vad(self.aggressiveness)
+        self.mode = 'webrtc' if self.vad is not None else 'energy'
+
+        # Enerji modeli: gürültü tabanı (yavaş uyarlanan RMS) ve eşik oranı
+        self.noise_floor = noise_floor
+        self.energy_ratio = 2.0 + 0.75 * self.aggressiveness
+        self.min_rms = 100.0
+        self.max_zcr = 0.35  # Beyaz gürültünün ZCR'si ~0.5, konuşmanınki genelde daha düşük
+
+        # Parça birleştirme artığı
+        self._remainder = b''
+
+        # Pre-roll halka tamponu: başlangıcı tetikleyen start_frames sesli çerçeve de
+        # burada durur, pre-roll bunların öncesinde tam kalsın diye ikisinin toplamı
+        self._ring = deque(maxlen=self.pre_roll_frames + self.start_frames)
+
+        # Durum makinesi
+        self.triggered = False
+        self._voiced_run = 0
+        self._silent_run = 0
+        self._segment: List[bytes] = []
+
+        # İstatistik
+        self.frames_total = 0
+        self.frames_voiced = 0
+        self.segments_emitted = 0
+
+    def is_speech(self, frame: bytes) -> bool:
+        """
+        Tek bir çerçeveyi sınıflandırır.
+
+        Args:
+            frame: frame_bytes uzunluğunda int16 PCM
+
+        Returns:
+            True: Konuşma
+        """
+        if self.vad is not None:
+            return self.vad.is_speech(frame, self.sample_rate)
+
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples * samples)))
+        signs = np.signbit(samples)
+        zcr = float(np.count_nonzero(signs[1:] != signs[:-1])) / max(1, len(samples) - 1)
+
+        if self.noise_floor is None:
+            self.noise_floor = max(rms, 1.0)
+
+        voiced = rms > max(self.min_rms, self.noise_floor * self.energy_ratio) and zcr < self.max_zcr
+
+        # Gürültü tabanı sadece sessiz çerçevelerle güncellenir
+        if not voiced:
+            self.noise_floor = self.noise_floor * 0.95 + rms * 0.05
+        return voiced
+
+    def process(self, pcm: bytes) -> List[bytes]:
+        """
+        PCM parçasını işler.
+
+        Args:
+            pcm: Herhangi uzunlukta int16 PCM parça (bytes veya int16 numpy görünümü)
+
+        Returns:
+            Bu parçada tamamlanan konuşma bölümleri (pre-roll dahil)
+        """
+        pcm = memoryview(pcm).cast('B')
+        data = self._remainder + pcm if self._remainder else pcm
+        size = self.frame_bytes
+        usable = len(data) - len(data) % size
+        self._remainder = bytes(data[usable:])
+
+        segments = []
+        view = memoryview(data)
+        for offset in range(0, usable, size):
+            segment = self._process_frame(bytes(view[offset:offset + size]))
+            if segment:
+                segments.append(segment)
+        return segments
+
+    def flush(self) -> Optional[bytes]:
+        """
+        Devam eden bölümü sonlandırır (dinleme durdurulurken).
+
+        Returns:
+            Yarım kalan konuşma bölümü veya None
+        """
+        segment = self._emit() if self.triggered else None
+        self.reset()
+        return segment
+
+    def reset(self):
+        """Durum makinesini ve tamponları temizler (gürültü tabanı korunur)."""
+        self._remainder = b''
+        self._ring.clear()
+        self.triggered = False
+        self._voiced_run = 0
+        self._silent_run = 0
+        self._segment = []
+
+    def _process_frame(self, frame: bytes) -> Optional[bytes]:
+        """Tek çerçeve için durum makinesi adımı."""
+        voiced = self.is_speech(frame)
+        self.frames_total += 1
+        if voiced:
+            self.frames_voiced += 1
+
+        if not self.triggered:
+            self._ring.append(frame)
+            self._voiced_run = self._voiced_run + 1 if voiced else 0
+            if self._voiced_run >= self.start_frames:
+                # Konuşma başladı: pre-roll tamponu bölümün başı olur
+                self.triggered = True
+                self._segment = list(self._ring)
+                self._ring.clear()
+                self._silent_run = 0
+            return None
+
+        self._segment.append(frame)
+        self._silent_run = 0 if voiced else self._silent_run + 1
+
+        if self._silent_run >= self.hangover_frames or len(self._segment) >= self.max_frames:
+            return self._emit()
+        return None
+
+    def _emit(self) -> bytes:
+        """Bölümü birleştirir ve bekleme durumuna döner."""
+        segment = b''.join(self._segment)
+        self._segment = []
+        self.triggered = False
+        self._voiced_run = 0
+        self._silent_run = 0
+        self.segments_emitted += 1
+        return segment
@@ -4,7 +4,7 @@ Windows ses ve media kontrolü için API wrapper.
 """
 
 import time
-from typing import Optional
+from typing import Any, Dict, Optional
 import sys
 from pathlib import Path
 
@@ -27,7 +27,8 @@ except ImportError:
 try:
     import pyautogui
     HAS_MEDIA_CONTROL = True
-except ImportError:
+except Exception:
+    # Ekransız (DISPLAY yok) Linux'ta import sırasında hata verebilir
     HAS_MEDIA_CONTROL = False
     print("⚠️  pyautogui yüklü değil. Media kontrolü çalışmayacak.")
 
@@ -38,6 +39,9 @@ class VolumeController:
     Ses seviyesi ve mute durumu yönetimi.
     """
     
+    # Çalışırken uygulanabilen ayarlar (bkz. apply_settings)
+    SETTINGS_KEYS = ('VOLUME_STEP',)
+    
     def __init__(self):
         """VolumeController sınıfını başlatır."""
         self.volume_interface = None
@@ -125,7 +129,7 @@ class VolumeController:
         Ses seviyesini arttırır.
         
         Args:
-            step: Artış miktarı (varsayılan: Config.VOLUME_STEP)
+            step: Artış miktarı (varsayılan: güncel ses adımı)
             
         Returns:
             True: İşlem başarılı
@@ -136,9 +140,9 @@ class VolumeController:
         if current_time - self.last_volume_change < self.volume_cooldown:
             return False
         
-        # Step belirtilmemişse Config'ten oku (güncel değer)
+        # Step belirtilmemişse güncel ayarı kullan
         if step is None:
-            step = Config.VOLUME_STEP
+            step = self.volume_step
         
         current = self.get_volume()
         new_volume = min(100, current + step)
@@ -155,7 +159,7 @@ class VolumeController:
         Ses seviyesini azaltır.
         
         Args:
-            step: Azalış miktarı (varsayılan: Config.VOLUME_STEP)
+            step: Azalış miktarı (varsayılan: güncel ses adımı)
             
         Returns:
             True: İşlem başarılı
@@ -166,9 +170,9 @@ class VolumeController:
         if current_time - self.last_volume_change < self.volume_cooldown:
             return False
         
-        # Step belirtilmemişse Config'ten oku (güncel değer)
+        # Step belirtilmemişse güncel ayarı kullan
         if step is None:
-            step = Config.VOLUME_STEP
+            step = self.volume_step
         
         current = self.get_volume()
         new_volume = max(0, current - step)
@@ -180,6 +184,11 @@ class VolumeController:
         
         return False
     
+    def apply_settings(self, changes: Dict[str, Any]):
+        """Canlı ayar değişikliklerini uygular (ses adımı)."""
+        if 'VOLUME_STEP' in changes:
+            self.volume_step = int(changes['VOLUME_STEP'])
+    
     def is_muted(self) -> bool:
         """
         Sessiz modun açık olup olmadığını kontrol eder.